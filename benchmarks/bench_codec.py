@@ -0,0 +1,67 @@
+"""
+Times loading and serializing synthetic lists with every available
+codec and checks that they produce the same bytes.
+
+    python benchmarks/bench_codec.py [max_items]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+import model  # noqa: E402
+
+CATEGORIES = 50
+
+
+def make_raw(items: int) -> dict:
+    per_category = max(items // CATEGORIES, 1)
+    return {
+        "base_list": None,
+        "name": "Benchmark",
+        "structure": {
+            "categories": {
+                f"Kategorie {c}": [
+                    f"Gegenstand {i} für Kategorie {c}"
+                    for i in range(per_category)
+                ]
+                for c in range(CATEGORIES)
+            }
+        },
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    max_items = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    codecs = {"json": model.JsonCodec()}
+    if model.orjson is not None:
+        codecs["orjson"] = model.OrjsonCodec()
+    else:
+        print("orjson is not installed, only measuring json")
+    print(f"{'items':>9}{'codec':>8}{'dumps':>12}{'loads':>12}{'size':>12}")
+    items = 1000
+    while items <= max_items:
+        raw = make_raw(items)
+        outputs = set()
+        for name, codec in codecs.items():
+            data, dump_ms = timed(codec.dumps, raw)
+            _, load_ms = timed(codec.loads, data)
+            outputs.add(data)
+            print(
+                f"{items:>9}{name:>8}{dump_ms:>10.1f}ms{load_ms:>10.1f}ms"
+                f"{len(data) / 1e6:>10.2f}MB"
+            )
+        if len(outputs) != 1:
+            print("The codecs produced different output!")
+        items *= 10
+
+
+if __name__ == "__main__":
+    main()
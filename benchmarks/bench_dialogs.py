@@ -0,0 +1,55 @@
+"""
+Compares how long it takes to build each dialog form by parsing its
+`.ui` file with `uic.loadUi()` and with the precompiled `Ui_*` class.
+
+    python benchmarks/bench_dialogs.py [repetitions]
+"""
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+from PyQt5.QtWidgets import QApplication, QDialog  # noqa: E402
+from PyQt5.uic import loadUi  # noqa: E402
+
+UI_DIR = Path(__file__).parent.parent / "urlaubsliste/ui"
+FORMS = [
+    "preview",
+    "item_editor",
+    "editor",
+    "change_name_dialog",
+    "edit_parent_dialog",
+]
+
+
+def measure(build, repetitions: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        dialog = QDialog()
+        build(dialog)
+        dialog.deleteLater()
+    return (time.perf_counter() - start) / repetitions * 1000
+
+
+def main():
+    repetitions = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    app = QApplication(sys.argv)  # noqa: F841
+    print(f"{'form':<20}{'loadUi':>12}{'setupUi':>12}")
+    for form in FORMS:
+        ui_class = importlib.import_module(f"ui.{form}_ui").Ui_Dialog
+        loaded = measure(
+            lambda dialog: loadUi(UI_DIR / f"{form}.ui", dialog),
+            repetitions,
+        )
+        compiled = measure(
+            lambda dialog: ui_class().setupUi(dialog), repetitions
+        )
+        print(f"{form:<20}{loaded:>10.2f}ms{compiled:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Measures the memory of loading many lists that share their items, as
+child lists of a common base list do, with and without interning them.
+
+    python benchmarks/bench_intern.py [lists] [items]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+import model  # noqa: E402
+
+CATEGORIES = 20
+
+
+def make_lists(directory: Path, lists: int, items: int) -> list[Path]:
+    per_category = max(items // CATEGORIES, 1)
+    base = directory / "base.ull"
+    model.List({
+        "base_list": None,
+        "name": "Basis",
+        "structure": {
+            "categories": {
+                f"Kategorie {c}": [
+                    f"Gegenstand {i} für Kategorie {c}"
+                    for i in range(per_category)
+                ]
+                for c in range(CATEGORIES)
+            }
+        },
+    }).save(base)
+    paths = []
+    for n in range(lists):
+        path = directory / f"liste{n}.ull"
+        model.List({
+            "base_list": str(base),
+            "name": f"Liste {n}",
+            "merge_strategy": model.MERGE_APPEND,
+            "structure": {
+                "categories": {
+                    f"Kategorie {c}": [
+                        f"Gegenstand {i} für Kategorie {c}"
+                        for i in range(0, per_category, 2)
+                    ]
+                    for c in range(CATEGORIES)
+                }
+            },
+        }).save(path)
+        paths.append(path)
+    return paths
+
+
+def measure(paths: list[Path]) -> tuple[float, float]:
+    model.resolution_cache.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    loaded = [model.List.from_file(path) for path in paths]
+    merged = [list_.get_raw_extended_with_parent() for list_ in loaded]
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del loaded, merged
+    return elapsed * 1000, memory / 1e6
+
+
+def main():
+    lists = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    with tempfile.TemporaryDirectory() as directory:
+        paths = make_lists(Path(directory), lists, items)
+        print(f"{lists} lists with {items} items each")
+        print(f"{'mode':>10}{'load+merge':>14}{'memory':>12}")
+        interned = measure(paths)
+        intern_categories = model._intern_categories
+        model._intern_categories = lambda raw: raw
+        try:
+            plain = measure(paths)
+        finally:
+            model._intern_categories = intern_categories
+        for mode, (elapsed, memory) in (
+            ("plain", plain), ("interned", interned)
+        ):
+            print(f"{mode:>10}{elapsed:>12.0f}ms{memory:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Compares opening a big JSON list eagerly and lazily: the time until the
+row count of the table is known, the time to read one category and the
+peak memory of the process. Every mode runs in a fresh process.
+
+    python benchmarks/bench_lazy_load.py [size_mb]
+"""
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+import model  # noqa: E402
+
+CATEGORIES = 50
+
+
+def make_file(path: Path, size_mb: int):
+    item = "Gegenstand {} für die Kategorie {}"
+    per_category = size_mb * 1_000_000 // CATEGORIES // len(item)
+    raw = {
+        "base_list": None,
+        "name": "Benchmark",
+        "structure": {
+            "categories": {
+                f"Kategorie {c}": [
+                    item.format(i, c) for i in range(per_category)
+                ]
+                for c in range(CATEGORIES)
+            }
+        },
+    }
+    path.write_bytes(model.codec.dumps(raw))
+
+
+def measure(path: str, lazy: bool):
+    if not lazy:
+        model.LAZY_LOAD_SIZE = float("inf")
+    start = time.perf_counter()
+    list_ = model.List.from_file(path)
+    rows = max(
+        list_.get_amount_of_items_for_category(category)
+        for category in list_.categories
+    )
+    opened = time.perf_counter()
+    list_.get_items_for_category(list_.categories[0])
+    first = time.perf_counter()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(
+        f"{'lazy' if lazy else 'eager':>6}{rows:>10}"
+        f"{(opened - start) * 1000:>10.0f}ms"
+        f"{(first - opened) * 1000:>10.1f}ms{peak:>10.0f}MB"
+    )
+
+
+def main():
+    if len(sys.argv) > 3:
+        make_file(Path(sys.argv[1]), int(sys.argv[3]))
+        return
+    if len(sys.argv) > 2:
+        measure(sys.argv[1], sys.argv[2] == "lazy")
+        return
+    size_mb = sys.argv[1] if len(sys.argv) > 1 else "200"
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "big.ull"
+        # The peak memory carries over to child processes on Linux, so
+        # building the list mustn't happen in this one
+        subprocess.run(
+            [sys.executable, __file__, str(path), "make", size_mb],
+            check=True,
+        )
+        print(f"{path.stat().st_size / 1e6:.0f}MB")
+        print(f"{'mode':>6}{'rows':>10}{'open':>12}{'category':>12}"
+              f"{'peak RSS':>12}")
+        for mode in ("eager", "lazy"):
+            subprocess.run(
+                [sys.executable, __file__, str(path), mode], check=True
+            )
+
+
+if __name__ == "__main__":
+    main()
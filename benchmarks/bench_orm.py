@@ -0,0 +1,85 @@
+"""
+Counts the ORM wrapper objects allocated by the model accesses of one
+`Window.refreshUi()` call, once with the old behaviour of rebuilding the
+ORM on every access and once with the cached ORM.
+
+    python benchmarks/bench_orm.py [categories] [items_per_category]
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+import model  # noqa: E402
+from model import AnnotatedORM, List  # noqa: E402
+
+
+def make_list(categories: int, items: int) -> List:
+    list_ = List.new("Benchmark")
+    for c in range(categories):
+        list_.add_category(f"Kategorie {c}")
+        list_.get_items_for_category(f"Kategorie {c}").extend(
+            f"Item {c}/{i}" for i in range(items)
+        )
+    return list_
+
+
+def refresh(list_: List):
+    """The model accesses done by `Window.refreshUi()`."""
+    list_.orm.name
+    len(list_.categories)
+    for category in list_.categories:
+        list_.get_amount_of_items_for_category(category)
+    list_.categories
+    for category in list_.categories:
+        for _ in list_.get_items_for_category(category):
+            pass
+
+
+def count_allocations(list_: List) -> int:
+    allocations = 0
+    init_orm = model.AnnotatedORM.__init__
+    init_structure = model.AnnotatedStructure.__init__
+
+    def counting(init):
+        def wrapper(self, *args):
+            nonlocal allocations
+            allocations += 1
+            init(self, *args)
+        return wrapper
+
+    model.AnnotatedORM.__init__ = counting(init_orm)
+    model.AnnotatedStructure.__init__ = counting(init_structure)
+    try:
+        refresh(list_)
+    finally:
+        model.AnnotatedORM.__init__ = init_orm
+        model.AnnotatedStructure.__init__ = init_structure
+    return allocations
+
+
+def measure(list_: List) -> str:
+    allocations = count_allocations(list_)
+    seconds = min(timeit.repeat(lambda: refresh(list_), number=10, repeat=5))
+    return f"{allocations} allocations, {seconds / 10 * 1000:.3f} ms"
+
+
+class UncachedList(List):
+    @property
+    def orm(self) -> AnnotatedORM:
+        return AnnotatedORM(self.raw)
+
+
+def main():
+    categories = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    cached = make_list(categories, items)
+    uncached = UncachedList(cached.raw)
+    print(f"{categories} categories, {items} items each")
+    print(f"rebuilt ORM: {measure(uncached)}")
+    print(f"cached ORM:  {measure(cached)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Times building the search index of a synthetic list, queries of various
+lengths and updating the index after a single edit or removal.
+
+    python benchmarks/bench_search.py [items]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+from search import SearchIndex  # noqa: E402
+
+CATEGORIES = 20
+WORDS = (
+    "Zahnbürste", "Sonnencreme", "Handtuch", "Badehose", "Ladekabel",
+    "Reisepass", "Socken", "Wanderschuhe", "Taschenlampe", "Kamera",
+)
+QUERIES = ("ch", "12", "bürste", "zahnbürste 12", "schuhe 4", "xyz")
+
+
+def timed(function, *args, repeat=1):
+    """The result and the fastest time in ms of `repeat` calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    random.seed(0)
+    per_category = items // CATEGORIES
+    categories = {
+        f"Kategorie {c}": [
+            f"{random.choice(WORDS)} {random.randrange(10_000)}"
+            for _ in range(per_category)
+        ]
+        for c in range(CATEGORIES)
+    }
+    index, build_ms = timed(SearchIndex, categories)
+    print(f"build {len(index)} items: {build_ms:.0f}ms")
+    for query in QUERIES:
+        matches, search_ms = timed(index.search, query, repeat=5)
+        found = sum(len(rows) for rows in matches.values())
+        print(f"{query!r:>16}: {search_ms:6.2f}ms, {found} matches")
+    items = categories["Kategorie 0"]
+    items[per_category // 2] = "Geänderter Gegenstand"
+    _, edit_ms = timed(index.sync, categories, ["Kategorie 0"])
+    print(f"sync after one edit: {edit_ms:.2f}ms")
+    # The rows after a removed item move, the worst case is the first one
+    del items[0]
+    _, remove_ms = timed(index.sync, categories, ["Kategorie 0"])
+    print(f"sync after removing the first item: {remove_ms:.2f}ms")
+    _, unchanged_ms = timed(index.sync, categories)
+    print(f"sync without changes: {unchanged_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
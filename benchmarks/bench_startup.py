@@ -0,0 +1,52 @@
+"""
+Reports the import time of the modules loaded by the entry point, like
+`python -X importtime`, without starting the application.
+
+    python benchmarks/bench_startup.py [number_of_modules]
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent.parent / "urlaubsliste"
+LOAD_ENTRY_POINT = f"""
+import importlib.util, sys
+sys.path.insert(0, {str(PACKAGE_DIR)!r})
+spec = importlib.util.spec_from_file_location(
+    "entry_point", {str(PACKAGE_DIR / "__main__.py")!r}
+)
+spec.loader.exec_module(importlib.util.module_from_spec(spec))
+"""
+
+
+def main():
+    shown = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOAD_ENTRY_POINT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | name"
+    top_level = {}
+    imported = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, _, cumulative_us, name = line.replace(":", "|", 1).split("|")
+        imported.add(name.strip())
+        # Nested imports are indented further
+        if not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative_us)
+    total = sum(top_level.values())
+    print(f"{'module':<30}{'cumulative':>12}")
+    for name, cumulative_us in sorted(
+        top_level.items(), key=lambda item: item[1], reverse=True
+    )[:shown]:
+        print(f"{name:<30}{cumulative_us / 1000:>10.1f}ms")
+    print(f"{'total':<30}{total / 1000:>10.1f}ms")
+    print("reportlab imported:", "reportlab" in imported)
+
+
+if __name__ == "__main__":
+    main()
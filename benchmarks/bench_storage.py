@@ -0,0 +1,110 @@
+"""
+Compares the JSON file and SQLite storage backends on a big list with two
+big base lists: opening it (until the row count is known and until all
+items are read), saving it after editing a single item, and merging it
+with its base lists without any cached base lists.
+
+    python benchmarks/bench_storage.py [items_per_list]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "urlaubsliste"))
+
+import model  # noqa: E402
+
+CATEGORIES = 50
+REPEAT = 5
+FORMATS = {"json": ".ull", "sqlite": ".ulldb"}
+
+
+def make_lists(directory: Path, suffix: str, items: int) -> Path:
+    per_category = max(items // CATEGORIES, 1)
+    base_list = None
+    for level in range(3):
+        path = directory / f"liste{level}{suffix}"
+        model.List({
+            "base_list": base_list,
+            "name": f"Liste {level}",
+            "structure": {
+                "categories": {
+                    f"Kategorie {c}": [
+                        f"Gegenstand {i} der Ebene {level} für {c}"
+                        for i in range(per_category)
+                    ]
+                    for c in range(CATEGORIES)
+                }
+            },
+        }).save(path)
+        base_list = str(path)
+    return path
+
+
+def forget_base_lists():
+    model.resolution_cache.clear()
+    for backend in model.BACKENDS:
+        if hasattr(backend, "_resolved"):
+            backend._resolved = None
+
+
+def best(function) -> float:
+    """Fastest of `REPEAT` runs in ms."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def measure(path: Path) -> dict[str, float]:
+    def open_list():
+        list_ = model.List.from_file(path)
+        for category in list_.categories:
+            list_.get_amount_of_items_for_category(category)
+
+    def read_all():
+        model.List.from_file(path).materialize()
+
+    edited = model.List.from_file(path)
+    edited.materialize()
+    items = edited.get_items_for_category("Kategorie 7")
+    counter = iter(range(REPEAT))
+
+    def save_edit():
+        items[len(items) // 2] = f"Geändert {next(counter)}"
+        edited.save(path)
+
+    def merge():
+        forget_base_lists()
+        model.List.from_file(path).get_raw_extended_with_parent()
+
+    # Copies the base lists into the database, as the first save does
+    edited.save(path)
+    return {
+        "open": best(open_list),
+        "read all": best(read_all),
+        "edit+save": best(save_edit),
+        "merge": best(merge),
+    }
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"3 lists with {items} items each, best of {REPEAT}")
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, suffix in FORMATS.items():
+            path = make_lists(Path(directory), suffix, items)
+            results[name] = measure(path)
+    print(f"{'':>10}" + "".join(f"{name:>12}" for name in FORMATS))
+    for operation in results["json"]:
+        print(f"{operation:>10}" + "".join(
+            f"{results[name][operation]:>10.1f}ms" for name in FORMATS
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Regenerate the `*_ui.py` modules from the Qt Designer `.ui` files in
+`urlaubsliste/ui`.
+
+    python compile_ui.py          # Write the modules
+    python compile_ui.py --check  # Fail if a module is out of date
+"""
+import io
+import os
+import sys
+from pathlib import Path
+
+from PyQt5.uic import compileUi
+
+UI_DIR = Path("urlaubsliste/ui")
+
+
+def compile_form(ui_file: Path) -> str:
+    output = io.StringIO()
+    compileUi(ui_file.as_posix(), output)
+    return output.getvalue()
+
+
+def normalize(code: str) -> list[str]:
+    # The generator version doesn't matter for drift
+    return [
+        line for line in code.splitlines()
+        if not line.startswith("# Created by: PyQt5 UI code generator")
+    ]
+
+
+def main() -> int:
+    os.chdir(Path(__file__).parent)
+    check = "--check" in sys.argv[1:]
+    outdated = []
+    for ui_file in sorted(UI_DIR.glob("*.ui")):
+        py_file = ui_file.with_name(f"{ui_file.stem}_ui.py")
+        code = compile_form(ui_file)
+        if check:
+            if (
+                not py_file.exists()
+                or normalize(py_file.read_text("utf-8")) != normalize(code)
+            ):
+                outdated.append(py_file)
+        else:
+            py_file.write_text(code, "utf-8")
+    for py_file in outdated:
+        print(f"{py_file} is out of date, run compile_ui.py", file=sys.stderr)
+    return 1 if outdated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,24 @@
 import sys
 import os
+import sqlite3
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 import webbrowser
-from tempfile import NamedTemporaryFile
-from copy import deepcopy, copy
+from copy import copy, deepcopy
 
 from PyQt5.QtWidgets import (
     QApplication,
     QDialog,
     QMainWindow,
     QFileDialog,
-    QTableWidgetItem,
     QErrorMessage,
     QListWidgetItem,
     QMessageBox,
     QHeaderView,
+    QProgressDialog,
+    QTableWidgetItem,
 )
-from PyQt5.QtGui import QFont, QIcon, QCloseEvent
-from PyQt5.uic import loadUi
+from PyQt5.QtGui import QFont, QCloseEvent
 from PyQt5.QtCore import (
     Qt,
     QTranslator,
@@ -25,41 +26,115 @@ from PyQt5.QtCore import (
     QEvent,
     QObject,
     QTimer,
+    QThreadPool,
 )
 
-from window_ui import Ui_MainWindow
+from ui.change_name_dialog_ui import Ui_Dialog as Ui_ChangeNameDialog
+from ui.edit_parent_dialog_ui import Ui_Dialog as Ui_ManageBaseList
+from ui.editor_ui import Ui_Dialog as Ui_EditorDialog
+from ui.item_editor_ui import Ui_Dialog as Ui_ItemEditor
+from ui.open_by_content_ui import Ui_Dialog as Ui_OpenByContentDialog
+from ui.preview_ui import Ui_Dialog as Ui_PreviewDialog
+from ui.window_ui import Ui_MainWindow
+
+from history import (
+    AddCategory,
+    ChangeBaseList,
+    Command,
+    CommandGroup,
+    History,
+    RemoveCategory,
+    RenameCategory,
+    RenameList,
+    ReorderCategories,
+    ReplaceItems,
+)
+from icon_cache import get_icon
+from journal import (
+    Journal,
+    discard,
+    find_recoverable,
+    journal_header,
+    replay,
+    set_aside,
+)
+from model import (
+    BaseListCycleError,
+    BaseListDepthError,
+    BaseListError,
+    List,
+    MergeStrategyError,
+    read_header,
+    resolution_cache,
+)
+from report_worker import ReportWorker
 
-from model import List
-from utils import create_report
+if TYPE_CHECKING:
+    # Only imported when the content index is first used, the process
+    # pool it needs is slow to import
+    from content_index import Hit
+    from index_worker import IndexWorker
+from search import MIN_QUERY, SearchIndex
+from table_model import ListTableModel
+from utils import LANDSCAPE
 
 
-REFRESHING_GOING_ON = False
+# Maximum number of steps that can be undone
+UNDO_LIMIT = 500
+# Longest time in ms before an edit is written to the recovery journal
+JOURNAL_FLUSH_DELAY = 1000
 
 
 class Window(QMainWindow, Ui_MainWindow):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setWindowIcon(
-            QIcon(str(Path(__file__).parent / "icons/appicon.png"))
-        )
+        self.setWindowIcon(get_icon("appicon"))
         self.setWindowState(Qt.WindowMaximized)
         self.setupUi(self)
         self.connectSignalsSlots()
-        self.actions_ = []
-        self.undos = []
+        self.history = History(max_depth=UNDO_LIMIT, coalesce=True)
+        self.history.add_listener(self.journalCommand)
+        self.history.add_listener(self.searchCommand)
+        self.journal: Journal
+        self.journalTimer = QTimer(self)
+        self.journalTimer.setSingleShot(True)
+        self.journalTimer.setInterval(JOURNAL_FLUSH_DELAY)
+        self.journalTimer.timeout.connect(lambda: self.journal.flush())
+        self.reportWorkers: list[ReportWorker] = []
+        self.indexWorker: Optional["IndexWorker"] = None
+        self.indexCallbacks: list[Callable[[Optional[str]], None]] = []
+        # Built when the list is first searched
+        self.searchIndex: Optional[SearchIndex] = None
+        self.inheritedIndex: Optional[SearchIndex] = None
+        # The list the search index was synced with and the categories
+        # edited since, None if all have to be compared
+        self.searchedList: Optional[List] = None
+        self.searchChanged: Optional[set[str]] = None
         self.list: List
         self.saved = True
-        try:
-            self.list = List.from_file(sys.argv[1])
-        except IndexError:
-            self.new()
+        self.model = ListTableModel(history=self.history, parent=self)
+        self.model.listChanged.connect(self.listChanged)
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        if not self.recover():
+            self.journal = Journal()
+            try:
+                self.list = List.from_file(sys.argv[1])
+                self.journal.reset(self.list)
+            except IndexError:
+                self.new()
         self.title.installEventFilter(self)
         self.refreshUi()
 
     def refreshUi(self):
-        global REFRESHING_GOING_ON
-        REFRESHING_GOING_ON = True
+        self.refreshState()
+        self.model.setList(self.list)
+        if self.inheritedIndex is not None:
+            self.inheritedIndex.sync(self.inheritedCategories())
+        self.applyFilter()
 
+    def refreshState(self):
         ull_name = (
             Path(self.list.path).name if self.list.path else "Neue Liste"
         )
@@ -70,58 +145,14 @@ class Window(QMainWindow, Ui_MainWindow):
             self.setWindowFilePath(self.list.path)
         self.setWindowModified(not self.saved)
         self.title.setText(self.list.orm.name)
-        self.actionUndo.setEnabled(True if self.actions_ else False)
-        self.actionRedo.setEnabled(True if self.undos else False)
-
-        # Reset table
-        self.table.setColumnCount(0)
-        self.table.setRowCount(0)
-
-        # Define table size
-        self.table.setColumnCount(len(self.list.categories))
-        longest_category_length = 0
-        for category in self.list.categories:
-            category_length = self.list.get_amount_of_items_for_category(
-                category
-            )
-            if category_length > longest_category_length:
-                longest_category_length = category_length
-        # +2 because there should be one extra for adding new items and
-        # because the category itself isn't included in the
-        # `longest_category_length`
-        self.table.setRowCount(longest_category_length + 1)
-
-        self.table.setHorizontalHeaderLabels(self.list.categories)
-
-        # Fill by category
-        for x, category in enumerate(self.list.categories):
-            items = self.list.get_items_for_category(category)
-            # Set item fields
-            for y, item in enumerate(items):
-                tItem = QTableWidgetItem(item)
-                self.table.setItem(y, x, tItem)
-
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
-
-        REFRESHING_GOING_ON = False
-
-    def save_table_to_list(self):
-        self.actions_.append(deepcopy(self.list))
-        self.undos.clear()
-        for column, category in enumerate(self.list.categories):
-            items = []
-            for row in range(self.table.rowCount()):
-                item = self.table.item(row, column)
-                if item is None or item.text() == "":
-                    continue
-                items.append(item.text())
-            self.list.raw["structure"]["categories"][category] = items
+        self.actionUndo.setEnabled(self.history.can_undo)
+        self.actionRedo.setEnabled(self.history.can_redo)
 
     def connectSignalsSlots(self):
         self.actionBeenden.triggered.connect(self.close)
         self.actionListentitelAndern.triggered.connect(self.changeName)
         self.actionOffnen.triggered.connect(self.open)
+        self.actionOffnenNachInhalt.triggered.connect(self.openByContent)
         self.actionNeueUrlaubsliste.triggered.connect(self.new)
         self.actionListeSpeichern.triggered.connect(self.save)
         self.actionListeSpeichernUnter.triggered.connect(self.save_as)
@@ -130,62 +161,261 @@ class Window(QMainWindow, Ui_MainWindow):
         self.actionEditorOffnen.triggered.connect(self.openEditor)
         self.actionVorschau.triggered.connect(self.openPreview)
         self.actionDrucken.triggered.connect(self.printList)
+        self.actionPrintLandscape.triggered.connect(self.printListLandscape)
         self.actionUndo.triggered.connect(self.undo)
         self.actionRedo.triggered.connect(self.redo)
+        self.filterEdit.textChanged.connect(self.filterChanged)
+
+    def recover(self) -> bool:
+        """
+        Offer to restore the unsaved changes of lists that weren't closed
+        properly. Returns True if a list was restored.
+        """
+        for file in find_recoverable():
+            try:
+                list_, _ = replay(file)
+            except Exception as e:
+                # Starting must not fail because of a broken journal
+                try:
+                    kept = f" Es wurde als „{set_aside(file)}“ aufbewahrt."
+                except OSError:
+                    kept = ""
+                QMessageBox.warning(
+                    self,
+                    "Wiederherstellen fehlgeschlagen",
+                    "Nicht gespeicherte Änderungen konnten nicht "
+                    f"wiederhergestellt werden: {e}.{kept}",
+                )
+                continue
+            name = Path(list_.path).name if list_.path else list_.name
+            message = (
+                f"Die Liste „{name}“ wurde nicht richtig geschlossen. "
+                "Möchten sie die nicht gespeicherten Änderungen "
+                "wiederherstellen?"
+            )
+            if list_.path is None and journal_header(file)["path"]:
+                message += (
+                    " Die Datei der Liste gibt es nicht mehr, sie wird als "
+                    "neue Liste wiederhergestellt."
+                )
+            response = QMessageBox.question(
+                self, "Liste wiederherstellen?", message
+            )
+            if response == QMessageBox.StandardButton.Yes:
+                self.list = list_
+                self.saved = False
+                self.journal = Journal(file=file)
+                return True
+            discard(file)
+        return False
 
-        self.table.itemChanged.connect(self.itemChanged)
+    def journalCommand(self, action: str, command: Command):
+        self.journal.append(action, command)
+        if not self.journalTimer.isActive():
+            self.journalTimer.start()
 
-    def undo(self):
-        self.undos.append(deepcopy(self.list))
+    def searchCommand(self, action: str, command: Command):
+        changed = command.changed_categories()
+        if changed is None or self.searchChanged is None:
+            self.searchChanged = None
+        else:
+            self.searchChanged |= changed
+
+    def inheritedCategories(self) -> dict[str, list]:
+        """The categories of the merged base lists, empty if there are none."""
+        parent = self.list.parent
+        if parent is None:
+            return {}
         try:
-            self.list = self.actions_.pop()
-        except IndexError:  # Nothing to undo
-            pass
+            base_list = List(resolution_cache.load(parent), parent)
+            merged = base_list.get_raw_extended_with_parent()
+        except (OSError, ValueError, KeyError, BaseListError):
+            return {}
+        return merged["structure"]["categories"]
+
+    def applyFilter(self) -> dict[str, list[int]]:
+        """
+        Highlight the items containing the text of the search box, hide the
+        categories without any and tell how many inherited items match.
+        Returns the matching rows by category.
+        """
+        query = self.filterEdit.text()
+        categories = self.list.categories
+        if len(query) < MIN_QUERY:
+            self.model.setMatches({})
+            for column in range(len(categories)):
+                self.table.setColumnHidden(column, False)
+            if query:
+                self.statusbar.showMessage(
+                    f"Mindestens {MIN_QUERY} Zeichen eingeben"
+                )
+            else:
+                self.statusbar.clearMessage()
+            return {}
+        if self.searchIndex is None:
+            self.searchIndex = SearchIndex()
+            self.inheritedIndex = SearchIndex(self.inheritedCategories())
+        if self.list is not self.searchedList:
+            self.searchChanged = None
+        self.searchIndex.sync(
+            self.list.orm.structure.categories, changed=self.searchChanged
+        )
+        self.searchedList = self.list
+        self.searchChanged = set()
+        matches = self.searchIndex.search(query)
+        self.model.setMatches(matches)
+        for column, category in enumerate(categories):
+            self.table.setColumnHidden(column, category not in matches)
+        found = sum(len(rows) for rows in matches.values())
+        inherited = self.inheritedIndex.count(query)
+        self.statusbar.showMessage(
+            f"{found} Treffer in der Liste, {inherited} in den Basislisten"
+        )
+        return matches
+
+    def filterChanged(self):
+        matches = self.applyFilter()
+        if matches:
+            category, rows = next(iter(matches.items()))
+            self.table.scrollTo(
+                self.model.index(rows[0], self.list.categories.index(category))
+            )
+
+    def undo(self):
+        self.history.undo(self.list)
         self.refreshUi()
 
     def redo(self):
-        self.actions_.append(deepcopy(self.list))
-        try:
-            self.list = self.undos.pop()
-        except IndexError:  # Nothing to redo
-            pass
+        self.history.redo(self.list)
         self.refreshUi()
 
     def openPreview(self, print=False):
-        dialog = PreviewDialog(self, print)
+        try:
+            dialog = PreviewDialog(self, print)
+        except BaseListError as e:
+            self.baseListErrorMessage(e)
+            return
         dialog.exec()
 
     def printList(self):
-        tempfile = NamedTemporaryFile("wb", suffix=".pdf", delete=False)
+        self.printMergedList()
+
+    def printListLandscape(self):
+        self.printMergedList(LANDSCAPE)
+
+    def printMergedList(self, orientation: Optional[str] = None):
         try:
-            create_report(
-                List(self.list.get_raw_extended_with_parent()),
-                tempfile,
-            )
-        except ValueError:
+            merged_list = List(self.list.get_raw_extended_with_parent())
+        except BaseListError as e:
+            self.baseListErrorMessage(e)
+            return
+        self.startReport(merged_list, orientation)
+
+    def startReport(self, list_: List, orientation: Optional[str] = None):
+        """
+        Create the PDF of `list_` in the background and open it when it's
+        done. See `report.plan_layout()` for `orientation`.
+        """
+        if not list_.categories:
             error_box = QErrorMessage(self)
             error_box.showMessage(
                 "Es gibt nichts zu drucken, die Liste ist leer."
             )
             return
-        tempfile.close()
-        webbrowser.WindowsDefault().open(tempfile.name)
+        # The worker gets its own copy, the shown list may change meanwhile
+        worker = ReportWorker(List(deepcopy(list_.raw)), orientation)
+        progress = QProgressDialog(
+            "Druckansicht wird erstellt...", "Abbrechen", 0, 0, self
+        )
+        progress.setWindowTitle("Drucken")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(worker.cancel)
+        worker.signals.progress.connect(
+            lambda page: progress.setLabelText(
+                f"Seite {page} wird erstellt..."
+            )
+        )
+
+        def done():
+            progress.reset()
+            self.reportWorkers.remove(worker)
+
+        def finished(path: str):
+            done()
+            webbrowser.WindowsDefault().open(path)
+
+        def failed(message: str):
+            done()
+            error_box = QErrorMessage(self)
+            error_box.showMessage(
+                f"Die Druckansicht konnte nicht erstellt werden: {message}"
+            )
 
-    def itemChanged(self, item: QTableWidgetItem):
-        if REFRESHING_GOING_ON:
+        worker.signals.finished.connect(finished)
+        worker.signals.failed.connect(failed)
+        worker.signals.cancelled.connect(done)
+        # Python must keep a reference to the worker until it's done
+        self.reportWorkers.append(worker)
+        QThreadPool.globalInstance().start(worker)
+
+    def updateContentIndex(self, callback: Callable[[Optional[str]], None]):
+        """
+        Update the content index in the background, unless that's already
+        happening. `callback` gets None once it's done, or the error.
+        """
+        self.indexCallbacks.append(callback)
+        if self.indexWorker is not None:
             return
-        self.update_list()
+        from index_worker import IndexWorker
 
-    def update_list(self):
+        worker = IndexWorker()
+
+        def done(message: Optional[str] = None):
+            self.indexWorker = None
+            callbacks, self.indexCallbacks = self.indexCallbacks, []
+            for callback in callbacks:
+                callback(message)
+
+        worker.signals.finished.connect(lambda updated: done())
+        worker.signals.failed.connect(done)
+        # Python must keep a reference to the worker until it's done
+        self.indexWorker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def baseListErrorMessage(self, error: BaseListError):
+        error_box = QErrorMessage(self)
+        if isinstance(error, BaseListCycleError):
+            error_box.showMessage(
+                "Die Basislisten verweisen im Kreis aufeinander: "
+                + " → ".join(path.name for path in error.cycle)
+            )
+        elif isinstance(error, BaseListDepthError):
+            error_box.showMessage(
+                f"Die Liste hat mehr als {error.max_depth} Basislisten."
+            )
+        elif isinstance(error, MergeStrategyError):
+            error_box.showMessage(
+                f"Unbekannte Zusammenführung {error.strategy} in der Liste "
+                f"{error.name}."
+            )
+        else:
+            error_box.showMessage(str(error))
+
+    def listChanged(self):
         self.saved = False
-        self.save_table_to_list()
-        self.refreshUi()
+        self.refreshState()
+        self.applyFilter()
 
     def openEditor(self):
         dialog = EditorDialog(self)
         if dialog.exec():
-            self.actions_.append(deepcopy(self.list))
-            self.undos.clear()
+            commands = []
+
+            def execute(command):
+                command.redo(self.list)
+                commands.append(command)
+
             list_content = [
                 dialog.list.item(x).text() for x in range(dialog.list.count())
             ]
@@ -193,11 +423,11 @@ class Window(QMainWindow, Ui_MainWindow):
             for oldName, newName in dialog.renames.items():
                 if newName not in list_content:
                     continue
-                try:
-                    self.list.rename_category(oldName, newName)
-                except KeyError:
+                if oldName in self.list.categories:
+                    execute(RenameCategory(oldName, newName))
+                else:
                     # Renamed item was just created in the editor session
-                    self.list.add_category(newName)
+                    execute(AddCategory(newName))
                 list_content.remove(newName)
                 try:
                     categories_to_be_checked.remove(oldName)
@@ -206,11 +436,11 @@ class Window(QMainWindow, Ui_MainWindow):
                     pass
             for category in copy(list_content):
                 if category not in self.list.categories:
-                    self.list.add_category(category)
+                    execute(AddCategory(category))
                     list_content.remove(category)
             for category in copy(categories_to_be_checked):
                 if category not in list_content:
-                    self.list.remove_category(category)
+                    execute(RemoveCategory(category))
                     categories_to_be_checked.remove(category)
             # Now, bring the categories in right order
             list_content = [
@@ -219,9 +449,9 @@ class Window(QMainWindow, Ui_MainWindow):
             saved_categories = self.list.categories
             if list_content != saved_categories:
                 # Only reorder if there's a need to
-                for key in list_content:
-                    self.list.orm.structure.categories[
-                        key] = self.list.orm.structure.categories.pop(key)
+                execute(ReorderCategories(list_content))
+            if commands:
+                self.history.record(CommandGroup(commands))
             self.saved = False
             self.refreshUi()
 
@@ -251,17 +481,20 @@ class Window(QMainWindow, Ui_MainWindow):
             response = self.wannaSaveMessageBox()
             if response == QMessageBox.StandardButton.Save:
                 self.save()
+                if not self.saved:
+                    event.ignore()
+                    return
             elif response == QMessageBox.StandardButton.Discard:
                 pass  # Just close
             else:
                 event.ignore()
+                return
+        self.journal.close()
 
     def changeName(self):
         dialog = ChangeNameDialog(self)
         if dialog.exec():
-            self.actions_.append(deepcopy(self.list))
-            self.undos.clear()
-            self.list.change_name(dialog.lineEdit.text())
+            self.history.execute(self.list, RenameList(dialog.lineEdit.text()))
             self.saved = False
         self.refreshUi()
 
@@ -272,39 +505,60 @@ class Window(QMainWindow, Ui_MainWindow):
         else:
             fileDialog.setFileMode(QFileDialog.FileMode.ExistingFile)
         fileDialog.setNameFilter(
-            "Urlaubsliste (*.ull);;JSON in ULL Format (*.json)"
+            "Urlaubsliste (*.ull);;Urlaubsliste Binär (*.ullb);;"
+            "Urlaubsliste Datenbank (*.ulldb);;"
+            "JSON in ULL Format (*.json)"
         )
         fileDialog.setDirectory(
             os.path.expanduser("~/Documents/Urlaubslisten")
         )
         fileDialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
         if fileDialog.exec():
-            if not self.saved:
-                response = self.wannaSaveMessageBox()
-                if response == QMessageBox.StandardButton.Save:
-                    self.save()
-                elif response == QMessageBox.StandardButton.Discard:
-                    pass  # Just go on
-                else:
-                    return
-            file = fileDialog.selectedFiles()[0]
-            self.list = List.from_file(file)
-            self.saved = True
+            if not self.openFile(fileDialog.selectedFiles()[0]):
+                return
         else:
             if force:
                 kwargs["force_action"]()
         self.refreshUi()
 
+    def openFile(self, file: str) -> bool:
+        """Open the list `file`, False if the user cancelled."""
+        if not self.saved:
+            response = self.wannaSaveMessageBox()
+            if response == QMessageBox.StandardButton.Save:
+                self.save()
+                if not self.saved:
+                    return False
+            elif response == QMessageBox.StandardButton.Discard:
+                pass  # Just go on
+            else:
+                return False
+        self.list = List.from_file(file)
+        self.journal.reset(self.list)
+        self.history.clear()
+        self.saved = True
+        return True
+
+    def openByContent(self):
+        dialog = OpenByContentDialog(self)
+        if dialog.exec() and (path := dialog.selectedPath()) is not None:
+            if self.openFile(path):
+                self.refreshUi()
+
     def new(self):
         if not self.saved:
             response = self.wannaSaveMessageBox()
             if response == QMessageBox.StandardButton.Save:
                 self.save()
+                if not self.saved:
+                    return
             elif response == QMessageBox.StandardButton.Discard:
                 pass  # Just go on...
             else:
                 return
         self.list = List.new("Neue Liste")
+        self.journal.reset(self.list)
+        self.history.clear()
         self.saved = True
         self.refreshUi()
 
@@ -319,57 +573,60 @@ class Window(QMainWindow, Ui_MainWindow):
                 self,
                 caption="Liste Speichern",
                 directory=os.path.expanduser("~/Documents/Urlaubslisten"),
-                filter="Urlaubsliste (*.ull);;JSON (*.json)",
+                filter=(
+                    "Urlaubsliste (*.ull);;Urlaubsliste Binär (*.ullb);;"
+                    "Urlaubsliste Datenbank (*.ulldb);;"
+                    "JSON (*.json)"
+                ),
             )
         if not path:
             return
-        self.save_table_to_list()
-        with open(path, mode="w") as fp:
-            fp.write(self.list.serialize())
+        try:
+            self.list.save(
+                path, backup=self.actionSicherungskopie.isChecked()
+            )
+        except (OSError, sqlite3.Error) as e:
+            error_box = QErrorMessage(self)
+            error_box.showMessage(
+                f"Die Liste konnte nicht gespeichert werden: {e}"
+            )
+            return
         self.list.path = path
+        self.journal.reset(self.list)
         self.saved = True
         self.refreshUi()
 
     def manageBaseList(self):
         dialog = ManageBaseList(self)
-        copy = deepcopy(self.list)
-        if dialog.exec():
-            self.saved = False
-        if self.list.parent != copy.parent:
-            self.actions_.append(copy)
-            self.undos.clear()
+        dialog.exec()
         self.refreshUi()
 
+    def changeBaseList(self, path: Optional[str]):
+        """Set the base list, or remove it if `path` is None."""
+        if path is None and self.list.parent is None:
+            return
+        self.history.execute(self.list, ChangeBaseList(path))
+        self.saved = False
 
-class PreviewDialog(QDialog):
+
+class PreviewDialog(QDialog, Ui_PreviewDialog):
     def __init__(self, parent=None, print=False):
         super().__init__(parent)
-        loadUi(Path(__file__).parent / "ui/preview.ui", self)
+        self.setupUi(self)
         self.setWindowTitle("Preview")
         self.setWindowState(Qt.WindowMaximized)
-        self.setWindowIcon(
-            QIcon(str(Path(__file__).parent / "icons/appicon.png"))
-        )
+        self.setWindowIcon(get_icon("appicon"))
         self.printButton.clicked.connect(self.print)
+        self.model = ListTableModel(editable=False, parent=self)
+        self.table.setModel(self.model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Stretch)
         self.refreshUi()
         if print:
             QTimer.singleShot(0, self.print)
 
     def print(self):
-        tempfile = NamedTemporaryFile("wb", suffix=".pdf", delete=False)
-        try:
-            create_report(
-                self.list,
-                tempfile,
-            )
-        except ValueError:
-            error_box = QErrorMessage(self)
-            error_box.showMessage(
-                "Es gibt nichts zu drucken, die Liste ist leer."
-            )
-            return
-        tempfile.close()
-        webbrowser.WindowsDefault().open(tempfile.name)
+        self.parent().startReport(self.list)
         # XXX THE FOLLOWING WAS SUPPOSED TO WORK WELL, HOWEVER AT THE
         # XXX painter.drawImage() LINE THE PROG TERMINATES WITHOUT ERRORS.
         # XXX THAT's WHY WE ARE REDIRECTING TO WINDOWS DEFAULT NOW.
@@ -398,50 +655,17 @@ class PreviewDialog(QDialog):
 
     def refreshUi(self):
         self.title.setText(self.parent().title.text())
-
-        # Reset table
-        self.table.setColumnCount(0)
-        self.table.setRowCount(0)
-
         self.list = List(self.parent().list.get_raw_extended_with_parent())
+        self.model.setList(self.list)
 
-        # Define table size
-        self.table.setColumnCount(len(self.list.categories))
-        longest_category_length = 0
-        for category in self.list.categories:
-            category_length = (
-                self.list.get_amount_of_items_for_category(category)
-            )
-            if category_length > longest_category_length:
-                longest_category_length = category_length
-        # +2 because there should be one extra for adding new items and
-        # because the category itself isn't included in the
-        # `longest_category_length`
-        self.table.setRowCount(longest_category_length + 1)
-
-        self.table.setHorizontalHeaderLabels(self.list.categories)
-
-        # Fill by category
-        for x, category in enumerate(self.list.categories):
-            items = self.list.get_items_for_category(category)
-            # Set item fields
-            for y, item in enumerate(items):
-                tItem = QTableWidgetItem(item)
-                self.table.setItem(y, x, tItem)
 
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.Stretch)
-
-
-class ItemEditor(QDialog):
+class ItemEditor(QDialog, Ui_ItemEditor):
     def __init__(self, parent, category: str):
         super().__init__(parent)
         self.category = category
-        loadUi(Path(__file__).parent / "ui/item_editor.ui", self)
+        self.setupUi(self)
         self.setWindowTitle("Item Editor")
-        self.setWindowIcon(
-            QIcon(str(Path(__file__).parent / "icons/appicon.png"))
-        )
+        self.setWindowIcon(get_icon("appicon"))
         self.items = self.parent().parent().list.orm.structure.categories[
             self.category
         ]
@@ -455,14 +679,12 @@ class ItemEditor(QDialog):
                 self.list.addItem(list_item)
 
 
-class EditorDialog(QDialog):
+class EditorDialog(QDialog, Ui_EditorDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
-        loadUi(Path(__file__).parent / "ui/editor.ui", self)
+        self.setupUi(self)
         self.setWindowTitle("Editor")
-        self.setWindowIcon(
-            QIcon(str(Path(__file__).parent / "icons/appicon.png"))
-        )
+        self.setWindowIcon(get_icon("appicon"))
         self.createCategoryButton.clicked.connect(self.createCategory)
         self.list.itemChanged.connect(self.itemChanged)
         self.delCategoryButton.clicked.connect(self.deleteCategory)
@@ -500,9 +722,12 @@ class EditorDialog(QDialog):
             dialog_list_items = [
                 dialog.list.item(x).text() for x in range(dialog.list.count())
             ]
-            self.parent().list.orm.structure.categories[
-                category
-            ] = dialog_list_items
+            window = self.parent()
+            window.history.execute(
+                window.list, ReplaceItems(category, dialog_list_items)
+            )
+            window.saved = False
+            window.refreshState()
 
     def refreshUi(self):
         if self.parent().list.categories:
@@ -533,20 +758,93 @@ class EditorDialog(QDialog):
         self.renames[old_name] = new_name
 
 
-class ChangeNameDialog(QDialog):
+class ChangeNameDialog(QDialog, Ui_ChangeNameDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
-        loadUi(Path(__file__).parent / "ui/change_name_dialog.ui", self)
+        self.setupUi(self)
         self.setWindowTitle("Listenname bearbeiten")
-        self.setWindowIcon(
-            QIcon(str(Path(__file__).parent / "icons/appicon.png"))
-        )
+        self.setWindowIcon(get_icon("appicon"))
 
 
-class ManageBaseList(QDialog):
+class OpenByContentDialog(QDialog, Ui_OpenByContentDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
-        loadUi(Path(__file__).parent / "ui/edit_parent_dialog.ui", self)
+        self.setupUi(self)
+        self.setWindowTitle("Nach Inhalt öffnen")
+        self.setWindowIcon(get_icon("appicon"))
+        header = self.results.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.hits: list["Hit"] = []
+        self.indexing = True
+        from content_index import ContentIndex
+
+        try:
+            self.index: Optional[ContentIndex] = ContentIndex()
+        except (OSError, sqlite3.Error) as e:
+            self.index = None
+            self.searchEdit.setEnabled(False)
+            self.results.setEnabled(False)
+            self.statusLabel.setText(
+                f"Der Suchindex konnte nicht geöffnet werden: {e}"
+            )
+            return
+        self.searchEdit.textChanged.connect(self.search)
+        self.results.itemDoubleClicked.connect(self.accept)
+        self.finished.connect(self.closeIndex)
+        # The index of the last session is searched until it's updated
+        self.parent().updateContentIndex(self.indexUpdated)
+        self.search()
+
+    def indexUpdated(self, error: Optional[str]):
+        self.indexing = False
+        self.search()
+        if error is not None:
+            self.statusLabel.setText(
+                f"Der Suchindex konnte nicht aktualisiert werden: {error}"
+            )
+
+    def closeIndex(self):
+        self.index.close()
+        # The update may still finish after the dialog was closed
+        self.index = None
+
+    def search(self):
+        if self.index is None:
+            return
+        from content_index import RESULT_LIMIT, TRIGRAM
+
+        query = self.searchEdit.text().strip()
+        # Shorter queries would match most items and scan the whole index
+        if len(query) >= TRIGRAM:
+            self.hits = self.index.search(query)
+            status = f"{len(self.hits)} Treffer"
+            if len(self.hits) == RESULT_LIMIT:
+                status += " (nur die ersten werden angezeigt)"
+        else:
+            self.hits = []
+            status = f"Mindestens {TRIGRAM} Zeichen eingeben"
+        if self.indexing:
+            status += ", der Suchindex wird aktualisiert..."
+        self.statusLabel.setText(status)
+        self.results.setRowCount(len(self.hits))
+        for row, hit in enumerate(self.hits):
+            list_name = hit.name or Path(hit.path).name
+            for column, text in enumerate((list_name, hit.category, hit.item)):
+                item = QTableWidgetItem(text)
+                item.setToolTip(hit.path)
+                self.results.setItem(row, column, item)
+        if self.hits:
+            self.results.selectRow(0)
+
+    def selectedPath(self) -> Optional[str]:
+        row = self.results.currentRow()
+        return self.hits[row].path if 0 <= row < len(self.hits) else None
+
+
+class ManageBaseList(QDialog, Ui_ManageBaseList):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
         self.setWindowTitle("Basis Liste Wählen")
 
         self.selectListButton.clicked.connect(self.selectParentList)
@@ -554,20 +852,30 @@ class ManageBaseList(QDialog):
         self.refreshUi()
 
     def refreshUi(self):
-        self.label_2.setText(str(self.parent().list.parent))
+        parent = self.parent().list.parent
+        try:
+            name = read_header(parent)["name"] if parent else None
+        except (OSError, ValueError):
+            name = None
+        if name is None:
+            self.label_2.setText(str(parent))
+        else:
+            self.label_2.setText(f"{name} ({parent})")
 
     def selectParentList(self):
         fileDialog = QFileDialog(self)
         fileDialog.setFileMode(QFileDialog.FileMode.ExistingFile)
         fileDialog.setNameFilter(
-            "Urlaubsliste (*.ull);;JSON in ULL Format (*.json)")
+            "Urlaubsliste (*.ull);;Urlaubsliste Binär (*.ullb);;"
+            "Urlaubsliste Datenbank (*.ulldb);;"
+            "JSON in ULL Format (*.json)")
         fileDialog.setDirectory(
             os.path.expanduser("~/Documents/Urlaubslisten"))
         fileDialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
         if fileDialog.exec():
             file = fileDialog.selectedFiles()[0]
             try:
-                self.parent().list.change_baselist(file)
+                self.parent().changeBaseList(file)
             except FileNotFoundError:
                 error_box = QErrorMessage(self)
                 error_box.showMessage("Die Datei wurde nicht gefunden.")
@@ -582,7 +890,7 @@ class ManageBaseList(QDialog):
             self.refreshUi()
 
     def deleteParentList(self):
-        self.parent().list.remove_baselist()
+        self.parent().changeBaseList(None)
         self.refreshUi()
 
 
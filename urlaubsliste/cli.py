@@ -0,0 +1,255 @@
+"""
+Batch processing of list files without the GUI:
+
+    python urlaubsliste/cli.py validate LIST_OR_DIR...
+    python urlaubsliste/cli.py merge [-o DIR] LIST_OR_DIR...
+    python urlaubsliste/cli.py render [-o DIR] [--orientation O] LIST...
+    python urlaubsliste/cli.py search [-d DIR] QUERY
+
+Directories stand for the `.ull`, `.ullb` and `.ulldb` files in them,
+except the `.merged` ones that `merge` writes.
+The files are spread over worker processes; each one keeps the base
+lists it parsed in its `model.resolution_cache`, so lists sharing base
+lists only parse them once per worker. `search` finds items in the
+content index of a directory, see `content_index`. This module must not
+import PyQt5.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from content_index import (
+    INDEX_FILE,
+    LIST_DIR,
+    MERGED,
+    ContentIndex,
+    is_list_file,
+)
+from model import List
+from utils import LANDSCAPE, MERGE_STRATEGIES, PORTRAIT
+
+
+class Result:
+    """Outcome of processing one file."""
+    __slots__ = ("path", "ok", "message", "milliseconds")
+
+    def __init__(self, path: str, ok: bool, message: str,
+                 milliseconds: float):
+        self.path = path
+        self.ok = ok
+        self.message = message
+        self.milliseconds = milliseconds
+
+
+def _check(raw: dict):
+    """Raise a `ValueError` if `raw` isn't a valid list."""
+    if not isinstance(raw.get("name"), str):
+        raise ValueError("Die Liste hat keinen Namen.")
+    if raw.get("merge_strategy", MERGE_STRATEGIES[0]) not in MERGE_STRATEGIES:
+        raise ValueError(
+            f"Unbekannte Zusammenführung: {raw['merge_strategy']}"
+        )
+    categories = raw["structure"]["categories"]
+    for category, items in categories.items():
+        if not isinstance(items, list) or not all(
+            item is None or isinstance(item, str) for item in items
+        ):
+            raise ValueError(f"Ungültige Kategorie: {category}")
+
+
+def _output_path(path: Path, output: Optional[str], suffix: str) -> Path:
+    directory = Path(output) if output is not None else path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / (path.stem + suffix)
+
+
+def validate(path: Path, args: argparse.Namespace) -> str:
+    list_ = List.from_file(path)
+    _check(list_.raw)
+    merged = list_.get_raw_extended_with_parent()
+    return f"{len(merged['structure']['categories'])} Kategorien"
+
+
+def merge(path: Path, args: argparse.Namespace) -> str:
+    merged = dict(List.from_file(path).get_raw_extended_with_parent())
+    merged["base_list"] = None
+    target = _output_path(path, args.output, MERGED + path.suffix)
+    List(merged).save(target)
+    return str(target)
+
+
+def render(path: Path, args: argparse.Namespace) -> str:
+    # Only imported here, reportlab is slow to import and `validate` and
+    # `merge` don't need it
+    from report import create_report
+
+    list_ = List(List.from_file(path).get_raw_extended_with_parent())
+    target = _output_path(path, args.output, ".pdf")
+    with open(target, "wb") as fp:
+        create_report(list_, fp, orientation=args.orientation)
+    return str(target)
+
+
+COMMANDS = {"validate": validate, "merge": merge, "render": render}
+
+
+def process(path: str, args: argparse.Namespace) -> Result:
+    """Run the command of `args` on one file, in a worker process."""
+    start = time.perf_counter()
+    try:
+        message = COMMANDS[args.command](Path(path), args)
+        ok = True
+    except KeyError as e:
+        message = f"Eintrag {e} fehlt."
+        ok = False
+    except Exception as e:
+        # One broken list must not stop the others
+        message = str(e) or type(e).__name__
+        ok = False
+    return Result(path, ok, message, (time.perf_counter() - start) * 1000)
+
+
+def expand(paths: Iterable[str]) -> Iterator[str]:
+    for path in paths:
+        if os.path.isdir(path):
+            for entry in sorted(Path(path).iterdir()):
+                if is_list_file(entry.name) and entry.is_file():
+                    yield str(entry)
+        else:
+            yield path
+
+
+def run(paths: list[str], args: argparse.Namespace) -> Iterator[Result]:
+    """The results of all files, in the order they're done."""
+    if args.jobs == 1 or len(paths) == 1:
+        for path in paths:
+            yield process(path, args)
+        return
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = [executor.submit(process, path, args) for path in paths]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def write_timings(file: str, results: list[Result]):
+    with open(file, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(("path", "ok", "milliseconds", "message"))
+        for result in sorted(results, key=lambda result: result.path):
+            writer.writerow((
+                result.path,
+                int(result.ok),
+                f"{result.milliseconds:.1f}",
+                result.message,
+            ))
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="urlaubsliste",
+        description="Listen ohne Benutzeroberfläche verarbeiten.",
+    )
+    jobs = argparse.ArgumentParser(add_help=False)
+    jobs.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(),
+        help="Anzahl der Prozesse",
+    )
+    files = argparse.ArgumentParser(add_help=False, parents=[jobs])
+    files.add_argument(
+        "paths", nargs="+", help="Listen oder Ordner mit Listen"
+    )
+    files.add_argument(
+        "--timings", help="Zeiten pro Datei als CSV hierhin schreiben"
+    )
+    output = argparse.ArgumentParser(add_help=False, parents=[files])
+    output.add_argument(
+        "-o", "--output",
+        help="Ordner für die Ergebnisse, sonst neben der Liste",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "validate", parents=[files], help="Listen und Basislisten prüfen"
+    )
+    commands.add_parser(
+        "merge", parents=[output], help="Listen mit Basislisten zusammenführen"
+    )
+    render_parser = commands.add_parser(
+        "render", parents=[output], help="PDFs der Listen erstellen"
+    )
+    render_parser.add_argument(
+        "--orientation", choices=(PORTRAIT, LANDSCAPE),
+        help="Seitenausrichtung der PDFs, sonst je nach Breite",
+    )
+    search_parser = commands.add_parser(
+        "search", parents=[jobs], help="Listen mit einem Gegenstand finden"
+    )
+    search_parser.add_argument("query", help="Gesuchter Text")
+    search_parser.add_argument(
+        "-d", "--directory", default=str(LIST_DIR),
+        help="Ordner mit den Listen",
+    )
+    search_parser.add_argument(
+        "--index", default=str(INDEX_FILE), help="Datei des Suchindex"
+    )
+    search_parser.add_argument(
+        "--limit", type=int, default=100,
+        help="Höchstens so viele Treffer ausgeben",
+    )
+    return parser.parse_args(argv)
+
+
+def search(args: argparse.Namespace) -> int:
+    index = ContentIndex(args.index)
+    try:
+        start = time.perf_counter()
+        updated, removed = index.update(args.directory, args.jobs)
+        indexed = time.perf_counter() - start
+        start = time.perf_counter()
+        hits = index.search(args.query, args.limit)
+        searched = time.perf_counter() - start
+    finally:
+        index.close()
+    for hit in hits:
+        print(f"{hit.path} [{hit.category}] {hit.item}")
+    print(
+        f"{len(hits)} Treffer in {len({hit.path for hit in hits})} Listen, "
+        f"{searched * 1000:.0f}ms ({updated} Listen neu indiziert, "
+        f"{removed} entfernt, {indexed:.1f}s)"
+    )
+    return 0 if hits else 1
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.command == "search":
+        return search(args)
+    paths = list(expand(args.paths))
+    start = time.perf_counter()
+    results = []
+    for result in run(paths, args):
+        results.append(result)
+        status = "OK" if result.ok else "FEHLER"
+        print(
+            f"{status:<7}{result.milliseconds:>9.0f}ms  {result.path}: "
+            f"{result.message}"
+        )
+    elapsed = time.perf_counter() - start
+    failed = sum(not result.ok for result in results)
+    print(
+        f"{len(results)} Dateien, {failed} Fehler, {elapsed:.1f}s "
+        f"({sum(r.milliseconds for r in results) / 1000:.1f}s in Prozessen)"
+    )
+    if args.timings:
+        write_timings(args.timings, results)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
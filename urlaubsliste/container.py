@@ -0,0 +1,161 @@
+"""
+Binary list files. They start with the same metadata as the JSON ones,
+followed by an index of the categories, so each category can be decoded
+on its own when it's first needed:
+
+    magic "ULLB", version (u16)
+    header length (u32), header: JSON of everything but the structure
+    category count (u32)
+    per category: name length (u32), name, offset (u64), length (u64),
+                  item count (u32)
+    per category, at its offset: per item: length (u32), UTF-8 text
+                  (the length is NO_ITEM for items that are None)
+
+All numbers are little endian, offsets are from the start of the file.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Iterator, Optional
+
+from lazy import LazyCategories, Pending
+from utils import intern_items
+
+MAGIC = b"ULLB"
+VERSION = 1
+NO_ITEM = 0xFFFFFFFF
+
+_PREAMBLE = struct.Struct("<4sHI")
+_COUNT = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<QQI")
+_ITEM_LENGTH = struct.Struct("<I")
+
+DAMAGED = "Die Datei ist beschädigt."
+
+
+def is_container(path: str | Path) -> bool:
+    with open(path, "rb") as fp:
+        return fp.read(len(MAGIC)) == MAGIC
+
+
+def _encode_items(items: list[Optional[str]]) -> Iterator[bytes]:
+    for item in items:
+        if item is None:
+            yield _ITEM_LENGTH.pack(NO_ITEM)
+        else:
+            data = item.encode("utf-8")
+            yield _ITEM_LENGTH.pack(len(data))
+            yield data
+
+
+def _unpack(format: struct.Struct, data, pos: int) -> tuple:
+    """Like `format.unpack_from()`, a truncated file is a ValueError."""
+    try:
+        return format.unpack_from(data, pos)
+    except struct.error:
+        raise ValueError(DAMAGED) from None
+
+
+def iter_dumps(raw: dict) -> Iterator[bytes]:
+    """The binary file of `raw`, in chunks."""
+    header = {key: value for key, value in raw.items() if key != "structure"}
+    header_data = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    categories = raw["structure"]["categories"]
+    names = [name.encode("utf-8") for name in categories]
+    lengths = [
+        sum(
+            _ITEM_LENGTH.size + (0 if item is None else len(item.encode()))
+            for item in items
+        )
+        for items in categories.values()
+    ]
+    offset = (
+        _PREAMBLE.size + len(header_data) + _COUNT.size
+        + sum(_COUNT.size + len(name) + _INDEX_ENTRY.size for name in names)
+    )
+    yield _PREAMBLE.pack(MAGIC, VERSION, len(header_data))
+    yield header_data
+    yield _COUNT.pack(len(names))
+    for name, length, items in zip(names, lengths, categories.values()):
+        yield _COUNT.pack(len(name))
+        yield name
+        yield _INDEX_ENTRY.pack(offset, length, len(items))
+        offset += length
+    for items in categories.values():
+        yield b"".join(_encode_items(items))
+
+
+def _read_header(data) -> tuple[dict, int]:
+    magic, version, header_length = _unpack(_PREAMBLE, data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a binary list file.")
+    if version > VERSION:
+        raise ValueError(f"Unsupported binary list version {version}.")
+    pos = _PREAMBLE.size
+    if pos + header_length > len(data):
+        raise ValueError(DAMAGED)
+    header = json.loads(bytes(data[pos:pos + header_length]))
+    return header, pos + header_length
+
+
+def read_header(path: str | Path) -> dict:
+    with open(path, "rb") as fp:
+        preamble = fp.read(_PREAMBLE.size)
+        _, _, header_length = _unpack(_PREAMBLE, preamble, 0)
+        header, _ = _read_header(preamble + fp.read(header_length))
+    return header
+
+
+def load(path: str | Path) -> dict:
+    """
+    The raw list in the binary file at `path`. The file is memory mapped
+    and categories are only decoded on first access.
+    """
+    with open(path, "rb") as fp:
+        data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        header, pos = _read_header(data)
+        (count,) = _unpack(_COUNT, data, pos)
+        pos += _COUNT.size
+        pending = {}
+        for _ in range(count):
+            (name_length,) = _unpack(_COUNT, data, pos)
+            pos += _COUNT.size
+            name = bytes(data[pos:pos + name_length]).decode("utf-8")
+            pos += name_length
+            offset, length, item_count = _unpack(_INDEX_ENTRY, data, pos)
+            pos += _INDEX_ENTRY.size
+            if pos > len(data) or offset + length > len(data):
+                raise ValueError(DAMAGED)
+            pending[name] = Pending((offset, length), item_count)
+    except BaseException:
+        data.close()
+        raise
+
+    def decode(category: Pending) -> list[Optional[str]]:
+        pos, length = category.span
+        end = pos + length
+        items = []
+        for _ in range(category.count):
+            (item_length,) = _unpack(_ITEM_LENGTH, data, pos)
+            pos += _ITEM_LENGTH.size
+            if item_length == NO_ITEM:
+                items.append(None)
+                continue
+            if pos + item_length > end:
+                raise ValueError(DAMAGED)
+            item = data[pos:pos + item_length].decode("utf-8")
+            items.append(item)
+            pos += item_length
+        return intern_items(items)
+
+    raw = dict(header)
+    raw["structure"] = {
+        "categories": LazyCategories(pending, decode, data.close)
+    }
+    if not pending:
+        data.close()
+    return raw
@@ -0,0 +1,205 @@
+"""
+Persistent full-text index of the items of all lists in a directory, to
+find the lists containing an item without opening them. The index is an
+SQLite database with an FTS5 trigram table, so parts of words are found
+too. `ContentIndex.update()` only reads the lists that changed since the
+last update, spread over processes if there are many.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from model import List
+
+LIST_DIR = Path(os.path.expanduser("~/Documents/Urlaubslisten"))
+INDEX_FILE = LIST_DIR / ".index.sqlite3"
+LIST_SUFFIXES = (".ull", ".ullb", ".ulldb")
+# Marks the lists written by `cli.py merge`, copies of other lists
+MERGED = ".merged"
+# Number of changed lists from which on they're read in parallel
+PARALLEL_UPDATE = 16
+# Shorter queries can't use the trigram index and scan all items
+TRIGRAM = 3
+# Default number of items returned by a search
+RESULT_LIMIT = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    file INTEGER NOT NULL REFERENCES files(id),
+    category TEXT NOT NULL,
+    item TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_file ON items(file);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+    item, content='items', content_rowid='id', tokenize='trigram'
+);
+"""
+
+
+def is_list_file(name: str) -> bool:
+    """Whether the file `name` is a list, not counting merged copies."""
+    return (
+        name.endswith(LIST_SUFFIXES)
+        and not os.path.splitext(name)[0].endswith(MERGED)
+    )
+
+
+class Hit:
+    """An item found by `ContentIndex.search()`."""
+    __slots__ = ("path", "name", "category", "item")
+
+    def __init__(self, path: str, name: str, category: str, item: str):
+        self.path = path
+        self.name = name
+        self.category = category
+        self.item = item
+
+
+def read_items(path: str) -> Optional[tuple[str, list[tuple[str, str]]]]:
+    """
+    The name and the (category, item) pairs of the list at `path`, None
+    if it can't be read. Only the list's own items, not inherited ones.
+    """
+    try:
+        list_ = List.from_file(path)
+        return list_.name, [
+            (category, item)
+            for category in list_.categories
+            for item in list_.get_items_for_category(category)
+            if item
+        ]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+class ContentIndex:
+    """The index database `file`, created if it doesn't exist yet."""
+
+    def __init__(self, file: str | Path = INDEX_FILE):
+        Path(file).parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(file)
+        # Searching while another connection updates the index
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.create_function(
+            "casefold", 1, str.casefold, deterministic=True
+        )
+
+    def close(self):
+        self.connection.close()
+
+    def update(
+        self, directory: str | Path = LIST_DIR, jobs: Optional[int] = None
+    ) -> tuple[int, int]:
+        """
+        Reindex the lists in `directory` whose modification time or size
+        changed and forget the deleted ones. `jobs` limits the number of
+        processes. Returns the numbers of reindexed and removed lists.
+        """
+        directory = Path(directory).resolve()
+        current = {}
+        for entry in os.scandir(directory):
+            if entry.is_file() and is_list_file(entry.name):
+                stat = entry.stat()
+                current[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        known = {
+            path: (file_id, (mtime_ns, size))
+            for file_id, path, mtime_ns, size in self.connection.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+            if Path(path).parent == directory
+        }
+        changed = [
+            path for path, signature in current.items()
+            if path not in known or known[path][1] != signature
+        ]
+        removed = [path for path in known if path not in current]
+        if len(changed) >= PARALLEL_UPDATE and jobs != 1:
+            # Forking isn't safe in the threaded GUI, spawn everywhere
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                contents = list(
+                    executor.map(read_items, changed, chunksize=8)
+                )
+        else:
+            contents = [read_items(path) for path in changed]
+        # The full-text table is updated in bulk rather than by triggers,
+        # which are many times slower when a lot of lists changed
+        with self.connection:
+            for path in removed + changed:
+                if path in known:
+                    file_id = known[path][0]
+                    self.connection.execute(
+                        "INSERT INTO items_fts(items_fts, rowid, item) "
+                        "SELECT 'delete', id, item FROM items WHERE file = ?",
+                        (file_id,),
+                    )
+                    self.connection.execute(
+                        "DELETE FROM items WHERE file = ?", (file_id,)
+                    )
+                    self.connection.execute(
+                        "DELETE FROM files WHERE id = ?", (file_id,)
+                    )
+            (last_id,) = self.connection.execute(
+                "SELECT coalesce(max(id), 0) FROM items"
+            ).fetchone()
+            for path, content in zip(changed, contents):
+                mtime_ns, size = current[path]
+                # Unreadable lists are kept without items, so they're only
+                # read again once they changed
+                name, items = content if content is not None else (None, [])
+                file_id = self.connection.execute(
+                    "INSERT INTO files (path, mtime_ns, size, name) "
+                    "VALUES (?, ?, ?, ?)",
+                    (path, mtime_ns, size, name),
+                ).lastrowid
+                self.connection.executemany(
+                    "INSERT INTO items (file, category, item) "
+                    "VALUES (?, ?, ?)",
+                    ((file_id, category, item) for category, item in items),
+                )
+            self.connection.execute(
+                "INSERT INTO items_fts(rowid, item) "
+                "SELECT id, item FROM items WHERE id > ?",
+                (last_id,),
+            )
+        return len(changed), len(removed)
+
+    def search(self, query: str, limit: int = RESULT_LIMIT) -> list[Hit]:
+        """Items containing `query`, ignoring case, by list."""
+        select = (
+            "SELECT files.path, files.name, items.category, items.item "
+            "FROM items JOIN files ON files.id = items.file "
+        )
+        order = " ORDER BY files.name, files.path, items.id LIMIT ?"
+        if len(query) >= TRIGRAM:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = self.connection.execute(
+                select + "WHERE items.id IN (SELECT rowid FROM items_fts "
+                "WHERE items_fts MATCH ?)" + order,
+                (phrase, limit),
+            )
+        elif query:
+            rows = self.connection.execute(
+                select + "WHERE instr(casefold(items.item), ?)" + order,
+                (query.casefold(), limit),
+            )
+        else:
+            return []
+        return [Hit(*row) for row in rows]
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+from model import List
+
+
+DEFAULT_MAX_DEPTH = 500
+
+
+class Command:
+    """
+    An undoable change to a `List`. Commands only store what they change,
+    the state needed for `undo()` is captured when `redo()` runs.
+    """
+
+    def redo(self, list_: List):
+        raise NotImplementedError
+
+    def undo(self, list_: List):
+        raise NotImplementedError
+
+    def merge(self, other: Command) -> bool:
+        """
+        Try to absorb `other`, which was applied directly after this
+        command. Return True if it was absorbed.
+        """
+        return False
+
+    def changed_categories(self) -> Optional[set[str]]:
+        """
+        The categories whose items `redo()` and `undo()` change, None if
+        any may change.
+        """
+        return None
+
+    def to_dict(self) -> dict:
+        """
+        The command including the state captured by `redo()`, as JSON
+        compatible values. See `command_from_dict()`.
+        """
+        return {"type": type(self).__name__, **vars(self)}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Command:
+        command = cls.__new__(cls)
+        vars(command).update(data)
+        return command
+
+
+class SetItem(Command):
+    def __init__(self, category: str, index: int, value: str):
+        self.category = category
+        self.index = index
+        self.value = value
+        self.old_value: Optional[str] = None
+
+    def redo(self, list_: List):
+        items = list_.get_items_for_category(self.category)
+        self.old_value = items[self.index]
+        items[self.index] = self.value
+
+    def undo(self, list_: List):
+        items = list_.get_items_for_category(self.category)
+        items[self.index] = self.old_value
+
+    def merge(self, other: Command) -> bool:
+        if (
+            not isinstance(other, SetItem)
+            or other.category != self.category
+            or other.index != self.index
+        ):
+            return False
+        self.value = other.value
+        return True
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category}
+
+
+class InsertItem(Command):
+    def __init__(self, category: str, index: int, value: str):
+        self.category = category
+        self.index = index
+        self.value = value
+
+    def redo(self, list_: List):
+        list_.get_items_for_category(self.category).insert(
+            self.index, self.value
+        )
+
+    def undo(self, list_: List):
+        del list_.get_items_for_category(self.category)[self.index]
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category}
+
+
+class RemoveItem(Command):
+    def __init__(self, category: str, index: int):
+        self.category = category
+        self.index = index
+        self.value: Optional[str] = None
+
+    def redo(self, list_: List):
+        self.value = list_.get_items_for_category(self.category).pop(
+            self.index
+        )
+
+    def undo(self, list_: List):
+        list_.get_items_for_category(self.category).insert(
+            self.index, self.value
+        )
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category}
+
+
+class ReplaceItems(Command):
+    def __init__(self, category: str, items: list[Optional[str]]):
+        self.category = category
+        self.items = items
+        self.old_items: list[Optional[str]] = []
+
+    def redo(self, list_: List):
+        items = list_.get_items_for_category(self.category)
+        self.old_items = items[:]
+        items[:] = self.items
+
+    def undo(self, list_: List):
+        list_.get_items_for_category(self.category)[:] = self.old_items
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category}
+
+
+class AddCategory(Command):
+    """
+    Adds an empty category. An existing category of the same name is
+    emptied, its items are restored by `undo()`.
+    """
+
+    def __init__(self, category: str):
+        self.category = category
+        self.old_items: Optional[list[Optional[str]]] = None
+
+    def redo(self, list_: List):
+        self.old_items = None
+        if self.category in list_.categories:
+            self.old_items = list_.get_items_for_category(self.category)
+        list_.add_category(self.category)
+
+    def undo(self, list_: List):
+        if self.old_items is None:
+            list_.remove_category(self.category)
+            return
+        list_.add_category(self.category)
+        list_.get_items_for_category(self.category).extend(self.old_items)
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category}
+
+
+class RemoveCategory(Command):
+    def __init__(self, category: str):
+        self.category = category
+        self.items: list[Optional[str]] = []
+        self.order: list[str] = []
+
+    def redo(self, list_: List):
+        self.order = list_.categories
+        self.items = list_.get_items_for_category(self.category)
+        list_.remove_category(self.category)
+
+    def undo(self, list_: List):
+        list_.add_category(self.category)
+        list_.get_items_for_category(self.category).extend(self.items)
+        list_.reorder_categories(self.order)
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category}
+
+
+class RenameCategory(Command):
+    """Renames a category, keeping its position."""
+
+    def __init__(self, category: str, new_category: str):
+        self.category = category
+        self.new_category = new_category
+
+    def _rename(self, list_: List, old: str, new: str):
+        order = [new if key == old else key for key in list_.categories]
+        list_.rename_category(old, new)
+        list_.reorder_categories(order)
+
+    def redo(self, list_: List):
+        self._rename(list_, self.category, self.new_category)
+
+    def undo(self, list_: List):
+        self._rename(list_, self.new_category, self.category)
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return {self.category, self.new_category}
+
+
+class ReorderCategories(Command):
+    def __init__(self, order: list[str]):
+        self.order = order
+        self.old_order: list[str] = []
+
+    def redo(self, list_: List):
+        self.old_order = list_.categories
+        list_.reorder_categories(self.order)
+
+    def undo(self, list_: List):
+        list_.reorder_categories(self.old_order)
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return set()
+
+
+class RenameList(Command):
+    def __init__(self, name: str):
+        self.name = name
+        self.old_name = ""
+
+    def redo(self, list_: List):
+        self.old_name = list_.name
+        list_.change_name(self.name)
+
+    def undo(self, list_: List):
+        list_.change_name(self.old_name)
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return set()
+
+
+class ChangeBaseList(Command):
+    """
+    Sets or, with `None`, removes the base list. The new base list is
+    only validated the first time the command is applied.
+    """
+
+    def __init__(self, base_list: Optional[str]):
+        self.base_list = base_list
+        self.old_base_list: Optional[str] = None
+        self.validated = False
+
+    def redo(self, list_: List):
+        self.old_base_list = list_.orm.base_list
+        if self.validated or self.base_list is None:
+            list_.raw["base_list"] = self.base_list
+            return
+        list_.change_baselist(self.base_list)
+        self.base_list = list_.orm.base_list
+        self.validated = True
+
+    def undo(self, list_: List):
+        list_.raw["base_list"] = self.old_base_list
+
+    def changed_categories(self) -> Optional[set[str]]:
+        return set()
+
+
+class CommandGroup(Command):
+    """Several commands that are undone and redone as one."""
+
+    def __init__(self, commands: Optional[list[Command]] = None):
+        self.commands = commands if commands is not None else []
+
+    def redo(self, list_: List):
+        for command in self.commands:
+            command.redo(list_)
+
+    def undo(self, list_: List):
+        for command in reversed(self.commands):
+            command.undo(list_)
+
+    def changed_categories(self) -> Optional[set[str]]:
+        changed: set[str] = set()
+        for command in self.commands:
+            categories = command.changed_categories()
+            if categories is None:
+                return None
+            changed |= categories
+        return changed
+
+    def to_dict(self) -> dict:
+        return {
+            "type": type(self).__name__,
+            "commands": [command.to_dict() for command in self.commands],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Command:
+        return cls([
+            command_from_dict(command) for command in data["commands"]
+        ])
+
+
+COMMAND_TYPES: dict[str, type[Command]] = {
+    command.__name__: command
+    for command in (
+        SetItem,
+        InsertItem,
+        RemoveItem,
+        ReplaceItems,
+        AddCategory,
+        RemoveCategory,
+        RenameCategory,
+        ReorderCategories,
+        RenameList,
+        ChangeBaseList,
+        CommandGroup,
+    )
+}
+
+
+def command_from_dict(data: dict) -> Command:
+    """The command of `Command.to_dict()`, with the same state."""
+    data = dict(data)
+    return COMMAND_TYPES[data.pop("type")].from_dict(data)
+
+
+class History:
+    """
+    Undo and redo stacks of `Command`s. At most `max_depth` commands are
+    kept for undoing, the oldest ones get dropped first. With `coalesce`,
+    commands that can be merged into the previous one (like consecutive
+    edits of the same cell) are undone in a single step.
+
+    Listeners are called with "do", "undo" or "redo" and the command
+    after a command was recorded, undone or redone.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = DEFAULT_MAX_DEPTH,
+        coalesce: bool = False,
+    ):
+        self.max_depth = max_depth
+        self.coalesce = coalesce
+        self.undos: list[Command] = []
+        self.redos: list[Command] = []
+        self.listeners: list[Callable[[str, Command], None]] = []
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.undos)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.redos)
+
+    def add_listener(self, listener: Callable[[str, Command], None]):
+        self.listeners.append(listener)
+
+    def _notify(self, action: str, command: Command):
+        for listener in self.listeners:
+            listener(action, command)
+
+    def execute(self, list_: List, command: Command):
+        """Apply `command` to `list_` and record it."""
+        command.redo(list_)
+        self.record(command)
+
+    def record(self, command: Command):
+        """Record a command that was already applied."""
+        self.redos.clear()
+        self._notify("do", command)
+        if self.coalesce and self.undos and self.undos[-1].merge(command):
+            return
+        self.undos.append(command)
+        if self.max_depth is not None and len(self.undos) > self.max_depth:
+            del self.undos[:len(self.undos) - self.max_depth]
+
+    def undo(self, list_: List) -> Optional[Command]:
+        try:
+            command = self.undos.pop()
+        except IndexError:  # Nothing to undo
+            return None
+        command.undo(list_)
+        self.redos.append(command)
+        self._notify("undo", command)
+        return command
+
+    def redo(self, list_: List) -> Optional[Command]:
+        try:
+            command = self.redos.pop()
+        except IndexError:  # Nothing to redo
+            return None
+        command.redo(list_)
+        self.undos.append(command)
+        self._notify("redo", command)
+        return command
+
+    def clear(self):
+        self.undos.clear()
+        self.redos.clear()
@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+from PyQt5.QtGui import QIcon
+
+import icons_rc  # noqa: F401  Registers the ":/icons" resources
+
+
+@lru_cache(maxsize=None)
+def get_icon(name: str) -> QIcon:
+    """
+    The icon `icons/<name>.png`, loaded once from the embedded resources
+    and shared by all callers.
+    """
+    return QIcon(f":/icons/{name}.png")
@@ -2,31 +2,13 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x00\xfb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\xb0\x49\x44\x41\x54\x48\x89\x63\x60\xa0\x33\
-\x60\x67\x60\x60\xe8\x66\x60\x60\x78\xc6\xc0\xc0\xf0\x9f\x00\xfe\
-\xca\xc0\xc0\x20\x46\xaa\x05\x9d\x44\x18\x8c\x8c\x2f\x93\x6a\x09\
-\xcc\xe5\x56\x04\xd4\x91\x6d\x09\x4c\x13\xb1\xea\x2e\x41\xe9\xeb\
-\x0c\x0c\x0c\x92\xb4\xb0\x40\x94\x54\x4b\x48\xb5\x80\x81\x54\x4b\
-\x48\xb5\x00\x1b\xfe\x4c\x0d\x0b\x0e\x13\xb0\x84\x62\x0b\x88\xd6\
-\xcf\x44\x81\x61\x44\x01\x52\x2d\x38\x0c\xc5\x64\x03\x42\x41\x44\
-\xb2\xfc\xa0\x08\x22\xe4\x14\x03\x03\x30\x3e\xc1\xe0\xa2\xb9\x0f\
-\xd0\xc1\xd0\x8b\x03\x16\x12\xd5\x1f\xa1\xd4\x42\x9a\xe7\xe4\xe7\
-\x50\xda\x9a\x0c\xc3\x6d\xa1\xf4\x33\x7c\x8a\x3a\x18\xf0\x17\x62\
-\xc4\xe0\x76\x7c\x16\xb0\x41\x2d\x79\x4a\x86\xc1\x4f\xa1\x86\xb3\
-\x11\xe9\x63\xea\x00\x00\x9b\x83\x82\xd4\xee\xab\xb9\x56\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x00\x8d\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -38,30 +20,6 @@ qt_resource_data = b"\
 \x30\xcd\x7d\x40\x2a\x18\xcd\x07\xa3\x16\x60\x02\x16\x12\xd5\x1f\
 \xa1\x89\x2b\x46\x01\x4d\x01\x00\xb0\x56\x13\xdd\x47\x45\x80\x50\
 \x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x55\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01\x0a\x49\x44\x41\x54\x48\x89\xed\xd3\xaf\x4b\
-\x84\x41\x10\xc6\xf1\xcf\x9d\x45\x83\x60\x32\x88\x16\x83\x60\x10\
-\x04\xc1\xa0\x45\x44\x10\xb4\x6b\x32\x69\xb8\x62\x32\x5a\x2d\x97\
-\xfc\x0b\x0c\x46\xb1\xaa\x49\xc1\x20\x58\xfc\x51\xbd\x20\x67\x38\
-\x30\x29\x16\xc1\xe0\x79\x06\xe7\x85\x43\xdf\xf7\x5e\xaf\x29\xbc\
-\x5f\x18\x76\x67\x76\x66\x9f\x1d\x76\x97\x82\x82\x3f\x4f\xa9\x8b\
-\xdc\x61\x4c\x62\x0c\xbd\x68\xe0\x1e\x97\xf8\xc8\x2b\x9e\x40\x05\
-\xe5\x94\xb5\x45\x1c\xa1\x89\x56\x8a\x35\x50\xc5\x40\x27\x81\x93\
-\x48\x9e\x6d\x8b\xf5\xe3\xb0\x6d\xa3\x57\x1c\x63\x17\x3b\xd8\x47\
-\xed\x9b\xd0\x72\x96\xc0\x59\x24\xcd\x87\x3f\x88\xeb\x88\xbd\x60\
-\xab\xc3\x09\xa7\x71\x1e\xb9\x4d\xac\xe6\x09\x8c\xe0\x2e\xfc\x1a\
-\x46\xb3\x4e\xd5\x46\x19\xdb\x51\xf3\x86\xb9\x2c\x81\x35\x3c\xc4\
-\xfc\x36\x3a\xe9\x86\x6a\xd4\xd6\xd1\x97\x26\xf0\x1c\xe3\x85\x9c\
-\x4b\xcb\xa0\x07\x37\xb1\x47\x25\x09\xc0\x26\x86\x42\xb5\x8e\x53\
-\xcc\x60\xc1\xd7\xb3\x4c\xee\x23\x8f\x16\x9e\xb0\x82\x77\x1c\x24\
-\x0b\x8f\xd2\x9f\x60\x62\x53\x5d\x74\x51\xc2\x06\xc6\x13\x07\x96\
-\xb0\x8e\x2b\x3f\x3f\xcd\x13\xf6\x7e\xd9\x41\x41\xc1\x7f\xe4\x13\
-\xf3\xde\x4d\x79\xd5\xed\x4a\x50\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
 \x00\x00\x01\xbd\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -92,6 +50,1233 @@ qt_resource_data = b"\
 \xc0\x42\xcd\x2d\x6b\x91\x49\xaf\xd5\x36\xbe\x4a\x12\x3c\xc2\xf7\
 \x88\x75\xa4\xcf\x34\xc1\xb8\x06\x76\x77\x8a\x78\x83\xc5\xe2\xb5\
 \x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x55\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x0a\x49\x44\x41\x54\x48\x89\xed\xd3\xaf\x4b\
+\x84\x41\x10\xc6\xf1\xcf\x9d\x45\x83\x60\x32\x88\x16\x83\x60\x10\
+\x04\xc1\xa0\x45\x44\x10\xb4\x6b\x32\x69\xb8\x62\x32\x5a\x2d\x97\
+\xfc\x0b\x0c\x46\xb1\xaa\x49\xc1\x20\x58\xfc\x51\xbd\x20\x67\x38\
+\x30\x29\x16\xc1\xe0\x79\x06\xe7\x85\x43\xdf\xf7\x5e\xaf\x29\xbc\
+\x5f\x18\x76\x67\x76\x66\x9f\x1d\x76\x97\x82\x82\x3f\x4f\xa9\x8b\
+\xdc\x61\x4c\x62\x0c\xbd\x68\xe0\x1e\x97\xf8\xc8\x2b\x9e\x40\x05\
+\xe5\x94\xb5\x45\x1c\xa1\x89\x56\x8a\x35\x50\xc5\x40\x27\x81\x93\
+\x48\x9e\x6d\x8b\xf5\xe3\xb0\x6d\xa3\x57\x1c\x63\x17\x3b\xd8\x47\
+\xed\x9b\xd0\x72\x96\xc0\x59\x24\xcd\x87\x3f\x88\xeb\x88\xbd\x60\
+\xab\xc3\x09\xa7\x71\x1e\xb9\x4d\xac\xe6\x09\x8c\xe0\x2e\xfc\x1a\
+\x46\xb3\x4e\xd5\x46\x19\xdb\x51\xf3\x86\xb9\x2c\x81\x35\x3c\xc4\
+\xfc\x36\x3a\xe9\x86\x6a\xd4\xd6\xd1\x97\x26\xf0\x1c\xe3\x85\x9c\
+\x4b\xcb\xa0\x07\x37\xb1\x47\x25\x09\xc0\x26\x86\x42\xb5\x8e\x53\
+\xcc\x60\xc1\xd7\xb3\x4c\xee\x23\x8f\x16\x9e\xb0\x82\x77\x1c\x24\
+\x0b\x8f\xd2\x9f\x60\x62\x53\x5d\x74\x51\xc2\x06\xc6\x13\x07\x96\
+\xb0\x8e\x2b\x3f\x3f\xcd\x13\xf6\x7e\xd9\x41\x41\xc1\x7f\xe4\x13\
+\xf3\xde\x4d\x79\xd5\xed\x4a\x50\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x01\x04\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\xb9\x49\x44\x41\x54\x48\x89\xed\x92\x3d\x0a\
+\xc2\x40\x10\x85\xbf\xc2\x46\x4b\xd1\x45\xc1\xde\xab\x79\x32\xc5\
+\x9f\xd2\x03\x28\x29\xd3\xb9\x85\x36\xb6\x16\x39\x40\x2c\x14\x62\
+\x91\x17\x08\xb2\x26\x88\xb3\x85\x90\x07\x8f\xdd\x1d\x76\xbe\x19\
+\x66\x17\xfe\x44\x03\xd9\x5c\x23\x60\x07\x3c\xe5\x2d\x30\xb4\x82\
+\x3b\xc0\x03\x05\x90\xcb\x05\xb0\xb1\x86\x7b\x60\x02\xcc\x54\xe4\
+\x01\xf4\x2d\xe1\x4e\xf1\x29\x70\xff\xb5\xc0\x27\x78\x3d\xbe\x8e\
+\x09\xf7\x94\x0f\xff\xb5\xc6\xc0\x49\x90\x33\xe5\xcc\x9b\xe2\x1d\
+\xbc\x83\x47\x82\x03\xa4\xb4\xff\x73\x17\x4e\x6d\xd7\x5c\x90\x2c\
+\x06\x1c\x60\x21\xd0\x52\x67\xb3\xb1\x54\x5a\x09\xb6\xd7\x3e\xc3\
+\xa8\xf3\x4a\x37\x01\xeb\x4e\xdf\xe0\x49\xe0\x4e\xc8\x49\x95\xd0\
+\xab\x25\x5f\xb5\x1e\x81\x83\xd6\x8b\x45\xe7\x9d\x1a\xf5\x02\x4d\
+\x27\x6e\xe8\x7d\x7d\x4e\x3d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x01\x03\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\xb8\x49\x44\x41\x54\x48\x89\xdd\x95\x4b\x0e\
+\x82\x30\x10\x86\x3f\x8c\xd1\x13\x48\xe2\x55\x34\x5e\xcf\x07\xd7\
+\x62\xc9\x0e\x16\x9e\x00\x3c\x06\x6e\xa6\xa6\x34\xb4\x99\x11\x12\
+\x63\xff\x64\xd2\xe7\xfc\x5f\xdb\x59\x14\x72\xd2\x1e\xa8\x80\x01\
+\x18\x0d\xd1\x00\xa5\x06\x50\x19\x8d\xfd\xe8\x34\x10\x77\xf2\x93\
+\x8c\x5d\x72\x4a\xa5\x98\xab\x20\xa1\xa1\x06\x00\x70\x00\x5a\xd9\
+\xfb\x04\x8e\x6b\x03\xd4\x90\x18\x20\x15\xb5\xb7\xdf\x7f\xae\x46\
+\x03\xa8\x8d\x00\x07\x89\xde\xdc\xf2\x24\x29\x4d\x7c\x36\x2b\x18\
+\x26\xf5\x53\x80\xa6\x06\xb1\x5a\x7c\x54\x78\xfd\x31\x98\xb3\xd6\
+\x23\xcc\x2b\x00\xb6\x86\xc4\x98\x92\x07\xc9\xbb\xc8\xff\x07\x78\
+\x49\x7b\x5e\xe0\x77\x91\x76\x98\x5b\xbc\xf3\xfd\x87\x13\xc6\x75\
+\x0e\xb0\x03\x1e\x40\xbf\xc0\xb8\x07\x6e\xe2\x95\x89\xde\xa7\xf1\
+\x86\xe6\xe0\x15\x09\x0f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x00\xfb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\xb0\x49\x44\x41\x54\x48\x89\x63\x60\xa0\x33\
+\x60\x67\x60\x60\xe8\x66\x60\x60\x78\xc6\xc0\xc0\xf0\x9f\x00\xfe\
+\xca\xc0\xc0\x20\x46\xaa\x05\x9d\x44\x18\x8c\x8c\x2f\x93\x6a\x09\
+\xcc\xe5\x56\x04\xd4\x91\x6d\x09\x4c\x13\xb1\xea\x2e\x41\xe9\xeb\
+\x0c\x0c\x0c\x92\xb4\xb0\x40\x94\x54\x4b\x48\xb5\x80\x81\x54\x4b\
+\x48\xb5\x00\x1b\xfe\x4c\x0d\x0b\x0e\x13\xb0\x84\x62\x0b\x88\xd6\
+\xcf\x44\x81\x61\x44\x01\x52\x2d\x38\x0c\xc5\x64\x03\x42\x41\x44\
+\xb2\xfc\xa0\x08\x22\xe4\x14\x03\x03\x30\x3e\xc1\xe0\xa2\xb9\x0f\
+\xd0\xc1\xd0\x8b\x03\x16\x12\xd5\x1f\xa1\xd4\x42\x9a\xe7\xe4\xe7\
+\x50\xda\x9a\x0c\xc3\x6d\xa1\xf4\x33\x7c\x8a\x3a\x18\xf0\x17\x62\
+\xc4\xe0\x76\x7c\x16\xb0\x41\x2d\x79\x4a\x86\xc1\x4f\xa1\x86\xb3\
+\x11\xe9\x63\xea\x00\x00\x9b\x83\x82\xd4\xee\xab\xb9\x56\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\xfb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x04\x03\x00\x00\x00\x12\x59\x20\xcb\
+\x00\x00\x00\x30\x50\x4c\x54\x45\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\xff\xff\xff\x5a\x81\x3a\x19\x00\x00\x00\x0e\
+\x74\x52\x4e\x53\x00\x06\x07\x3a\x3b\x3d\x86\x87\x88\x89\x8a\xc3\
+\xe5\xe6\x16\xa0\x37\x02\x00\x00\x00\x01\x62\x4b\x47\x44\x0f\x18\
+\xba\x00\xd9\x00\x00\x00\x5f\x49\x44\x41\x54\x18\xd3\x63\x60\x40\
+\x05\xdc\xef\xc0\x60\x03\x98\xc3\x07\xe1\x3c\x80\x70\x1e\x20\x48\
+\x32\x38\x4c\x6b\xdf\x41\xc1\x4d\x01\x06\xae\x77\x70\xd0\xc0\xc0\
+\xfb\x18\x66\xb9\xdf\x01\x98\x46\x88\x2e\x34\x0e\xcc\x6d\x60\x0e\
+\xcc\x6d\x10\x0e\xd4\x1e\x20\xcd\xfb\x04\xc6\x89\x3b\xc0\xc0\x01\
+\x75\x3c\x50\x71\x02\x03\xe3\x1c\x18\xe7\xb8\x00\x7e\x57\x23\x7b\
+\x1b\x25\x40\x10\x00\x00\x53\xc1\x60\xb3\x87\xbb\xc1\xfb\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x42\x64\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x00\x42\x2b\x49\x44\x41\x54\x78\xda\xed\x9d\x07\x7c\x54\xd5\
+\x12\xc6\xbf\x4d\x0f\x09\x09\xa1\xf7\xaa\xf4\xde\x8b\x28\xbd\x77\
+\x51\x3a\x48\xef\xbd\x08\x4a\x51\x50\xec\xe5\x89\x28\xa2\xa2\x08\
+\x2a\x20\x02\x52\xa4\xf7\x8e\x0a\x88\x4a\x0f\x84\x12\x4a\x08\x09\
+\x09\xe9\x6d\xdf\x99\xb3\xd9\xcd\xde\x2d\xd9\x7a\xef\x6e\x92\xf3\
+\xff\xbd\x27\xd9\x76\xf7\xee\xee\x3d\xdf\x99\x99\x33\x33\x47\x05\
+\x81\x40\x90\x67\x51\xb9\xfa\x04\x04\x02\x81\xeb\x10\x02\x20\x10\
+\xe4\x61\x84\x00\x08\x04\x79\x18\x21\x00\x02\x41\x1e\x46\x08\x80\
+\x40\x90\x87\x11\x02\x20\x10\xe4\x61\x84\x00\x08\x04\x79\x18\x21\
+\x00\x02\x41\x1e\x46\x08\x80\x40\x90\x87\x11\x02\x20\x10\xe4\x61\
+\x84\x00\x08\x04\x79\x18\x21\x00\x02\x41\x1e\x46\x08\x80\x40\x90\
+\x87\x11\x02\x20\x10\xe4\x61\x84\x00\x08\x04\x79\x18\x9d\x00\xbc\
+\xfe\xc6\x4e\xf5\x9f\x7f\xdd\x41\x86\xda\xf4\x13\x33\x32\x32\xa0\
+\x56\xab\xad\x3e\xa8\x87\xa7\xa7\xd5\x27\xa1\x66\xc7\xce\xb0\xf2\
+\xd8\x84\xa7\x2d\xc7\x56\xb3\x63\x67\xc8\x75\x6c\x35\xff\x5e\xac\
+\x3f\xb6\x07\xac\xd5\x5c\x9b\x8f\xed\xc1\x8e\xad\x92\xe7\xd8\x1e\
+\xec\xd8\x2a\x99\x8e\xed\xef\xef\x83\x0e\x6d\x2b\x63\xea\xc4\x96\
+\x62\x32\x72\x01\xfc\x4b\xa7\xc1\xbf\x7e\xe3\xdf\xec\xd7\xa3\xff\
+\xa9\xf9\x8f\xcd\xc7\xa3\xde\x4f\xa2\xd2\xde\xa6\xe7\xa8\x34\xb7\
+\xf9\xbf\xc8\x7c\x8d\x5a\xfb\x57\xe6\x75\xc8\x6e\xf3\x5b\x74\x83\
+\x8f\x3f\x75\xe6\x93\x55\xec\x2e\x75\xe6\xe3\xd0\xfc\x0d\x95\xc1\
+\x7b\x67\x0e\x58\xbd\xd7\xaa\x54\xda\xe7\xe8\x4e\x43\xf7\xb0\xe6\
+\x70\x6a\xcd\x39\x6a\x1f\xe5\x8f\xb1\xf7\x52\x6b\xcf\x49\xef\xb8\
+\xc8\x3a\x07\xed\x87\x53\xf3\x97\xa8\xc4\xe7\x77\xc1\xe7\x57\xa9\
+\x3c\xf0\xf1\x7b\xdd\xd0\xbd\x4b\x0d\x21\x02\x0a\xc3\xbf\xf0\x8e\
+\xdd\x57\xaa\xaf\xdf\x8c\x92\xcc\x4d\xda\x8b\x45\xab\xfc\x06\xbf\
+\x61\xd6\x0f\x8f\xcc\x1f\x52\xad\xd6\xcd\x40\xea\xcc\xe7\x69\x0f\
+\xa8\x7d\x9e\xee\x40\xaa\xac\xab\xcb\xe0\xa6\xd1\x73\x35\xd7\x95\
+\x3a\x6b\x06\x52\x1b\x5f\xfc\xda\x4f\xa2\x3b\x0f\xa8\xb2\x6e\xeb\
+\x7f\x26\xbd\x63\x1b\x3f\x06\xf1\xf9\x5d\xf8\xf9\x07\xf6\xaf\x87\
+\xc5\x0b\x3a\x0a\x01\x50\x18\xfe\x85\xb7\xeb\xfa\x95\x3a\x2c\x2c\
+\xca\xe8\x21\xb5\xee\xbf\x99\xb3\x89\x2a\xf3\xc7\xd5\x9b\xb5\x34\
+\x8f\x65\xfe\x97\xcf\x0c\x2a\xdd\x8c\x42\x2f\xd0\x5e\x18\x9a\x8b\
+\x22\xeb\xe2\xe4\xaf\xc8\x7c\x2c\x6b\x16\xd1\xbc\x46\x9d\x79\x44\
+\xfe\x88\x5a\x7f\x56\xc9\x3c\x2f\x95\x5a\xf7\x37\xbd\x48\x05\xe8\
+\xdd\xd6\xbb\x78\xb5\x33\x9a\xde\xa7\x92\x5e\xe8\x2a\xe8\x7f\x02\
+\xf1\xf9\x5d\xf7\xf9\x5f\xee\x53\x0b\x4b\x17\x77\x15\x02\xa0\x30\
+\xfc\x0b\x6f\xd3\xf9\x4b\xf5\xed\x3b\x31\xba\x1f\x34\x30\xd0\x07\
+\x55\x2a\x17\x71\xf5\xb9\x09\x72\x29\x34\xee\xcf\x9e\x0b\xd7\x97\
+\x16\xf4\xee\x59\x0d\x1f\x2c\xed\x29\x04\x40\x61\xf4\x04\xe0\x89\
+\x6e\x7a\x68\x50\xaf\x34\x7e\x5e\x3d\x48\xe7\x37\xea\x07\x80\xf4\
+\x03\x81\xfa\x8f\x9b\xfa\xd7\xf0\x79\xfa\xb7\xcd\x1d\xcb\xda\x63\
+\xdb\xfb\xaf\x55\x5f\x8a\x89\xd7\x8a\xcf\xef\xbc\xcf\x9f\x9e\x9e\
+\x81\x6a\xf5\x3e\xd4\xf3\x2b\x98\x00\xf4\x10\x02\xe0\x0a\xb2\x04\
+\xe0\x36\xb3\x00\x32\x7f\x8c\x06\xf5\x4a\x71\x01\xd0\x3d\xc9\xe0\
+\x02\xb0\x74\x41\xeb\x3f\x6e\xea\x31\x73\xcf\xb5\xf4\x5a\xc3\x73\
+\xd1\x3f\x27\xc3\xe7\x5b\xf3\xbe\xd9\xbd\xd6\xdc\x7b\x8a\xcf\xef\
+\xf8\xe7\x4f\x4b\x4b\x47\xd5\xba\x1f\x68\x5c\x94\xcc\x80\xa2\xb0\
+\x00\x5c\x83\xd4\x05\xc8\x34\x01\x48\x00\xd6\xfd\x30\xd8\xe4\x2c\
+\x60\x38\x8b\x64\x77\x31\x64\x37\xeb\x18\x5e\x24\xb6\xce\x52\xe6\
+\x8e\x67\x38\x40\xec\x39\xae\xa9\xcf\x20\x3e\xbf\xf3\x3e\xbf\xc4\
+\x02\xc8\x8c\x27\x08\x0b\xc0\x35\xe8\x04\xe0\x16\x77\x01\x34\xdf\
+\x7f\xc3\xfa\x52\x0b\x80\x3f\xd1\xc2\xcc\xa5\xff\x1c\xed\xf3\x6c\
+\x19\x00\xfa\xaf\x33\xf7\x3c\x4b\xef\x6b\x78\xa1\x9a\x7b\xae\x35\
+\xc7\xcb\xee\x3d\xc4\xe7\x77\xec\xf3\xeb\x04\x40\xf3\x44\xe1\x02\
+\xb8\x10\x03\x0b\x40\x83\xd6\x02\x10\x08\xe4\x80\x5c\x00\x9d\x00\
+\x64\x22\x04\xc0\x35\x64\x59\x00\xb7\x9f\xe8\xee\x6c\x58\xbf\xb4\
+\x91\x05\x20\x10\x38\x0b\xb2\x00\x28\x06\xa0\x4f\x9f\x9e\xd5\x85\
+\x00\xb8\x00\x21\x00\x02\xc5\x11\x02\xe0\x3e\x08\x01\x10\x28\x8e\
+\x10\x00\xf7\x41\xc4\x00\x04\x8a\x23\x62\x00\xee\x83\xb0\x00\x04\
+\x8a\x23\x2c\x00\xf7\x81\x7f\xe1\xed\xbb\x7e\xa5\xbe\xa1\x57\x0b\
+\x20\x04\x40\x20\x27\xa6\x04\xa0\xff\x4b\x75\xf1\xf6\x1b\x9d\x85\
+\x00\x28\x8c\x46\x00\xba\xad\x54\xdf\xb8\xf9\x58\x77\xa7\x10\x00\
+\x81\x9c\x98\x12\x80\x01\x2f\xd7\xc3\x5b\x8b\x3a\x09\x01\x50\x18\
+\x9d\x00\xdc\xd4\xb3\x00\x44\x0c\x40\x20\x27\xa6\x62\x00\x64\x01\
+\x08\x01\x50\x1e\xb7\xb7\x00\xa8\x9b\x4f\x62\x62\x2a\x52\xd9\x45\
+\x63\x67\x96\xac\xc0\xcd\x20\x0b\xa0\x59\xab\xcf\x25\xf7\x09\x0b\
+\xc0\x35\xb8\xb5\x00\x24\xb0\x81\x1f\x11\x11\x87\xa4\xe4\x34\x2e\
+\x04\xf6\xe6\xc9\x0b\xdc\x8b\xf4\x74\x35\x5e\x1c\xb0\x5a\x72\x9f\
+\x10\x00\xd7\xe0\xb6\x02\x90\x9c\x92\x8e\xbb\x77\x9f\xf0\xc1\x2f\
+\xc8\x5d\x08\x01\x70\x1f\xdc\x56\x00\x1e\x3c\x7c\x8a\xc7\x51\x09\
+\xae\xfd\x76\x04\xb2\x20\x04\xc0\x7d\x70\x5b\x01\xb8\x16\x1a\x89\
+\x14\x66\x05\x08\x72\x1f\x42\x00\xdc\x07\xb7\x15\x80\xcb\x57\x1f\
+\xf1\x60\x91\x20\xf7\x21\x04\xc0\x7d\x10\x02\x20\x50\x1c\x21\x00\
+\xee\x83\x10\x00\x81\xe2\x08\x01\x70\x1f\x74\x6d\xc1\x6f\xba\x59\
+\x2a\xb0\x10\x80\xdc\x8b\x29\x01\xe8\xd7\xb7\x36\x96\xbe\x29\xda\
+\x82\x2b\x8d\xdb\x16\x03\x59\x2b\x00\xb1\xb1\xc9\x88\x89\x4d\x14\
+\x49\x42\x39\x08\xfa\x5d\xa7\xcf\xd9\x2a\xb9\xaf\x5d\x9b\x4a\x18\
+\x39\xac\x7e\xb6\xaf\xa3\xed\xcf\x02\x03\x03\xad\x7e\x9f\x84\xc4\
+\x44\xa4\xa6\xa6\x5a\xf5\x5c\x0f\x95\x0a\xf9\xf3\xe7\xb7\xfa\xd8\
+\x49\x49\x49\x08\x0c\xf0\x44\xa5\x4a\xa5\x72\xb4\x68\xe5\x68\x01\
+\x08\xbf\x17\x8b\x65\x5f\x1e\xc3\xd5\x6b\x8f\x6c\xda\xff\x4f\x20\
+\x70\x14\x0f\x0f\x15\x6a\x54\x2f\x8a\x45\xf3\x5a\xa1\x5e\xdd\x8a\
+\x39\x56\x04\x72\xb4\x00\x7c\xfe\xe5\x71\xec\x3b\x78\xcd\xa5\xe7\
+\x29\xc8\xdb\xf4\xe8\x5a\x15\x9f\xbc\xdf\x5b\x08\x80\xb3\xb1\x46\
+\x00\x16\x2f\xdd\x87\xb3\xe7\xef\xba\xf4\x3c\x05\x79\x9b\x66\x4d\
+\xca\x60\xed\xaa\xc1\x76\x0b\xc0\xfb\x9f\x1c\x54\x47\x46\xc6\x73\
+\x0b\x36\x28\xc8\x0f\x65\xcb\x14\xc0\x2b\x83\x1b\x29\x26\x28\x39\
+\x5c\x00\xf6\x32\x01\x08\x77\xe9\x79\x0a\xf2\x36\xb6\x0a\xc0\x9e\
+\xfd\x57\xd4\xbf\x6c\xba\x80\x0b\xff\xdc\x47\x54\x74\x82\x91\xeb\
+\x4a\xad\xd4\xfd\xfc\xbc\x50\xa1\x5c\x01\xb4\x7a\xbe\x02\x3a\xb5\
+\x7f\x86\xb9\x1a\xe5\x64\x13\x84\x5c\x25\x00\x41\xf9\xfd\x30\x79\
+\x42\x0b\x97\x9e\xb7\x20\x77\xb3\xec\x8b\xe3\x88\x7d\x9a\xa4\xbb\
+\x6d\x8b\x00\x4c\x9a\xb1\x59\xbd\x9f\xb9\xac\xd6\x66\xb8\xd2\x36\
+\x0b\x65\x4a\x07\x63\xca\xf8\xa6\xe8\xdd\xb3\xbe\x2c\x22\x90\xab\
+\x04\xa0\x78\xb1\xfc\x38\xba\x6f\x82\x4b\xcf\x5b\x90\xbb\x69\xd9\
+\xee\x0b\x5e\xa7\xa2\xc5\x5a\x01\xe0\x3b\x70\xdf\x8a\xb6\xb9\xa2\
+\x95\x2c\x02\x4f\x4f\x15\x46\x0f\x6f\x80\x59\xd3\xda\x39\x5d\x04\
+\x14\x17\x80\xb4\xb4\x0c\xdc\xbb\x1f\x8b\x47\xcc\xef\xa1\xc6\x10\
+\xe6\xa0\x9d\x8a\xd4\x16\x22\xfb\xab\x7f\xfc\x13\xd7\xae\x47\xea\
+\x6e\x0b\x01\x10\xc8\x8d\x3d\x02\xd0\xb9\xe7\x4a\xf5\xd5\xeb\x8f\
+\x8d\xee\x0f\xf2\x61\x33\x7c\xfe\x0c\x94\x0c\x54\xc3\xc7\x03\x78\
+\x98\xa0\x42\x78\x9c\x0a\x0f\x12\x54\x46\xcb\xda\x7e\xbe\x5e\x18\
+\x3c\xa0\x36\xe6\xcd\xee\xe8\x54\x11\x50\xac\x2b\x30\xf9\x3a\x37\
+\xc2\x1e\xe3\x87\x1f\xff\xc2\x89\x53\xb7\xb8\x08\xa4\xa6\x3a\xb7\
+\xd8\xa7\x58\xd1\x40\x1c\xdb\x3f\xd1\xa9\xc7\x14\x08\xf4\x79\xae\
+\xed\x72\x3c\x8c\x88\xd3\xdd\x6e\xda\xb8\x74\xb6\x02\xd0\xad\xcf\
+\x37\xea\xcb\x57\x23\x25\xf7\x79\xaa\xd4\x68\x5c\x3c\x03\x43\xaa\
+\xa6\xa2\x46\xa1\x0c\xe4\xf7\xd1\x98\xfb\xc9\x6c\x38\xdc\x8a\x55\
+\x61\x57\x98\x17\x36\x5e\xf3\xc2\x53\x9e\xc2\x90\x75\x68\x5f\x5f\
+\x4f\x0c\x19\x50\x07\x73\x67\x75\x70\x9a\x08\x28\x66\x01\x1c\x39\
+\x76\x03\xf3\xdf\xdc\x8d\xfb\x0f\x62\x9d\x7a\x5c\x7d\x84\x05\x20\
+\x90\x1b\x5b\x2c\x80\xb6\x5d\xbe\x64\x66\xff\x13\xc9\x7d\x3e\x9e\
+\x40\xdf\x67\xd3\x31\xad\x5e\x0a\xbc\x3d\xcc\x5b\xb8\x67\x1e\x7a\
+\xe2\xed\x33\x3e\xb8\x1d\x2b\x3d\x34\xe5\x1f\x8c\x1b\xd5\x08\x33\
+\xa7\xb6\x75\x8a\x08\x28\x22\x00\x67\xfe\xbc\x83\xf1\x53\x36\xe1\
+\x69\x5c\xb2\xac\x5d\x7d\x84\x00\x08\xe4\xc6\x5a\x01\xd0\x5a\xd5\
+\xfa\xd7\xbb\x9f\x17\x30\xac\x5a\x1a\x46\xd5\x4c\x85\x97\x87\xa5\
+\x71\xa0\xc2\xd5\x27\x2a\x2c\x38\xe1\x83\xab\xd1\x1e\x92\x47\x28\
+\x26\x30\x62\x68\x7d\xa7\x58\x02\xb2\xb7\x05\x27\x5f\x7f\xf2\xcc\
+\x2d\xf8\xeb\xac\xfc\xeb\xf5\x42\x00\x04\x72\x63\x28\x00\x2d\x9b\
+\x57\xc0\xf7\x5f\xf7\x97\x0c\xc4\xee\x2f\x7e\xab\xbe\x78\x39\x42\
+\xf2\x3a\x66\xbd\x63\x78\xf5\x34\x0c\xad\x9e\x0a\x7f\x2f\x6b\x27\
+\x41\x15\xae\x30\x11\x98\x77\xcc\x17\x61\xb1\xd2\xb8\x00\x2d\x15\
+\x0e\x1f\xda\x00\xb3\xa6\xb6\x71\x48\x04\x64\xaf\x06\xdc\xfe\xfb\
+\x25\xcc\x7a\x6d\xbb\x2e\xa2\x4f\xbe\x4e\xc1\x8a\x2a\x3c\xdb\x1a\
+\xf0\xce\xa7\xef\xe1\x48\x89\x8b\x84\xc5\xfc\xfe\xd0\x43\x40\xec\
+\xfd\xac\x27\x09\x01\x10\xc8\x8d\xa1\x00\x3c\xdf\xa2\x22\xbe\x5b\
+\xd9\x4f\x77\x19\xf7\xe8\xbb\x4a\xfd\xdf\xa5\x87\x92\xd7\x78\xb3\
+\xc1\x3f\xa4\x6a\x1a\xc6\xd4\x4a\x65\x42\x60\xab\x05\xac\xc2\xe5\
+\x68\x15\x5e\x65\x22\x70\xe7\xa9\x81\x08\xf8\x7a\x61\xec\xa8\xa6\
+\x98\x32\xa1\xa5\xdd\x22\x20\xbb\x00\xcc\x78\x75\x1b\xb6\xfd\x7e\
+\x51\x77\x3b\xa0\x90\x0a\x1d\x16\x00\x41\x25\xb3\x7f\x5d\xf4\x2d\
+\x0a\x1c\x66\xff\x9c\x33\xab\x80\x88\x2b\x42\x00\x04\xca\x91\x9d\
+\x00\xb4\xe9\xbc\x82\xb9\xd2\xd1\x92\xe7\xd3\xcc\x3f\x90\x0d\xfe\
+\xc9\x75\x53\xe0\xc8\x54\x7d\x99\xb9\x01\xf3\x4f\xf8\x22\xf4\x89\
+\xf1\x51\x26\x8c\xa1\x98\x80\x7d\x4b\x84\xb2\x0b\x40\xff\xa1\x3f\
+\xe2\xaf\x73\x59\xe6\x7f\x81\x32\x2a\xf4\xf8\x50\x63\x09\x64\x87\
+\x10\x00\x81\x3b\x62\x4e\x00\x3a\xf5\xfc\x5a\x7d\x3d\xf4\xb1\x49\
+\x9f\x7f\x04\xf3\xf9\x7d\x2c\xfa\xfc\x96\xd0\xb8\x03\x0b\x4d\xc4\
+\x04\xbc\xbd\x3d\x30\x6c\x50\x3d\xcc\x9b\x6d\x7b\x4c\x40\x76\x01\
+\x78\x69\xd0\x1a\x9c\xbf\x70\x4f\x77\x3b\xa4\xac\x46\x00\x2c\x21\
+\x04\x40\xe0\x8e\x18\x0a\x40\xa9\x92\xc1\x08\x0a\xf2\xc5\x25\x03\
+\x9f\xdf\x27\xd3\xe7\x1f\x66\x93\xcf\x6f\x09\x4d\x60\x70\xce\x51\
+\x5f\xdc\x7e\x6a\x1c\x13\x18\xdc\xdf\xf6\x3c\x01\x21\x00\x02\x81\
+\x0d\x18\x0a\x80\x29\xbc\xd8\x04\x3d\x88\x99\xfd\x13\xeb\xa4\x66\
+\xbb\xd4\x67\x1f\x2a\x5c\x8a\x56\x61\xae\x89\x98\x80\x0f\x53\x1d\
+\x5a\x1d\x98\x3d\xdd\x7a\x77\x40\x08\x80\x40\x60\x03\xd6\x08\x40\
+\xa0\x0f\xf0\x61\xcb\x64\x34\x29\x4e\x17\xb0\x3c\xcb\xde\x57\x9f\
+\x78\xe0\xf5\x13\xbe\xb8\x1e\x6d\x3c\xd6\xc7\x8d\x6c\x88\xd9\x33\
+\xda\x5b\x25\x02\x42\x00\x04\x02\x1b\xb0\x46\x00\x28\xbe\x55\xc8\
+\x0f\x78\xbb\x79\x32\x1a\x31\x11\x50\xc9\x22\x02\x2a\x5c\x61\x83\
+\x7f\xc1\x49\x1f\x5c\x67\x62\x60\x68\x09\x0c\x1d\x58\xc7\x2a\x77\
+\x40\x08\x80\x40\x60\x03\xd6\x08\x80\x96\x52\x81\x6a\xcc\x6f\x9c\
+\x8a\x26\x25\xd2\x65\x13\x81\x6b\x4f\x54\x98\x79\xd4\x17\x77\x4d\
+\xc6\x04\xea\x58\x0c\x0c\x0a\x01\x10\x08\xac\x84\x2a\x4f\x47\x8d\
+\xff\x85\x67\xb4\xea\x43\x15\x7b\xc5\xd8\xb5\x47\xfb\x58\x66\x18\
+\x5c\xb4\x25\x02\xd4\x58\xdc\x2c\x05\x0d\x8b\xc9\xb7\xc9\xcd\xc5\
+\x28\x0f\xcc\x3b\xee\x6b\x94\x36\xec\xe5\xe5\x81\x31\x23\x1a\x66\
+\x9b\x36\x2c\x04\x40\x20\xb0\x02\x4a\xee\x19\xc9\x06\x7f\x54\x54\
+\x82\x64\xa9\x8f\x06\x7f\xc3\xfa\xa5\x30\x65\x62\x4b\x9c\x3e\x73\
+\x1b\xab\x7e\xf8\x03\x09\x09\x29\x7a\x8f\x6b\xaa\xfe\xde\x7f\x4e\
+\x5e\x77\xe0\x5a\x8c\x0a\xf3\x8f\x1b\x2f\x11\xd2\xfb\x8f\x7a\xa5\
+\x81\xd9\xb4\x61\xd9\xdb\x82\x0b\x01\x10\xe4\x74\xce\xb1\x99\xff\
+\xf5\x37\x77\x49\x4a\xcf\x09\x1a\xfc\x4d\x1a\x95\x61\x03\xac\x09\
+\x0a\x17\x0e\xe0\xed\xce\xa9\xe1\x07\x55\xbc\xc6\xc5\x27\xeb\x3d\
+\x0f\x28\xea\x0f\xbc\xd1\x34\x45\x56\x77\x80\x62\x02\x3c\x59\x28\
+\x46\xea\x0e\xf8\xfa\x7a\x61\x60\xbf\xda\x98\xff\xaa\x71\x4c\x40\
+\xf6\x62\x20\x21\x00\x82\x9c\xcc\xdf\xff\xdc\xc7\xfc\x37\x76\xe1\
+\xf2\x55\xe9\x3a\x3f\x0d\xfe\xfa\xf5\x4a\x61\xfc\xe8\x66\x28\x5c\
+\x28\x40\x77\x3f\xf5\xbb\x38\x70\xe8\x3a\x56\xad\xfe\x03\xc9\x29\
+\x69\x12\x6b\x41\x89\x98\xc0\x95\xcc\x3c\x01\xc3\x25\xc2\x7c\xf9\
+\x7c\x30\x7b\xda\x0b\x18\x3a\xa8\xa1\x4a\xfa\x0a\x08\x01\x10\x08\
+\x4c\x41\xed\xe6\x27\x4c\xdb\x0c\xc3\xf4\x5e\x1a\xfc\x35\xaa\x15\
+\x63\x66\x75\x6b\x04\x06\xfa\x1a\xbd\x8e\x7a\x5f\xec\x3f\x78\x1d\
+\x2b\x57\x9d\x32\xea\x79\x51\x2c\x1f\xb0\xa4\x19\xb9\x03\xf2\xc5\
+\x04\x2e\x31\x37\xe0\xb5\xe3\xbe\x08\x8b\x91\x4e\xf8\x94\xb0\x74\
+\xee\xe4\x0c\x21\x00\x02\x81\x25\xfe\xf9\xef\x01\xa6\xcc\xdc\xc2\
+\xf7\x9e\x30\xf4\xf9\x1b\x35\x28\x8d\x89\x63\x5b\x20\x38\xd8\xcf\
+\xec\xeb\xe9\x25\xfb\x0e\x5c\xc3\xf7\x6b\xff\x44\xbc\x81\x3b\x10\
+\x94\x99\x27\xd0\xa0\x98\x7c\x31\x01\x53\xa5\xc4\x74\xee\xed\xdb\
+\x56\xc4\x97\xff\x7b\x59\x95\xf5\x4c\x08\x01\x10\x08\xf4\xa1\x68\
+\xff\xc2\xc5\xbb\x71\x85\x59\x00\xfa\xd0\x00\x6a\xdc\x90\xf9\xfc\
+\xc3\x9b\xa0\x48\xe1\x00\x8b\xc7\xa1\x0a\x58\xb2\x04\x56\xff\xf8\
+\x97\x91\x08\x14\xcf\xa7\xc6\xc2\x26\xf2\xba\x03\x97\xa2\x54\x98\
+\x71\xc4\x17\x0f\xe2\xb3\x26\xfd\x80\x00\x1f\x5c\x38\x33\x53\x08\
+\x80\x40\x60\x8a\x7f\x2f\x3e\xc4\xdc\xf9\x3b\x4c\x0e\xfe\xba\xb5\
+\x4b\x60\xd2\xf8\xe7\x50\xa8\x60\x3e\xab\x8f\x97\xc6\x44\xe0\xe0\
+\xa1\x50\x7c\xfd\xdd\x69\xee\x0e\x18\xc6\x04\x16\x34\x49\x91\x2d\
+\x63\x50\xcd\x86\xf7\x96\x50\x4f\xbc\xfb\x87\x0f\xf4\x1b\x11\x87\
+\xfe\x37\x4f\x08\x80\x40\x60\xc8\x8d\x9b\x51\x18\x3b\xf9\x57\x84\
+\xdd\x8a\x92\xdc\x4f\x83\xbf\x56\xcd\xe2\x98\x3d\xbd\x15\xf2\x9b\
+\xf0\xf9\x2d\xa1\x75\x07\xbe\xf9\xfe\x34\x92\x93\xd3\x24\x8f\x15\
+\xf1\x07\xde\x6a\x9e\xcc\x7b\x04\xca\x21\x02\xa9\x19\x2a\x0c\xda\
+\xe5\x87\x6b\x7a\x29\xc3\x6d\x5b\x55\xc4\xca\xe5\x9a\x12\x66\x21\
+\x00\x02\x01\x34\xeb\xfc\xb3\xe6\x6d\x47\xe8\x8d\xc7\x46\x6d\xeb\
+\xc8\x6c\x9e\x32\xe1\x39\x34\x69\x54\xd6\xee\xe3\x6b\x02\x83\xd7\
+\xb0\x7a\xad\xf1\x12\x61\x01\x1f\xe0\xbd\x96\xc9\x68\x28\x53\x4c\
+\x60\xd9\x79\x1f\xac\xfa\xcf\x4b\x77\xbb\x6e\xed\xe2\xf8\xf5\xe7\
+\xe1\x42\x00\x04\x02\xe2\x9f\x7f\x1f\x60\xe1\x5b\xbb\xf1\xef\x7f\
+\x0f\x4c\x3e\x4e\x16\x40\xa9\x52\xc1\x98\x35\xf5\x05\x94\x2f\x17\
+\x62\xf7\xfb\x68\x97\x08\x57\x53\x60\x50\x2f\x59\x88\x28\x19\xa0\
+\xc6\xfc\x26\xa9\x68\x2a\x43\x4c\x60\xeb\x0d\x2f\x2c\x3a\xe9\xa3\
+\xbb\x5d\xb5\x72\x61\xec\xd8\x3c\x5a\x08\x80\x40\x70\xf5\x7a\x24\
+\x66\xb3\x99\xff\xe2\x65\x69\x1b\x2f\x9a\x99\xf5\x0d\x01\x12\x81\
+\x32\xa5\x0b\x60\xd6\xf4\x17\x50\x96\xfd\x6b\x2f\x14\x18\x3c\x78\
+\x38\x14\x2b\xbe\x39\xc5\xff\x36\x8c\x09\x2c\x6c\x92\xe2\x74\x77\
+\xe0\xb7\x50\x2f\xbc\x71\x4a\x4f\x00\xaa\x30\x01\xd8\x24\x04\x40\
+\x90\xc7\x21\x9f\x7f\xd4\x84\x5f\x70\xe7\xae\xb4\x75\xb7\xaf\x77\
+\x1a\xea\x55\xba\x8b\x3f\xae\x95\x63\x83\x54\xba\x96\x5e\x9a\x0d\
+\xfe\x69\x93\x5a\xe2\x99\x8a\x85\x1c\x7a\xef\xbd\xfb\xaf\x61\xd5\
+\xea\x33\x48\x4c\x4a\x95\xdc\x4f\x55\x84\x4b\x5b\x38\x37\x26\xf0\
+\xd1\x59\x1f\xac\xbd\x94\xe5\x02\xd4\xab\x53\x02\x1b\x7f\x7a\x45\
+\x08\x80\x20\xef\x42\xe6\xfe\xdc\x85\x3b\x71\xc5\x20\xc3\xcf\xcf\
+\x27\x0d\x63\x3a\x1c\xc7\xb0\x36\xa7\xf0\xe3\x91\x46\x58\xbe\xe3\
+\x05\x24\xa7\x7a\xea\x1e\xd7\x5a\x02\x93\xc7\xb7\xc0\xb3\xcf\x14\
+\xb6\xfb\xfd\x29\x26\x40\x81\xc1\x1f\x7e\xfa\x0b\x71\x71\xd2\x98\
+\x80\x33\x4b\x89\x13\xd3\x34\x41\xc0\x9b\x7a\x49\x41\x9d\xda\x3d\
+\x8b\xe5\xff\xeb\x9b\x25\x00\xa2\x16\x40\x90\x97\xa0\x24\x9f\x45\
+\x4b\x76\xf3\x7f\xf5\xf1\xf1\x4a\xc7\xd8\x8e\xc7\x30\xba\xe3\x71\
+\xf8\xfb\xa4\x20\x25\xcd\x0b\xcb\x7f\x7f\x01\xdf\xed\x6f\x8a\xc4\
+\x64\x6f\xdd\xf3\x48\x04\x4a\x96\x08\xc2\xab\x33\x5b\xf3\xed\xbc\
+\xed\x45\x1b\x13\xf8\x7e\xcd\x9f\xdc\x12\x30\x74\x07\x5e\x6f\xec\
+\x58\x4c\x80\x96\x01\x37\x5f\xf7\xc2\xbb\x7f\x7a\x23\x35\xbb\x65\
+\x40\x51\x0d\x68\x3d\x19\xec\x47\xba\x7c\x39\x02\xc7\x4e\x86\xe1\
+\xc1\x83\xa7\xec\x4b\x96\xa7\xe3\x0b\xfd\x30\x21\x21\xf9\xd0\xa0\
+\x5e\x69\x34\x69\x5c\x16\x9e\x1e\x8a\x6d\x19\x9f\xab\x09\x65\x66\
+\xff\xb4\x59\xbf\x19\xe5\xf6\x7b\x7b\x65\x60\x68\xeb\xd3\x98\xd5\
+\x7b\x1f\xbc\x3c\xb2\x46\x4b\x72\x9a\x37\xbe\xdc\xd9\x12\x2b\x76\
+\xb5\x94\xb8\x03\x5a\x4b\x60\xf6\xf4\x17\xf8\xbf\xf6\x42\x05\x44\
+\x24\x02\x2b\xbe\x39\xc9\xad\x02\x7d\x11\xc8\x2a\x25\xb6\xc7\x1d\
+\x50\xf1\xbd\x04\xc6\xed\xf7\xe5\x7b\x0e\x6a\x09\x0c\xf0\xc5\xdf\
+\x67\x66\x08\x01\xb0\x87\x2b\x57\x1f\xe1\xbd\x8f\x0f\xf2\xbd\x0d\
+\x2d\xed\x5c\xec\x2c\xe8\x42\xab\x56\xa5\x28\x9f\x6d\x9a\x32\x21\
+\xf0\x10\x42\x60\x37\x54\xcd\x47\xeb\xfc\x86\x3e\x3f\x99\xfd\xa3\
+\xda\x9f\xc0\x94\x6e\x87\xd8\xf7\x6d\xfc\xbb\xa6\xa6\x7b\x61\xf5\
+\x81\x26\xf8\x70\x4b\x3b\xa3\x98\x00\x35\x05\x9d\x36\xb9\x25\x9e\
+\xad\x64\xbf\x3b\x40\x90\x3b\x60\x58\x4a\x4c\x14\xf0\x05\xde\xb3\
+\xa3\x94\x98\xba\x04\x51\x3d\xc0\xb5\x27\x52\xd1\xea\xdb\xbb\x16\
+\xde\x5d\xd2\xd5\x85\x02\x40\x6d\xc1\x3f\xb2\xfc\x3a\x77\x12\x00\
+\x12\x65\x6a\x6d\x3e\x73\xee\x76\xbe\xb7\xa1\x9c\xdb\x9b\x99\x83\
+\x2a\xce\x66\x4e\x79\x1e\x7d\x7a\xd5\x12\x22\x60\x07\xb4\xd4\x47\
+\x25\xbd\x97\x0c\xa2\xfd\x5a\x9f\x7f\x34\xfb\xbf\x9f\x4f\x8a\xd9\
+\xd7\x93\x3b\xb0\x72\xcf\x73\xf8\x6a\xd7\x73\x48\x4a\xc9\x0a\xa8\
+\x69\x2d\x01\xca\x13\x78\xa6\x92\xfd\x81\xc1\xec\x4a\x89\x29\x59\
+\x68\x71\xd3\x14\x34\xb6\xd2\x1d\xa0\x7e\x81\x6f\x9e\xf2\xe5\xa9\
+\xc0\xfa\x97\x6a\x81\x60\x3f\xfc\x75\x62\xba\x71\x31\x90\x9c\x02\
+\x30\x72\xdc\x2f\x38\x72\xfc\x86\xee\x76\x50\x71\x15\xba\x2e\x65\
+\xfe\x56\x60\xf6\xaf\x73\x27\x01\xa0\xf8\xc8\xa4\xe9\x5b\x70\xf5\
+\xfa\x23\xc7\x0f\xe6\x00\x45\x0a\x07\xe2\xa3\x77\xbb\xa1\x59\x93\
+\x72\x2e\x3d\x8f\x9c\x06\x25\xf9\xcc\x67\x83\xdf\x70\x9d\x9f\xcc\
+\x7e\xf2\xf9\xe9\xff\xd9\x0d\x7e\x2d\xba\x98\xc0\xbe\x66\x48\x34\
+\x10\x01\xb2\x04\xe6\xcc\x6c\xe5\xd0\x12\xa1\xae\x94\x98\x59\x02\
+\x94\x31\x68\x7b\x29\xb1\x8a\x97\x01\xcf\x3e\xe6\x8b\xab\xd1\xc6\
+\x2d\xc2\x46\x8f\x68\x88\x69\x13\x5b\x2b\x2b\x00\x9f\xaf\x38\x8e\
+\xff\x2d\x3f\xa6\xbb\xed\xe5\x03\x54\xef\xa6\x42\x8d\x1e\x4c\x04\
+\xb2\x49\xa9\x76\x17\x01\xa0\x2f\x71\xc1\xe2\xdd\x58\xbf\xf1\xbc\
+\x53\x8f\x6b\x2f\x75\x6a\x95\xc0\x86\xb5\x43\x84\x15\x60\x25\xb4\
+\xd4\x37\x69\xfa\x66\x5c\x0b\x95\x36\xf3\xa0\x80\xdf\x90\x56\x67\
+\xf0\xea\x8b\x7b\x4d\x9a\xfd\xe6\x48\x49\xf3\xc6\x57\xbb\x5b\x70\
+\x21\x30\x74\x07\xca\x96\x09\xc1\xcc\xa9\xcf\xa3\x5c\x59\xfb\x93\
+\x85\xb2\x2b\x25\xa6\x02\xa2\xc5\xcd\x53\xd0\xc8\x4c\x7b\xb1\xbb\
+\x71\x1e\x98\x75\xc4\x97\x57\x02\xea\x0f\x7e\x8a\x1f\xf5\x7f\xa9\
+\x26\x16\x2f\xec\x66\xba\x21\x88\x9c\x02\x40\xbb\xa5\xbc\x32\x66\
+\x3d\x1e\x46\x64\x35\x52\x54\xb1\x13\xf2\xf0\xd4\xbe\xbb\x19\xac\
+\xb0\xb2\x33\xd8\xf7\xa0\xce\x90\x57\x00\xe8\xfc\x69\xad\x38\xfc\
+\x5e\x8c\xee\xbe\x42\x15\x55\x68\x32\x02\x28\x58\xde\xf2\x0e\x47\
+\xf6\x42\x3f\x60\x1c\x33\x38\xce\xad\x03\x6e\x9d\xce\xfa\x8c\xd4\
+\xe7\xed\xfb\xaf\xfa\xf1\xc0\xa0\x20\x7b\x2e\x5f\x79\xc4\x37\xa6\
+\xa5\x7a\x7e\xc9\x8e\x3d\xcc\xec\x1f\xdd\xfe\x38\x26\x76\x3d\xc2\
+\x06\x87\xed\x75\xf9\x64\x09\xac\x39\xd4\x04\x1f\x6c\x6e\x67\x14\
+\x18\x24\x4b\x60\xca\xc4\xe7\x50\xd9\x81\x25\x42\x62\xdf\xfe\x6b\
+\xf8\x6e\xed\x1f\x88\x8f\x37\x6e\x2f\xf6\x81\x89\xb4\x61\x32\xfb\
+\x17\x9e\x30\x3d\xf8\x87\x0f\xa9\x87\x79\x73\x4c\x77\x08\x96\x5d\
+\x00\xc8\xb7\xf9\x7e\xcd\x1f\xf8\xf0\x7f\x87\xb9\x89\x23\x27\x72\
+\x08\xc0\x7e\x66\x92\x4d\x9d\xf5\x9b\xa4\x88\xa3\xc5\x04\x15\x9e\
+\x69\x25\xeb\x47\xd1\x11\x15\x06\x6c\x9b\x23\xad\x47\x9f\x31\xe5\
+\x79\x8c\x1b\xd5\x54\x99\x13\xc8\xa1\x5c\xa0\xf4\xde\x25\xbb\xf1\
+\xdf\x45\xa9\xd9\xef\xe7\xcd\x7c\xfe\x8e\xc7\x31\xaa\x83\x66\xa9\
+\xcf\x5e\x28\x30\xf8\xc5\xce\xe7\xf1\xed\xde\x66\x46\x4b\x84\xa5\
+\x4b\x51\x60\xf0\x79\x54\xaa\x50\xd0\xee\xe3\x6b\x4b\x89\x4d\xc5\
+\x04\x8a\x31\x4b\x60\x91\x5e\x29\xf1\x35\x36\xf8\xdf\x30\xe1\xf3\
+\x7b\x7b\x7b\x62\x40\xdf\x9a\x58\x34\xbf\x8b\xeb\x9a\x82\x12\x49\
+\x49\x69\x58\xf2\xee\x3e\x6c\xd9\xf6\x1f\x52\x52\xd2\x1c\x3f\xa0\
+\x19\xe4\x10\x80\xed\x3b\x2f\xf1\x0d\x4e\xf5\x67\x90\x0e\x0b\x55\
+\x28\x51\x53\xb6\x8f\x21\x21\x25\x1e\xf8\x79\xb8\x54\x00\x46\x0e\
+\x6b\xc4\x57\x05\x04\xa6\xa1\x6d\xba\xe6\x2d\xda\x69\x34\xf8\xc9\
+\xec\x1f\xd9\xfe\x04\x26\x76\x39\x02\x5f\xef\x54\x3b\x8f\x9e\x05\
+\xb9\x03\xcb\x7f\x7f\x1e\xab\xf6\x35\x33\x0a\x0c\x92\x08\xcc\x9e\
+\xe1\x78\x4c\x80\xd2\x86\xbf\xf9\xee\x34\x52\x4c\x94\x12\x53\x4c\
+\xa0\x4c\xfe\x0c\x4c\x67\x66\xff\x75\x83\x99\xdf\x87\x0d\xfe\xde\
+\xdd\xab\x62\xe9\x92\x1e\xae\x6d\x0b\xae\xff\x61\xd6\xfc\xf4\x17\
+\xbe\x5d\xfd\x87\xc4\x1d\x70\x26\xb2\x08\xc0\xef\x97\x30\xfd\xd5\
+\xad\x92\xfb\x3a\x32\x01\x28\xae\x90\x00\xa4\x26\x00\x3f\xbd\x22\
+\xf5\x87\x46\xbe\xd2\x18\x73\x85\x00\x98\x84\x7c\xfe\x71\x53\x7e\
+\x85\x7e\x62\x1b\xe1\xeb\x9d\xce\xd7\xf9\x67\xf7\xde\x67\x93\xcf\
+\x6f\x09\x72\x07\xbe\xd9\xdb\x02\x9f\x6d\x6f\x65\x14\x13\x28\x53\
+\x26\x04\x33\x26\xb7\x44\x85\xf2\xf6\x5b\x02\xba\x52\x62\x26\x02\
+\xc9\x06\x93\x67\x88\x1f\x10\xec\xa3\xc6\xad\xa7\xc6\x66\xff\xc0\
+\x97\x6b\xe1\x8d\x05\x5d\x2d\x3a\xa8\x8a\x09\x80\xe6\xc3\xa8\x11\
+\xf9\x38\x01\x47\x8f\xdd\xc0\xb9\x0b\xf7\x90\x98\x68\x5e\x85\x63\
+\x62\x93\x60\x69\xb5\xed\x9f\x7f\xef\x23\x2a\x3a\x41\x77\x5b\x08\
+\x80\x79\xe8\xbb\x4e\x49\x95\xaf\x0f\x9d\x3b\x40\xa5\xbc\xaf\xb1\
+\x99\x9f\x44\xc0\xd0\xe7\xa7\xa5\xbe\x71\x9d\x8e\xc2\xdb\xcb\xf9\
+\x16\x28\x25\x0b\xfd\x70\xa0\x09\x3e\xd9\xda\x06\xa9\x69\xd2\x16\
+\x5c\x64\x09\x4c\x9e\xe0\x58\x4c\x80\x3e\xcb\xbe\x03\x9a\x2a\x42\
+\x89\x3b\xa0\x7d\x5c\xef\xb9\x96\x7c\x7e\x43\x34\x02\x40\xa9\xc0\
+\xb7\xb2\x1a\x1f\x36\xa8\x57\x0a\xeb\x7e\x18\xec\xf4\x2f\xca\x16\
+\x2e\x5d\x89\xe0\x11\xd1\xec\x78\xf3\xed\x3d\x38\xf7\x77\x56\x8e\
+\x41\xb1\xa2\x81\x38\xb6\x7f\xa2\x53\xcf\x63\xdb\x8e\x8b\x98\x31\
+\x77\x9b\xe4\xbe\x0e\x0b\x80\x12\xb5\xe4\x89\xfe\xd1\x75\x9b\x9a\
+\xa8\xe6\x03\xdf\x37\xbf\x0a\x19\x69\x6a\xe6\x02\x48\x9f\x33\x82\
+\xb9\x00\xf3\x66\xb5\xb1\xfa\x98\x24\x92\x11\x8f\xe2\x78\x3c\x26\
+\x37\x42\xdf\xd9\xb5\xd0\x47\xf8\xea\x9b\x53\x5c\x04\xf4\xf1\xf1\
+\x22\x9f\xff\x18\x5f\xe7\xcf\xe7\xeb\xb8\xd9\x6f\x8e\x94\x34\x4f\
+\x3d\x77\xc0\x47\xf2\x18\x95\x12\xcf\x9c\xfa\x02\x2a\x94\x0b\xe1\
+\xa2\x60\x0f\xb4\x22\xa0\x2d\x25\x4e\x30\x33\x71\x92\xcf\xdf\xbf\
+\x6f\x2d\x2c\x7a\xbd\x93\x6d\x9b\x83\xca\x59\x0c\x64\x2f\x97\xaf\
+\x3e\xb2\x98\x6d\xb7\x78\xe9\x5e\xde\xbf\x4d\x4b\x6e\xb0\x00\x9e\
+\xdc\x05\xfe\x5a\xa3\x59\x01\x28\x5a\x15\xa8\xd1\x0d\xd8\x3c\xcd\
+\x31\x0b\x80\x06\x45\x52\xb2\x7c\xb1\x17\x57\x43\x51\x7e\x5a\x6a\
+\xd6\xb7\x62\x09\xf2\xf9\x5f\x69\x7b\x0a\x53\xbb\x1f\xe4\x42\x20\
+\x37\x64\x09\x7c\xc1\x44\xe0\x9b\xbd\xcd\x99\xb5\x65\x5c\x40\xe4\
+\x8c\x52\xe2\x3d\xfb\xae\xe1\xab\x6f\x4f\x1a\x3d\xe6\xed\xe5\x89\
+\x01\x2f\xd7\x65\x83\xbf\x83\x4d\x0a\x23\x04\xc0\x02\x4a\x0a\xc0\
+\xe3\x9b\xc0\xd1\xcf\x98\xfb\x13\xae\x19\xf0\x34\x59\x54\x61\xbf\
+\xe7\xe5\xdd\x42\x00\xcc\x41\xcb\xb3\x4b\xde\xd9\x67\xb4\x5f\x1f\
+\xf9\xfc\xc3\xdb\x9e\xc4\x8c\x9e\x07\x9c\xea\xf3\x5b\x82\x62\x02\
+\xdf\xed\x6f\xc6\xdd\x01\x53\xa5\xc4\xd3\x27\xb5\x44\x25\x3b\x4b\
+\x89\x29\x4d\xf8\x9b\xef\xce\xe0\xc0\xe1\xeb\x46\x8f\xbd\xfc\x62\
+\x1d\xbc\xb3\xb8\x8b\xcd\xe6\x85\x10\x00\x0b\x28\x25\x00\x8f\x6f\
+\x00\xc7\x97\x6b\x2c\x00\x49\xb4\xb7\xae\x0a\xe1\xe7\x1d\x13\x80\
+\xd8\xa7\xc9\x3c\xf0\xaa\x69\x4a\xe9\xdc\xf3\x76\x25\x24\x6c\x9f\
+\x7d\x71\x0c\xb7\xef\x3c\x31\xe9\xf3\x93\xe9\xef\x8c\x68\xbf\xad\
+\x90\x25\x40\xd9\x82\x9f\x9b\x28\x25\x2e\x5d\x3a\x18\x53\xc6\x3f\
+\x67\x73\x29\xf1\x53\xf6\x1b\x52\xff\x80\x23\xc7\x6f\x1a\x8d\x0b\
+\xca\x0c\x5d\xbb\x6a\xa0\x5d\xbe\x85\x10\x00\x0b\x28\x21\x00\xb1\
+\xf7\x80\x83\x1f\xb1\x99\xff\xae\x5a\xba\x8e\xeb\xa7\x42\xbd\xfe\
+\xc0\x99\xef\x1d\x0f\x02\xa6\xa4\xa4\xcb\x9e\x87\xa1\x14\xf4\x6d\
+\x50\x00\xf8\xad\x77\xf7\x19\x75\xef\x35\x2c\xe9\x75\x15\x64\x09\
+\x2c\xdb\xd1\x8a\x0b\x81\xa1\x08\x94\x2c\x19\x84\x39\x33\x5a\xa3\
+\x9c\x95\xa5\xc4\x09\x09\xa9\xf8\x7a\xd5\x29\x1c\x3d\x71\x53\xf2\
+\x1b\x52\x36\x68\xb5\x2a\x45\xb0\x75\xe3\x48\xbb\x03\x52\x42\x00\
+\x2c\x20\xb7\x00\x3c\x7d\x00\x1c\xfe\x44\xcd\x13\x7e\xf4\x07\x3f\
+\x65\x4a\xd6\xea\xad\x42\xd5\x8e\xc0\xfa\xd1\x62\x19\x50\x9f\xeb\
+\x6c\xe6\x9f\x3e\x67\x2b\x2e\x5f\x31\x53\xd2\xdb\x6b\x1f\xbc\x3c\
+\x5d\xbd\xe2\xa1\xc2\x8e\x3f\x6b\x62\xe1\x4f\xdd\x10\x9b\x20\xed\
+\x24\x6c\x4b\x4c\x80\x84\x7b\xc5\xd7\x27\x71\xf8\xd8\x0d\xc9\x78\
+\xd0\x54\x89\x16\xc6\xb6\x5f\x47\x39\x14\x8d\x16\x02\x60\x01\x39\
+\x05\xe0\xc9\x1d\xe6\xf3\x2f\xa3\x6c\x3f\xe9\x00\x57\x79\x00\xf5\
+\xfb\xab\x50\xbd\x1b\x90\x9e\x22\xf2\x00\xf4\xb9\x16\xfa\x18\x63\
+\x27\x6d\x34\x2e\xe9\xf5\x4e\xc3\x88\xf6\x27\x30\xad\xfb\x21\x45\
+\x7d\x7e\x53\xa8\xd5\x1e\xd8\x7d\xae\x1a\x5e\x5d\xdd\x0b\x09\x7a\
+\x59\x82\x86\xd0\xea\x00\xb5\x17\x33\x57\x4a\x1c\x17\x9f\xc2\x67\
+\xfe\xc3\x47\x6f\x18\x3d\xd6\xa0\x1e\xd5\x84\xbc\xe2\xf0\x52\x94\
+\x10\x00\x0b\x58\x25\x00\x6c\x7c\xa6\x25\x03\x5e\x24\xf4\x56\xfe\
+\x24\x31\xec\xb4\x8f\x7d\xae\xf1\xfd\xf5\xfd\x57\x4f\x76\xbd\xd4\
+\xec\xa1\x42\xad\x3e\x9a\xbf\x45\x22\x50\x16\xbc\xa4\xf7\x8d\x9d\
+\x7c\x89\x58\x1f\x8d\xcf\x7f\x2c\xb3\xa4\x57\x79\x9f\x5f\x9f\xf4\
+\x0c\x4f\xec\x3d\x5f\x15\xf3\x7f\xec\xce\x66\x7e\x3f\x83\xc6\xa2\
+\xc6\x8d\x46\x4b\xf3\x52\xe2\x16\x46\x22\x40\x3e\xff\xb7\xcc\xe7\
+\x3f\x6a\xe0\xf3\xd3\x6b\xea\xd5\x29\x8e\x5f\x7e\x74\x7c\xf0\xf3\
+\xe3\xd1\x7f\x94\x14\x00\x5a\xdb\xa7\xa0\x14\x15\x39\xd0\x85\x6f\
+\x2e\x26\x45\x01\x1e\x4b\x79\x00\x14\x00\xd2\x4f\xf7\x74\x85\x00\
+\x24\x3f\x05\x2e\xee\x00\x1e\x5e\x02\x42\xca\xd1\xe0\x05\x02\x2c\
+\xc4\x77\xe2\x23\x35\x3e\x7f\xd4\x0d\xa9\xcf\x4f\x03\xbe\x6a\x27\
+\xf6\x03\xf7\x63\x7f\x67\x2e\x25\x0b\x01\xd0\x40\x3b\xf6\x2c\x58\
+\x6c\xbe\xa4\x97\x02\x7e\xae\xf4\xf9\x89\x0c\x9a\xf9\xcf\x56\xc3\
+\xe2\xf5\x5d\x10\x19\x9b\xb5\x75\x18\x0d\xfc\x40\xbf\x64\xd4\xad\
+\x10\x8e\x33\xd7\xca\x99\x8c\x09\xf0\xf6\x62\x99\xee\x00\xb5\x07\
+\xfb\xea\xeb\x53\x38\x76\xd2\xd8\xe7\x7f\xa6\x52\x41\xec\xdc\x32\
+\xc6\x69\x49\x28\x8a\x0a\x40\xf4\x93\x44\xfc\xbc\xe1\x3c\xf6\xee\
+\xbf\xca\xcb\x33\xc9\xbf\x71\x66\x73\x0d\x57\x08\xc0\xdf\x1b\xe9\
+\xff\x6c\x20\x67\xfe\x4e\x25\x6a\xaa\xd0\x7c\x1c\xfb\xc1\x8b\x9a\
+\x3e\x1e\x0d\xfe\xa3\x9f\xa9\xf1\xf0\xb2\xf4\x7e\xba\x48\xa8\x4c\
+\xba\xee\xcb\x99\x96\x44\x26\x42\x00\x32\x4b\x7a\x67\x6c\xc1\xb5\
+\xeb\x86\x01\xbf\x0c\x0c\x6e\x75\x9a\x97\xf4\x7a\xb8\xd8\xec\x27\
+\xf6\x9c\xab\x8e\x05\x3f\x76\x43\x54\x9c\xb4\xce\x9d\x2c\x94\xa9\
+\x3d\x0e\xa2\x7e\xc5\x3b\xd8\x7c\xaa\x2e\x7e\x39\x56\x8f\x59\x0a\
+\x26\x4a\x89\xa7\xbd\x80\xe2\x45\x03\xf1\xd5\xb7\xa7\x70\xe8\x48\
+\xa8\xd1\x04\x58\xb3\x7a\x51\xfc\xf6\x8b\xfd\x01\x3f\x53\x28\x26\
+\x00\x7f\x9d\x0b\xc7\xbc\x85\xbf\x23\xec\x56\xb4\x6c\x1d\x75\x5c\
+\x21\x00\xfb\x96\x42\xb2\x4c\x47\x03\x39\xb8\xb4\x0a\x2f\x4c\x03\
+\x0a\x94\x91\x1e\x8b\x02\x7e\x47\x99\xd9\x1f\x79\x4d\x6d\x64\x1a\
+\xd6\xea\xa3\x42\xed\xde\x59\x33\xbf\x96\xbc\x2e\x00\xe4\x0a\x52\
+\x3d\xbf\xa9\xa5\xbe\x51\xed\x8f\x63\x52\xd7\xc3\xf0\xf4\xa0\xfb\
+\x5d\xb7\xbe\x49\x33\x3f\x99\xfd\xb3\xbf\xeb\x83\xa4\x54\x2f\x69\
+\x17\x9e\x80\x24\x8c\xeb\x7c\x04\x4d\xab\x84\xf1\x73\x4c\x4b\xf7\
+\xc4\x8e\x3f\x6b\xe1\x87\x03\x8d\x25\x22\x40\x96\x40\x89\xe2\x41\
+\x28\xca\x04\xe0\xef\x0b\xf7\x8c\xc6\x48\xc3\xfa\x25\xb1\x7e\xcd\
+\x30\xa7\xa7\x9f\x2a\x22\x00\x54\x9d\x35\x6e\xca\x26\xd9\xdb\x69\
+\xb9\x42\x00\xfe\xd9\xc2\x2c\x80\x0d\xcc\xf7\x4b\x93\x56\xec\x05\
+\x95\x04\x9e\x9b\x04\x14\xae\x08\xfe\x2d\xc7\x3f\xd2\x0c\x7e\x6a\
+\x60\xa2\xd6\x9b\xac\x3c\xbd\x54\xa8\xdc\x1e\x68\x30\xc8\x78\xf0\
+\x13\xce\x10\x00\x5a\xff\x8f\x8c\x8c\x47\x42\x92\xb2\xfe\xb1\xa7\
+\x87\x07\x0a\x86\xe4\xe3\xfb\xd2\xdb\x03\x95\xf4\x92\xd9\x7f\xf1\
+\x92\x41\x1b\x2f\x6f\x4d\x7a\xef\xa8\x0e\x27\x5c\x6e\xf6\x93\xcf\
+\xbf\xe7\x5c\x55\x2c\xfa\xb9\x1b\x9e\xc4\xfb\x4b\x06\x7f\x48\x60\
+\x22\x2f\x3b\x6e\x56\xf5\xa6\xc4\x42\x21\x11\xd8\x78\xa2\x3e\x36\
+\x9f\xac\x23\x71\x07\x4c\xc1\x37\x25\xad\x55\x1c\x1b\x7f\x76\x8e\
+\xcf\x6f\x74\x7c\xfa\x8f\x9c\x6d\xc1\x63\x62\x92\x30\x73\xde\x76\
+\x1c\x3e\x1a\x2a\xc7\xf9\x4b\x70\x85\x00\xa4\xc4\x31\xeb\xe6\x47\
+\xe0\xfa\x21\x35\x6f\x50\xa2\x4f\x70\x49\x15\x9a\x8d\x01\xf2\x97\
+\xd0\x64\xf8\x3d\xbc\x24\x1d\xfc\x1e\x6c\xf0\x3f\xcb\xc6\x71\xc3\
+\x21\xcc\xec\x37\xb3\xd5\xbc\x33\x04\x20\x3c\x3c\x06\x31\x4f\x93\
+\x5d\xd2\xcb\x90\xf2\xd3\xc9\xb7\xa5\x96\x54\xb6\x70\x91\x4d\x1a\
+\xaf\x2f\xda\xc9\x7c\x7f\xc3\x92\xde\x0c\x3e\xf3\x8f\xef\x72\x84\
+\x09\x81\x6b\x03\x7e\x19\x99\xd1\xfe\x25\xeb\xba\xe0\x91\x81\xcf\
+\x9f\xcf\x37\x85\x5b\x27\x4d\xaa\x84\x99\x74\x4f\xa8\x9f\xc0\x86\
+\x63\xf5\xb1\xf5\x74\x6d\xb3\x22\x40\x3e\x7f\xcd\x1a\x25\xb0\x79\
+\x9d\xf3\x67\x7e\xdd\xb9\xd2\x7f\xe4\xac\x06\xa4\x1d\x50\xa6\xcc\
+\xda\x22\x09\x66\xe4\x2f\xa6\x42\xf9\x66\xec\xe2\xf0\x37\xff\xba\
+\xc4\x27\xb0\x98\xb5\x76\xf7\x4f\x20\x2e\x52\xde\x8e\x40\xd6\xac\
+\x02\xa4\xb1\x49\xe8\xfc\x3a\x76\xd1\xfe\x2e\x1d\xe0\x84\x7f\x88\
+\x0a\xf9\x0a\x50\x9a\xaf\xf1\x87\xa9\xda\x51\x85\xfa\x03\xb3\xff\
+\x1e\x9c\x21\x00\x57\xaf\x3d\x42\xaa\x8b\x92\x80\x68\x30\x50\x97\
+\x9c\xe0\x20\x3f\xab\x5f\x43\xad\xbb\x27\x4c\xdd\x64\x9c\xdb\x4f\
+\x25\xbd\xcc\xe7\x9f\xd3\xc7\xb9\x25\xbd\x76\x7e\x32\xec\x3a\x4b\
+\x3e\x7f\x77\x36\xf3\x4b\x3f\x1b\x15\x1d\x4d\xee\x76\x08\x4d\xd9\
+\xcc\x9f\x5d\x13\x4f\x12\x81\x1f\x0f\x35\xc2\x16\x26\x02\xa6\x9e\
+\x46\x2d\xe1\x37\xac\x1d\x22\x6b\xef\x37\xd9\x05\x60\xce\xeb\x3b\
+\xb0\x79\xeb\xbf\xba\xdb\xfe\x05\x54\x68\x3b\x97\xda\x6a\x65\xff\
+\x3a\x77\xe9\x09\x68\x6d\x1e\x80\x9a\xcd\xfe\x17\x36\x01\xff\x6e\
+\xa5\x25\xc1\xec\x95\x8b\x06\x05\x8f\xf6\xf7\xcf\x7e\xf0\x13\x4e\
+\xb1\x00\xee\xc5\x66\x96\x57\xbb\xc8\x02\x28\xc3\x2c\x00\x5f\xeb\
+\x2c\x00\x9a\xf9\x29\xc9\x87\x2c\x52\xa3\x36\x5e\xcc\x9c\x1e\xdf\
+\xf9\x28\xbc\x3d\x5d\x5b\xd7\x90\x91\xe1\x81\x7d\x17\xaa\x60\x16\
+\xf9\xfc\x29\xde\x52\x9f\x9f\x99\xfd\xb4\x2a\x61\x69\xf0\x13\x61\
+\x11\x85\xf1\xbf\xad\xad\x71\x33\xa2\xa0\x91\x00\x38\x92\xde\x6b\
+\x0b\xb2\x0b\xc0\x80\x61\x3f\xe2\xcf\xb3\x77\xb3\xbe\xa0\xd2\x2a\
+\xf4\xf8\x80\xbd\x71\xf6\xae\x4f\x8e\x13\x00\x22\x9d\x59\xa4\x97\
+\x77\x31\x21\xf8\x95\xb9\x06\x09\xa6\x7f\x7c\x0f\x36\x0e\x2a\xb6\
+\x50\xa1\xc9\x48\xf3\x66\xbf\x3e\xce\x89\x01\x64\x20\x2a\x2a\x33\
+\x06\xa0\xa0\x06\x78\x7a\x7a\x20\x24\xc4\x1f\xf9\x03\xad\x8b\x01\
+\x90\xcf\x4f\x3b\xf6\x18\x9a\xfd\x54\xd8\x33\x96\xfb\xfc\xae\x4d\
+\xef\x25\xd2\x33\xc8\xec\xaf\x8e\xc5\xcc\xec\x7f\xfc\x54\x1a\xed\
+\x2f\x10\x90\xc8\x53\x90\x0d\x7d\x7e\x63\x54\xb8\xfd\x28\x04\x9f\
+\x6d\x6b\x8d\xd0\x07\x85\xa5\x4b\xc1\xec\x3b\x6b\xd4\xa0\x34\x7e\
+\xfc\x6e\x90\x22\x5d\x5f\xc5\xc6\x20\x16\xb0\x35\x13\x30\x83\x4d\
+\x4e\xa1\x87\xd9\xb9\xad\x66\x17\x4b\xb2\x41\xb4\xdf\x03\xa8\xd0\
+\x42\xd3\x50\xd4\x27\x00\x56\x91\x57\x56\x01\x28\xda\xff\xea\xfc\
+\x1d\x46\x01\x3f\xca\xed\x1f\xde\xf6\x14\xa6\x74\x3f\xc4\xfe\x76\
+\xad\xcf\xaf\x56\xab\xf8\xe0\x7f\x73\x9d\xf1\x3a\x3f\x05\x26\xa7\
+\xf6\x38\x80\xc6\x95\x6f\x59\x1c\xfc\x11\x31\xf9\xb1\xf4\x97\x8e\
+\xb8\xc5\x66\x7e\x49\xed\x87\x97\x27\x7a\x74\xad\x8c\xf7\x97\xf6\
+\x52\xac\xe5\xb3\x10\x00\x0b\xd8\x95\x0a\xcc\x4e\xe9\xd6\x19\xe0\
+\xc4\x0a\xea\xe9\x97\x75\x7e\xcf\xb4\x52\xa1\xd1\x30\xeb\x07\x3f\
+\x91\x17\x04\x80\xd6\xf9\xc7\x4c\xda\xc8\xeb\xfa\xf5\xa1\x99\xff\
+\x95\x36\x27\x31\xb3\x97\xb2\x25\xbd\xa6\xa0\x7d\xf6\x76\x33\x9f\
+\xff\xb5\x35\x3d\xf0\x34\x51\x6a\xd1\x04\xfa\x27\xf3\x0e\xc3\xcd\
+\xaa\xdc\x84\x25\x13\xeb\x6e\x64\x08\x3e\xda\xd2\x0e\x37\x1f\x4a\
+\xdb\x84\x51\x27\x9f\xc1\xfd\xeb\x60\xe1\xeb\x9d\x15\xed\xf7\x2e\
+\x04\xc0\x02\x76\xd7\x02\xb0\xd3\xba\x7b\x1e\xf8\x77\x0b\x90\x1c\
+\x0b\x94\xac\x03\xd4\x79\xc9\xb6\xc1\x4f\xe4\x76\x01\xa0\x0c\x3f\
+\x8a\x13\x5d\x0f\x8d\x34\x59\xd2\x3b\xb6\xd3\x31\x97\xcf\xfc\x64\
+\xf6\xef\xfb\xbb\x2a\xe6\xfe\xd0\x0b\xf1\x49\x3e\x46\x4b\x7d\xa3\
+\x99\x7b\x42\x83\x5f\xa5\xca\x7e\xf0\xdf\x7c\x58\x18\x9f\xef\x68\
+\x85\x1b\x0f\x0a\xd9\xd4\xba\x5b\x4e\x84\x00\x58\xc0\xd1\x62\x20\
+\x1a\xfc\xa9\xc9\x40\xbe\x10\x8d\xff\x6f\x2b\xb9\x59\x00\x28\xb7\
+\x7f\xe1\x5b\xbb\x8d\xd2\x7b\x7d\x32\x7d\xfe\xd1\x6e\xe4\xf3\x2f\
+\x59\xdf\xd9\xc8\xec\x0f\xf2\x4f\xc2\x18\x26\x50\xd6\xf8\xfc\x77\
+\x22\x0b\xe0\xd3\xad\x6d\xd8\xe0\x97\xfa\xfc\x3e\x3e\x9e\x78\xb1\
+\x67\x75\xbc\xf5\x46\x37\xc5\x07\xbf\xe6\xcc\x20\x04\x20\x3b\x4c\
+\xb6\x05\x9f\xaf\x42\x89\xda\x4e\x7d\x1b\xb3\x50\xad\xc1\xba\x91\
+\xd2\x24\xa3\x51\x4c\x00\xe6\xcc\x68\xa5\xcc\x09\xc8\x04\x55\xf5\
+\xcd\x64\xc2\x6a\x58\xd8\xe3\xc3\x4b\x7a\x4f\x61\x46\xaf\xfd\xf0\
+\x76\x83\x92\x5e\x5a\xe7\x5f\xf4\x73\x57\x3c\x36\x18\xfc\x14\x9b\
+\x98\xd1\x73\x3f\x1a\x59\xe9\xf3\xbf\xc3\x7c\xfe\x30\x03\x9f\xdf\
+\xcb\xd3\x03\x2f\xf6\xaa\x8e\xa5\x8b\xbb\xbb\x6c\x9b\x27\x21\x00\
+\x16\x38\x76\x22\x8c\xa7\xa2\xc6\xeb\xed\xda\xda\x60\x90\x0a\x35\
+\x7b\x3a\xf5\x6d\xcc\x72\xef\x02\xb0\xf7\xad\xac\xcf\x48\xc9\x21\
+\xf3\x5f\x6d\x87\x21\x03\xeb\x2b\x73\x02\x32\x40\xbb\x2d\x8d\x31\
+\x57\xd2\xdb\xee\x24\xa6\xf5\x38\xe8\x7a\x9f\x3f\x33\xc9\x67\xee\
+\x0f\x3d\xb9\xd9\xaf\x4f\x50\xbe\x24\x4c\xe8\x42\xe9\xbd\x37\x2d\
+\x1e\xe7\xf6\xa3\x82\xf8\xf8\xb7\xb6\x08\x33\xe1\xf3\x0f\x1b\x54\
+\x17\xaf\xcf\xb5\xbe\x81\xa7\x1c\x08\x01\xb0\xc0\xc3\x88\x38\x8c\
+\x18\xb7\x81\x27\xd3\x68\xa1\x5c\x86\x2a\x1d\x80\x82\x15\xe4\xdb\
+\x1a\x8c\x62\x08\x4f\x1f\x02\x57\xf7\x02\x4f\xc2\xf5\x7c\x63\x3f\
+\x6f\x6c\xd9\x30\x0c\x95\x2a\xd8\xbf\x13\xad\x2b\xf9\x87\x99\xfb\
+\xd4\xba\xfb\xb2\xc9\x92\xde\xe3\xdc\x9f\x76\x75\x86\x9f\xae\xa4\
+\x77\x6d\x77\xc4\x26\xfa\x99\x4c\xef\x6d\x4e\xeb\xfc\x16\x44\x8a\
+\x7c\xfe\xe5\x3b\x5e\x30\xb9\xd4\x37\x6c\x50\x1d\xbc\xfe\xaa\x6b\
+\x07\x3f\xa1\x6b\x0b\x7e\x43\xa6\x54\xe0\x9c\x2e\x00\xc4\x97\x5f\
+\x9f\xe4\x5d\x67\x2d\xf5\x27\x90\x1b\x9a\xfd\x3b\x77\xa8\x8a\x4f\
+\x3f\xe8\xe1\xd2\xf3\xb0\x17\xf2\xf5\x17\x2c\xd9\xed\xf6\x25\xbd\
+\x94\xe1\x67\xca\xe7\xa7\x92\x5e\x4a\x44\x6a\x6a\x85\xcf\x7f\x2f\
+\x2a\x18\x1f\x6e\xa6\x68\xbf\x34\xe0\xe7\xeb\xe3\xc5\x7d\xfe\x25\
+\x6f\x58\xde\xb4\x43\x09\x64\x2f\x06\xca\x0d\x02\x40\x65\xcc\x14\
+\x07\x38\x76\xc2\xb2\xc9\x27\x27\x15\xd9\xac\xff\xd5\xb2\x17\x51\
+\xbe\x9c\xfd\xbb\xcf\xba\x0a\x5a\xea\xa3\x8d\x3a\xaf\x1a\xf4\xf0\
+\xa3\xc1\x4f\xbb\xf4\xce\xe9\xb3\x87\x99\xc5\xae\x4e\xef\xcd\x2c\
+\xe9\xfd\xa9\x1b\xa2\x0c\x92\x7c\xc8\x3d\x99\xd6\xf3\x00\x9a\x54\
+\x0e\xb3\x18\xed\x7f\xf8\x24\x08\xef\xfe\xda\x91\x9b\xfd\xd2\x68\
+\xbf\x07\x86\x0c\xa8\x8f\x05\xaf\xb5\x77\x8b\xc1\x4f\x08\x01\xb0\
+\x12\x12\x81\x59\xf3\xb6\xe3\xf8\xc9\x30\x97\x58\x02\x75\x6a\x95\
+\xc4\x5b\x8b\x3a\xa1\x6a\x95\x22\x8a\xbf\xb7\xa3\x5c\xb9\xfa\x08\
+\x13\xa6\x6d\x62\x3e\x7f\x8c\x89\x92\xde\x13\x3c\x6f\xde\x43\xe5\
+\xbe\x25\xbd\xc1\x01\xcc\xe7\xef\x7c\x84\x17\xf6\x58\x3a\xc7\xb0\
+\x88\x42\x3c\xda\x6f\x98\xe4\x43\x83\x7f\xfc\xe8\x66\x98\x3e\xe5\
+\x79\xb7\x19\xfc\x84\x10\x00\x1b\x88\x8d\x4d\xc2\xfa\x5f\xff\xe6\
+\x2b\x03\x54\x9f\xae\xed\x6a\x24\x07\x14\xed\xa7\x0a\x3a\xfa\x4c\
+\x6d\x5b\x3d\x8b\x61\x83\x1b\xf0\xbf\x73\x1a\x17\xfe\xbd\x8f\x05\
+\x6f\xee\xc6\xc5\xcb\xa6\x4a\x7a\x1d\xdf\xa5\xd7\x19\xd8\x53\xd2\
+\x6b\x0a\x1a\xfc\x9f\x6f\x6f\x65\xe4\xf3\x53\x86\x1f\xed\xe6\x34\
+\x67\x46\x6b\xb7\x1a\xfc\x84\x10\x00\x3b\x78\xf4\x28\x0e\xb4\x95\
+\x1a\x09\x82\x5c\x73\x16\xfd\x30\xfe\xf9\xbc\x51\xa6\x54\x01\x5e\
+\x4c\x93\x13\xf9\xef\xd2\x43\xcc\x7f\x63\x97\x51\x6e\x3f\x99\xfd\
+\x9a\xc2\x1e\x37\x29\xe9\x35\xd3\xc6\xcb\x52\x49\x6f\x16\x2a\x3c\
+\x88\x0e\xc2\x7b\xbf\x76\x30\x5a\xea\xa3\x5d\x7a\xfb\x30\x9f\xff\
+\xed\x37\x5d\xb3\xce\x6f\x09\x21\x00\x02\x59\xa0\x92\xde\x89\xcc\
+\xec\x37\xde\xab\x2f\x1d\x43\x5a\x9f\xc1\xab\x7d\xf6\xba\x7c\xa9\
+\x8f\xd8\x75\xb6\x06\x6f\xe3\x45\x33\xbf\x3e\xbc\xa4\xb7\xfb\x21\
+\xbe\xd4\x67\xa9\xaa\xef\x7e\x54\x01\xbc\xbf\xb9\xbd\x09\x9f\x5f\
+\x85\xfe\x2f\xd5\xc2\xe2\x85\xee\x11\xf0\x33\x85\x10\x00\x81\xd3\
+\xa1\x92\xde\x69\xb3\x7f\x33\x6a\xff\xa6\x2d\xe9\x25\x7f\xda\xd5\
+\x7d\xfb\xb5\x25\xbd\x33\x57\xbd\x88\x64\xc3\x36\x5e\x99\x25\xbd\
+\x64\xf6\x5b\xf6\xf9\x0b\xe3\x7f\xdb\x5a\xb1\xc1\xef\x3e\xe9\xbd\
+\xb6\x20\x04\x40\xe0\x54\xc8\xe7\x5f\xb8\x64\x8f\xa4\x5b\x33\xe1\
+\x8e\x25\xbd\x54\xd5\x17\xe5\x40\x49\xef\xad\x47\x05\xb1\x6c\x9b\
+\xb1\xcf\x4f\x66\x7f\xbf\x17\x6b\xe2\x8d\x05\xb6\xef\xd5\xa7\x34\
+\x42\x00\x04\x4e\xe3\xf2\x95\x47\x98\xbb\x60\x07\xf7\xfd\xf5\xe1\
+\x25\xbd\xed\x4e\x62\x32\xf3\xa7\x5d\xb1\x57\x9f\x3e\xd9\x96\xf4\
+\xfa\xa4\xf2\x9d\x84\xad\x2e\xe9\xdd\xd0\x89\x89\x40\x88\x34\xe0\
+\x47\x3e\x7f\x8f\x6a\x2e\x4d\xef\xb5\x05\x21\x00\x02\xa7\x40\x3e\
+\xff\x58\x33\x25\xbd\xc3\xda\x9c\xc2\xac\x5e\xfb\xdd\xc0\xe7\xd7\
+\xb4\xf1\x7a\x7d\x6d\x0f\xa3\xed\xba\x02\xfd\x53\x30\x91\x09\x94\
+\x55\x25\xbd\x8f\x43\xf0\xd1\x66\xd3\x25\xbd\x83\xfa\xd7\xc6\xa2\
+\xd7\xdd\x7f\xe6\xcf\xfa\x46\x20\x04\x40\xe0\x18\xbc\xa4\xf7\xb5\
+\xed\x7c\xcf\x3e\x53\x3e\xff\xb8\x4e\x47\x99\x15\xe0\xda\x36\x5e\
+\xda\x92\x5e\xcd\x76\x5d\x66\x4a\x7a\xad\x68\xe3\xe5\x8e\x25\xbd\
+\x8e\x20\x04\x40\xe0\x10\xd9\xb5\xf1\x1a\xe3\x66\x25\xbd\x8b\xd7\
+\x77\x96\x54\xf5\x11\x94\xe4\x33\xa6\xa3\xb5\x25\xbd\x21\xf8\x74\
+\x6b\x6b\x93\x25\xbd\x7d\x7b\x55\xc7\x92\x45\xee\xb9\xd4\x97\x1d\
+\xb2\xb7\x05\x17\x02\x90\x7b\xb9\x7a\x3d\x12\xb3\xe6\x6d\xe3\xfb\
+\x3e\xe8\x43\x3e\xff\xb0\x36\xa7\x31\xbd\xe7\x01\x97\x37\xf0\xb4\
+\x58\xd2\xcb\x5c\x93\x46\xcf\xda\xdf\xc6\xcb\xcb\xcb\x03\x03\x5f\
+\xaa\x8b\x45\xf3\x73\xd6\xcc\x9f\xf5\xc9\x20\xaa\x01\x6d\x81\x7e\
+\xfc\x30\xe6\xe7\xd2\xee\x2d\x8f\x1f\xc7\xcb\x96\x08\x44\x15\x63\
+\x25\x8a\xe7\x47\xbd\x3a\xa5\x50\xac\x68\xa0\xac\x9f\xc9\x1e\x68\
+\x7d\x7f\xf4\x44\xe3\x92\x5e\x5f\x5e\xd2\x7b\x0a\xd3\x7b\xb8\x41\
+\x1b\xaf\xcc\x80\x9f\xe9\x92\xde\x64\x4c\xe8\x72\xd8\xa1\x92\x5e\
+\xa2\x49\xa3\xb2\xf8\xe9\x7b\x65\x1a\x78\xca\x81\x10\x00\x1b\xb8\
+\x1b\x1e\xc3\x2b\x03\x0f\x1c\xbe\x8e\xd8\x98\x24\xde\x6b\x5f\xce\
+\x54\x60\x5f\x66\x5a\x16\x28\xe0\xcf\xcc\xcb\xda\x18\x34\xa0\x1e\
+\x0a\x17\xb2\xb1\x9f\x98\x4c\x50\x49\xef\xbc\x85\x3b\x71\xe5\xaa\
+\xe9\x92\x5e\x32\xa9\x5d\x1d\xed\x27\xb3\x7f\xef\xf9\x6a\x3c\xe0\
+\x47\x3d\xfc\x8c\x7c\xfe\xcc\xf4\x5e\x6b\x4a\x7a\x3f\xdf\xf1\x82\
+\x91\xd9\xaf\xe5\xf9\x16\x15\xf1\xdd\xca\x7e\x42\x00\xcc\x61\x24\
+\x00\x65\x98\x00\x7c\x64\xf9\x75\xee\x26\x00\xd4\xc4\x62\xe6\xdc\
+\x6d\xb8\xcc\x2e\x7a\x4b\xbb\x16\x3b\x1b\x2a\x03\x6e\xd9\xa2\x02\
+\x5e\x9b\xdd\x16\x15\x2b\x14\x74\xfc\x80\x0e\x40\x83\x7f\xa1\x89\
+\x92\x5e\x32\xa7\xc7\xf0\x92\x5e\xd7\xfb\xfc\x94\xe4\xb3\xcb\x4c\
+\x1b\xaf\xfc\xfe\xc9\x3c\x28\x69\x4d\x49\x6f\xf8\xe3\x02\xf8\x68\
+\x4b\x5b\xa3\x92\x5e\x7d\x84\x00\x58\x60\xe8\xa8\x75\x38\x79\xfa\
+\x96\xee\x36\x6d\x97\xd5\xed\x3d\xe9\x0e\xb8\xa6\x70\x27\x01\x88\
+\x78\x14\x8f\x89\xd3\x37\xe3\xfc\xdf\xe1\x4e\x3f\xb6\x2d\x34\x6f\
+\x5a\x0e\x9f\x7e\xd0\x13\x21\x05\xfc\x1d\x3f\x98\x1d\x50\x49\xef\
+\x94\x99\x5b\x70\xc5\x64\x49\xaf\x66\xc7\x1e\x4f\x0f\x57\xb7\xf1\
+\x02\xf6\xb0\x99\x9f\x76\xec\x31\x4c\xf2\xa1\xc0\xe4\xf4\x9e\xfb\
+\xd1\xa4\xf2\x2d\x8b\x33\x7f\x44\x4c\x90\xc9\x36\x5e\x86\x08\x01\
+\xb0\xc0\x27\xcb\x8e\xe2\x8b\x95\x27\x74\xb7\x69\xe0\xd7\x7d\x59\
+\x85\x2a\xed\xb3\xdf\x18\xc3\x5d\x04\x80\x7e\xfc\xb7\xdf\xdf\x8f\
+\xd5\x6b\xff\x74\xea\x71\xed\x81\x2c\x81\x21\x03\x1a\x60\xfe\xdc\
+\xb6\x8a\xbf\xf7\xd5\x6b\x91\x18\x37\xe5\x57\xe3\x36\x5e\x99\x25\
+\xbd\x53\xba\x1d\x72\xb9\xcf\x4f\x85\x3d\x7b\xce\x55\xc3\xec\xef\
+\x7b\x23\x29\x45\xda\x81\x95\x97\xf4\x76\x39\xc2\x06\xbf\x65\x9f\
+\xff\x56\x44\x21\xee\xf3\xdf\x8a\x90\xf6\x5d\xf0\xf0\xf0\xe0\x2e\
+\x9f\xbe\xdb\x27\x04\xc0\x02\x64\x32\x8e\x1c\xff\x0b\xa2\xa3\x13\
+\x74\xf7\x79\xf9\xaa\xe0\x4f\x5d\x72\x3d\xb4\x67\x60\x0c\xed\xb2\
+\x63\x29\xc2\x96\x14\x43\xfb\xf2\xc9\x2b\x00\x54\xf6\x4b\xe7\x1f\
+\x76\x2b\x6b\x95\x84\xac\x18\x6a\xf1\x5d\xb0\xbc\x7c\x2d\xc1\xd2\
+\xd3\x98\xb8\x5d\xa2\xad\xc6\xd4\x88\xd3\x9b\x70\x83\xf2\xfb\x62\
+\xe7\x6f\xa3\x50\xb4\x88\x72\x81\x41\x4a\xef\x9d\xff\xe6\x6e\x5c\
+\x32\x2c\xe9\xd5\xb6\xf1\x62\xff\xf7\x73\xf9\x52\x9f\xa6\xa4\x77\
+\xe1\x4f\xdd\x10\x93\xe0\x48\x49\x2f\xf3\xf9\xb7\x1b\xb7\xf1\xf2\
+\xf2\xf2\x44\xaf\x1e\x35\xb0\x67\xdf\x55\x5e\x05\xaa\x45\x08\x80\
+\x05\x52\x52\xd3\xf1\xe9\xe7\x47\xf1\xed\xf7\x67\x64\xf7\x9d\xe5\
+\x10\x80\x43\x47\x6f\x60\xca\x8c\x2d\x48\xd4\xdb\x5a\xbb\xe9\x48\
+\x66\xc1\x74\x94\xf5\xa3\x68\x50\x6b\x76\x19\x3a\xf6\x85\x7e\x53\
+\x50\x0f\xbc\xf7\x56\x17\xf4\xea\x5e\x43\x81\x13\x00\xfe\xbb\xf8\
+\x90\x0d\x7e\xd3\x25\xbd\x63\x3a\x1c\x63\xfe\xf4\x31\x97\x0f\x7e\
+\x4d\x49\xaf\x66\x9d\xdf\xd0\xe7\x0f\xf0\x4b\xc1\xc4\x2e\xd6\x95\
+\xf4\xde\x8f\x0e\xc2\xfb\x66\x4a\x7a\x3b\xb4\xaf\x82\xa1\x83\x1a\
+\x60\xc2\x94\x4d\x88\x7c\x1c\xaf\x7b\x4c\x08\x80\x15\x50\xe3\x8c\
+\x19\x73\xb7\xe1\xd0\x91\x50\x59\x45\x40\xb1\xb6\xe0\x0b\x54\x28\
+\x51\x4b\xb6\x8f\x21\x81\x76\x49\xde\x30\x46\xda\x16\x7c\xdc\xa8\
+\xa6\x98\x31\xe5\x79\xd9\xdf\x9b\xd2\x7b\x27\x4d\xdb\x8c\xeb\x37\
+\x22\x25\xf7\xbb\x5b\x49\x2f\x0d\xfe\x05\x3f\x75\x47\x74\x9c\x34\
+\x36\xe2\xef\xab\xc9\xed\xa7\xc1\x6f\xb1\xa4\x37\x3a\x18\xef\x6f\
+\xea\x60\x54\xd2\x4b\x82\xdb\xbd\x6b\x75\x0c\xea\x57\x8f\x27\xfc\
+\x8c\x62\xd6\xa0\x10\x00\x3b\x48\x4c\x4c\xc5\xf2\xaf\x4e\xe0\x97\
+\x4d\x17\x10\xa5\xe7\x0e\x38\x13\x77\xdc\x18\xc4\x51\x52\xd8\x57\
+\xf5\xf3\x2b\x52\x01\xa0\xee\x32\x72\x6f\x0c\x42\xc9\x3d\x53\x66\
+\xfd\xc6\x73\xfb\x8d\xda\x78\x31\x73\x7a\x22\xf3\xa7\xbd\x5c\x1c\
+\xf0\xa3\x99\x7f\xdf\xf9\xaa\x98\xf9\x5d\x1f\xe3\x92\xde\x80\x44\
+\x8c\xa3\x06\x9e\x55\xc2\x60\x55\x49\xef\xd6\xd6\x46\x33\x3f\x0d\
+\xfe\x97\x5e\xac\x8d\x17\x7b\xd6\xe2\x83\x9f\x10\x02\xe0\x00\xa9\
+\xcc\x1d\xb8\x76\x3d\x12\xfb\x0f\x5d\xc7\xb9\xbf\xef\x71\x51\x30\
+\xf7\xe3\x24\x24\x5a\xde\xc9\xf6\xf6\xdd\x27\x88\x8b\x4b\xd6\xdd\
+\xce\x8d\x02\xe0\xac\x9d\x81\x52\x52\xd2\x79\x2f\x43\x6b\xec\x2f\
+\x1a\xfc\x4b\xde\xd9\x87\xff\x2e\xb9\x73\x7a\xaf\x27\xcf\xf0\xa3\
+\xaa\xbe\xe8\xb8\x7c\x46\xf5\xfc\xa3\xad\xf4\xf9\x29\xe0\xb7\xcc\
+\x54\x1b\x2f\x66\xf6\x77\xef\x52\x1d\xfd\xfa\xd6\x81\xaf\xde\xd6\
+\xe6\x42\x00\x14\x82\x76\x8b\xb5\xd4\x7c\x73\xf1\xd2\xbd\x38\x7b\
+\x3e\x6b\x69\x4e\x08\x80\x69\x9e\x3e\x4d\xc6\x83\x88\xa7\x5c\x80\
+\x2d\xe5\x2d\x51\x4a\xf8\xb2\x2f\x8f\x43\xff\x7a\x20\xc8\xec\xa7\
+\x4d\x3b\x26\xb9\x45\x49\x2f\xad\xf3\x57\xe3\x5b\x74\x1b\xfa\xfc\
+\xfe\x3e\xa9\x98\x62\x43\x49\xef\xdb\x1b\x3a\xf1\xad\xba\x0d\x07\
+\x7f\xc7\x4c\x9f\x9f\xfc\x7f\x7d\x0c\x05\x80\xf2\x33\xbe\x5f\xd9\
+\x3f\x67\x0b\x80\x9c\xc5\x40\xf6\x92\x97\x05\x20\x85\x5d\x5f\x09\
+\x6c\xfc\xe5\x2f\xc6\xcc\xdc\x74\xc7\x05\x20\x94\x0d\xe6\xa4\x24\
+\xcb\x39\xf9\x94\xe9\xb8\xf4\xfd\xfd\xb8\x77\x3f\x56\x72\x3f\xcd\
+\xfc\x43\xdb\x9c\xc6\xec\x5e\xfb\xdc\xc0\xe7\xd7\x94\xf4\xd2\xa6\
+\x1d\x31\x09\xd2\x75\xe4\x40\xbf\x14\x4c\xea\x76\xc8\x2a\xb3\x3f\
+\xfc\x71\x48\x66\xdf\x7e\x69\x62\x15\x99\xfd\x14\x60\xed\xff\x72\
+\x5d\xa3\xc1\x4f\x18\x0a\x40\xb3\x26\x65\xb0\x76\xd5\x60\x21\x00\
+\xce\x26\x4f\x0a\x00\xbb\x66\xef\xfc\xa5\xc9\x6f\x48\x8e\x03\x82\
+\x4b\x03\x8d\x86\x02\x3b\x17\x3a\x26\x00\x54\xa6\x9b\x9c\x9c\xbd\
+\x00\x90\x48\x7c\xba\xec\x28\x17\x01\xf7\x2f\xe9\xed\x8d\x84\x64\
+\x6f\xa3\xa5\x3e\x72\x4f\x9a\x5a\x59\xd2\x4b\x66\xbf\x61\x86\x9f\
+\xd6\xe7\xef\xd3\xa3\xa6\xc4\xec\xd7\x47\x08\x80\x42\xe4\x39\x01\
+\x60\x17\xe2\xed\x3f\xd8\xe0\xff\x4e\x8d\xf8\x4c\xeb\x9b\x4c\xda\
+\x8a\xcf\xab\x10\x7a\xd8\x31\x01\x88\x8e\x4e\x44\x44\x64\x9c\x26\
+\x06\x60\x62\x6c\x50\x5c\x66\xc5\x37\x27\x8d\x1a\x78\xba\x97\xcf\
+\x9f\x59\xd2\xcb\xcc\xfe\xc7\x06\x19\x7e\xb6\x94\xf4\x92\xb9\xff\
+\xbf\x6d\x26\x4a\x7a\xd9\x6c\xdf\xb9\x53\x35\x5d\xb4\xdf\x1c\x42\
+\x00\x14\x22\xaf\x09\xc0\xdd\xb3\xc0\xc9\x95\x6a\x24\x64\xe5\x1b\
+\x71\x01\x28\x55\x4f\xc5\x1e\x73\x3c\x08\x48\x01\x57\x0a\x04\x1a\
+\x8e\x7f\xda\xb4\x63\xd1\x5b\xbb\x4d\x76\xef\x1d\xd6\xf6\x34\xa6\
+\x75\x3f\xe0\xf2\x99\x5f\x4d\x25\xbd\x67\x4d\xb7\xf1\xf2\x65\xe7\
+\x36\xbd\xd7\x01\x07\x4b\x7a\x3d\xd1\xa9\x03\xf3\xf9\x07\x36\xc8\
+\x76\xf0\x13\x42\x00\x14\x22\xcf\x08\x00\xbb\x10\xc3\xff\x06\x0e\
+\x7f\xa2\x46\x6a\xa2\xf4\x21\xdf\xfc\x9a\xa4\xa3\xc3\x9f\x3a\x2e\
+\x00\xa6\xa0\xdc\xfe\x51\x13\x7e\x31\x51\xd2\x9b\x8e\xe1\x6d\x4f\
+\x62\x46\x4f\xf7\x29\xe9\x9d\xb7\xa6\x27\xe2\x12\xa5\x25\xbd\x54\
+\xd8\x43\x6d\xbc\xac\xf1\xf9\xef\x44\x16\xe4\x85\x3d\x61\x26\x7c\
+\xfe\x3e\xbd\x6a\xe2\xe5\x17\xeb\x98\xf4\xf9\x0d\x11\x02\xa0\x10\
+\x79\x41\x00\x68\x16\xba\xf3\x27\x70\x8a\xcd\xfc\x49\xb1\x90\xcc\
+\x4a\x7e\x41\x2a\x34\x1e\x0e\x94\xac\x0d\xac\x1b\xe9\x7c\x01\xe0\
+\x25\xbd\x0b\x7e\x37\x2a\xec\xd1\xfa\xfc\x63\xdd\xa8\xa4\xf7\xb5\
+\x35\x3d\x10\x97\xe4\x6b\xba\x8d\x17\xf5\xed\x57\x59\xf6\xf9\x4d\
+\x95\xf4\x6a\x7d\xfe\xde\xcc\xe7\xf7\x33\xe3\xf3\x1b\x22\x04\x40\
+\x21\x72\xbd\x00\x98\xf0\xf9\x09\x32\x6b\xbd\xf3\xa9\xd0\x74\x14\
+\x50\xbe\x29\x90\x96\xec\x9c\x3c\x00\x7d\xfe\xf9\x37\xb3\xa4\xf7\
+\xa2\x89\x92\xde\x4e\xc7\x78\x7e\xbf\xbb\xf8\xfc\xa6\x4b\x7a\x93\
+\x78\x0a\xb2\x35\x25\xbd\x77\x1f\x17\xc0\xc7\x26\x4a\x7a\xc9\xd4\
+\xe7\x4b\x7d\xcc\xec\xf7\xb6\x62\xe6\xd7\x22\x04\x40\x21\x72\x92\
+\x00\xd0\x5a\xfd\x93\xbb\x40\x50\x49\x66\x3e\x5b\x59\xa3\x13\x7e\
+\x1e\x38\xfe\x85\x9a\xa7\xfa\x6a\xa1\x8b\x9b\x0a\xa5\x9a\x8c\x04\
+\x2a\x51\xa6\xaf\xca\x79\x89\x40\x5a\xc8\xd7\x9f\x3a\x7b\xab\x51\
+\x33\x0f\xca\xed\x1f\xda\xfa\x34\x66\xf5\xde\xe7\xf2\x0c\x3f\xfa\
+\xe0\x54\xd5\x47\x85\x3d\xfa\x01\x3f\x6d\x1b\x2f\xeb\x4a\x7a\x35\
+\x3e\xbf\xa9\x92\x5e\xea\xb6\xd4\xa5\x53\x55\x5e\x59\x69\xc9\xe7\
+\x37\x44\x08\x80\x42\xe4\x14\x01\x88\xb8\x02\x1c\xfd\x4c\x53\xb1\
+\xc7\xcd\xf6\x57\x80\x0a\x2d\x60\xb6\xca\x91\xfb\xfc\xe7\x33\x7d\
+\xfe\x24\xe9\x43\x7e\xf9\xd9\xeb\x47\x64\xbe\x3e\x13\x67\x0a\x00\
+\xf5\xf0\x1b\x37\xd9\x74\x49\xef\xc8\x76\x27\x30\xb5\xbb\xfb\x94\
+\xf4\xce\x59\xdd\x0b\x89\xc9\xde\x92\xc7\xb2\x76\xe9\x75\xac\xa4\
+\xf7\xa5\x3e\xb5\xd1\xb7\x77\x2d\x9b\x66\x7e\x2d\x42\x00\x14\x22\
+\xa7\x08\xc0\xd1\x65\xcc\xc7\x3c\xa6\xd6\xcd\x30\x24\x02\x54\x2a\
+\x4c\xfd\x0e\x54\x1e\xd2\x63\x71\x9f\x9f\x99\xfd\xa7\xbe\x65\x33\
+\xbf\xb4\x7d\xbe\xce\xe7\x2f\xdf\x4c\xfa\x3a\x67\x09\x00\x2f\xe9\
+\x7d\x63\x17\x2e\x5d\x31\xd1\xc6\xab\xe3\x71\x8c\x6e\xef\x4e\x25\
+\xbd\x9a\x24\x1f\x53\x6d\xbc\x2c\x9b\xfd\x1a\x9f\x7f\xf9\x0e\x53\
+\x25\xbd\x1e\xcc\xdf\xaf\x85\x17\xd9\xe0\xb7\xd6\xe7\x37\x44\x08\
+\x80\x03\xa4\xb1\x01\x4d\x7b\xc4\x1f\x3c\x7c\x9d\x37\xd5\xa4\xec\
+\x34\x73\xe1\x1b\xfd\x1c\x7f\x73\x5c\xbd\xfe\x08\x31\x31\x59\xd3\
+\xa8\x2b\x04\xe0\xf0\xc7\x40\xd8\x29\xe9\xa7\xf0\x61\x3e\x7c\xbd\
+\x7e\x40\x65\x26\x02\x1e\xda\xeb\x8c\x7c\xfe\x3f\x29\xc9\xc7\xd8\
+\xe7\xf7\xf2\x53\xa1\xf9\x18\xa0\x1c\xf3\xf9\x55\x06\x93\x92\x33\
+\x04\x80\xfa\xf6\x2f\x30\x53\xd2\x4b\xc1\x3e\xfa\xbf\xab\x07\x3f\
+\xcd\xfc\x94\xe1\x67\xca\xe7\x0f\xf4\x4b\xc6\xf8\x2e\x47\x78\xb4\
+\xdf\x92\xcf\x7f\x2f\x2a\x18\x1f\x98\xd8\xa8\x93\x4c\xfd\x0e\xed\
+\xaa\x60\xd8\x20\xdb\x7c\x7e\x43\x72\xa5\x00\xc8\xd9\x16\x5c\x0b\
+\xf5\x05\x58\xf9\xed\x69\xac\x5d\x77\x96\x77\xd3\x95\x03\x57\x08\
+\x40\xf8\x39\xe0\xd8\xe7\x6a\x24\x3d\x95\xbe\x8e\x06\x7e\xfd\x01\
+\x2a\x54\xeb\xac\xf9\x9b\xcc\x7e\xfe\x3c\x69\x96\x2d\xbc\xfd\x99\
+\xcf\xcf\xcc\xfe\x4a\x2f\x98\x7e\x7f\x47\x05\x80\x97\xf4\x4e\xdf\
+\x8c\xeb\xa1\xc6\x25\xbd\x83\x5b\x9d\xc1\xdc\x17\xdd\xa4\xa4\xf7\
+\x5c\x75\xde\xc6\xcb\xa8\xa4\x97\x59\x28\x53\x7b\x1c\x60\x3e\x7f\
+\x98\xc5\x68\xff\x83\xe8\x60\x93\x5b\x74\xf3\x92\xde\x2e\xd5\x30\
+\xa8\x7f\x7d\x9b\x7d\x7e\x43\x0c\x05\xe0\xb9\x66\xe5\xb1\xfa\x9b\
+\x01\x39\x5b\x00\xe4\x2e\x06\x4a\x48\x48\xc5\xdc\x05\xbf\x63\xcf\
+\xfe\xab\x16\xcd\x7a\x47\x70\x55\x10\xf0\xde\x05\xe0\xc4\x97\xec\
+\x73\x46\xa9\xa5\x17\x9e\xa7\xa6\x71\x48\x91\x67\x99\xd9\xff\xb5\
+\x66\x9d\xdf\xd4\x52\x9f\xbe\xcf\x6f\x88\x23\x02\x40\xe6\xfe\xe4\
+\x19\x5b\x78\x57\x23\x53\x25\xbd\x93\xd8\xac\xea\x0e\x3d\xfc\x68\
+\xab\xad\x6e\x4b\x26\x18\xa5\xf7\xda\x5a\xd2\x4b\x9b\x76\xdc\x32\
+\x31\xf8\x5f\xa6\xf4\x5e\xbd\x92\x5e\x47\x10\xd5\x80\x36\x42\xad\
+\xb3\xbf\x5c\x79\x92\xf7\x05\x94\x73\xf0\x13\x2e\x5b\x06\x64\x17\
+\x5c\xc4\x65\xe0\xe8\x72\x20\xfe\x91\x81\x08\x78\xa9\xe0\xe9\xcd\
+\xbe\x87\x44\xfd\x9a\x7e\x36\x03\x07\x6a\x66\xfe\xf2\x26\xcc\x7e\
+\xc9\xf7\x67\xa7\x00\x5c\xf8\xe7\x3e\x16\x2c\xd9\x8d\x8b\x06\x1b\
+\x75\x52\xdf\xfe\xb1\xcc\xe7\x77\x87\x5d\x7a\xb5\xec\xbf\x50\x15\
+\x13\x56\xf4\x43\x46\x46\xd6\x38\xb2\xad\x8d\x57\x21\x7c\x6e\xa6\
+\xa4\xb7\x47\xd7\x1a\x5c\x00\x7c\xed\xf4\xf9\x0d\x11\x02\x60\x23\
+\x34\x0b\x8d\x18\xbb\x41\xf2\xa5\x79\x7a\xab\xe0\x9d\x2f\xfb\x7e\
+\x7a\xea\x74\x8b\xed\x00\xf8\x8c\x9a\x91\x26\x6f\x4f\x40\x5b\xf2\
+\x00\x48\x04\x4e\xae\x04\x62\xc2\xd5\x66\xcb\x6e\xb5\x4b\x7d\xcd\
+\xc6\x1a\x07\xfc\x4c\x7e\x46\x3b\x04\xe0\xe2\xe5\x08\xbc\xb6\x70\
+\xa7\x51\x3d\x3f\x99\xfd\x23\xdb\x9f\xe0\xcd\x3c\x5c\x9d\xe4\xa3\
+\x0f\x6d\xbc\xd1\x73\xe9\x38\xdd\xe6\x1d\xf9\x7c\xa9\xaa\xef\x30\
+\x37\xfb\x2d\xf9\xfc\x0f\x9f\xd0\x52\x9f\xe9\x5d\x7a\xcd\x95\xf4\
+\x3a\x82\x10\x00\x1b\xf9\x74\xf9\x31\x2c\x5f\x71\x5c\x77\x9b\xba\
+\x02\xd7\xee\xa3\xf1\x8d\x73\x42\x57\x60\x5b\x13\x81\xa2\x6f\x03\
+\xc7\x99\x25\xf0\xf8\xa6\x69\x05\xf0\x09\xd0\x98\xfd\x95\xac\xec\
+\xe8\x65\xab\x00\x3c\x78\xf8\x14\xc3\x46\xaf\x37\xae\xe7\xa7\x92\
+\xde\xd6\xa7\x31\xa7\xb7\x3b\x94\xf4\x4a\xa1\xfa\xfe\x9f\x8e\x34\
+\xc4\xb6\x3f\x6a\x71\x3f\xbf\x6b\xc3\x7f\x51\xaf\xe2\x5d\x58\x2c\
+\xe9\x8d\x2a\x80\x0f\x37\xb5\x37\xe9\xf3\xf7\xec\x5e\x03\x03\xcc\
+\x94\xf4\x3a\x82\x10\x00\x1b\x79\x65\xcc\x7a\x1c\x3f\x19\xa6\xbb\
+\x1d\x44\xfb\x02\xbc\x43\xc1\xaf\xec\x5f\x97\x53\x05\x80\x88\x7f\
+\xc4\xdc\x81\xcf\xc9\x22\x50\x9b\xf6\xf9\x9b\xc3\x7c\x9e\x80\x01\
+\xb6\x08\x00\xf9\xf9\x9f\x7d\x71\x9c\xbb\x5b\xfa\xbd\x17\xb5\xe9\
+\xbd\xe3\x99\x3f\xed\xfa\xbd\xfa\xa4\xd0\xd2\xdf\xdd\xa8\x60\xc4\
+\x25\xfa\x21\x2d\x5d\x63\x0e\x79\x79\xd2\x0f\x6f\x7f\x49\xef\xcb\
+\x99\xe9\xbd\xce\x32\xfb\xf5\x11\x02\x60\x23\x39\x7d\x67\x20\x7b\
+\x53\x81\x69\xa9\xef\xc4\x0a\x36\x23\xff\xcb\x2e\x65\x36\x18\xa9\
+\xb0\xa7\xf1\x70\x95\x45\x9f\xdf\x10\x5b\x04\x80\x3a\xff\x0c\x63\
+\x82\xfb\xcf\xbf\xf7\x25\xf7\x93\x39\xed\x0e\xe9\xbd\x86\xa4\xb1\
+\xc1\x4f\x9d\x78\x63\x13\xfc\x6c\x78\x95\xf9\x92\x5e\x32\xfb\xbb\
+\x76\xae\xc6\x66\xfe\x7a\x7c\x5b\x35\x39\x10\x02\x60\x23\x39\x7d\
+\x6f\x40\x47\x6a\x01\x12\x63\x80\xb0\xe3\x1a\x31\x28\x5d\x1f\x28\
+\x56\xcd\xb2\xcf\x6f\x88\x2d\x02\xf0\xf7\x3f\xf7\xd1\x7f\xe8\x5a\
+\xa4\xa5\x69\xbe\x38\x6a\x20\xda\xb8\xca\x3d\xac\x1c\xbf\x9a\xf9\
+\xd5\x49\x56\xbd\x9f\x32\xa8\x90\xa1\xd6\xe4\xe9\xd3\xbe\x7d\xb6\
+\xbc\x2e\x82\xf9\xfc\x4b\x37\x3a\x56\xd2\xeb\x08\x42\x00\x6c\x24\
+\xc7\x0b\x80\x8b\xdb\x82\xa7\xc4\x01\x3f\x8f\x90\x76\x05\x26\x01\
+\x78\x75\x46\x2b\xa3\xe7\x2e\x7d\xff\x00\xbe\x5b\xf3\x87\xee\x36\
+\xcd\x88\xef\x2d\x6a\x84\xee\xcf\xbc\x0b\xc4\x1c\x86\xc5\x86\x80\
+\x0a\x41\x49\x3f\xb7\x23\x43\x8c\x76\xec\xb5\x44\xb6\x25\xbd\x3d\
+\x6b\xe2\xe5\xbe\xd6\x95\xf4\x3a\x82\x10\x00\x1b\xc9\xe9\x02\x70\
+\xf8\xe8\x0d\x4c\x9e\xb9\x25\xb3\x83\xb1\x06\x32\xe5\x29\x88\xa9\
+\x04\xb4\xb2\xa0\xdf\x12\x8c\xb6\x07\x7b\x95\xcd\xfe\x23\x86\x36\
+\x92\x3c\xef\x61\x44\x1c\xc6\x4c\xda\x28\x59\xf6\xa3\xdd\x83\x7e\
+\xdf\x3c\x12\xc1\xfe\x8f\x80\xd0\x69\xec\x4b\xdd\xe9\x72\x11\x20\
+\xb3\x9f\xb2\xf5\x6c\x9b\xf9\xb5\x25\xbd\xad\x98\xd9\x5f\xc8\xe1\
+\x92\x5e\x47\x10\x02\x60\x23\x39\x5d\x00\x28\x75\x79\xe4\xf8\x0d\
+\xd0\xcf\x94\x0c\x2a\xae\x42\xad\x17\x81\x42\xe5\x6d\x37\xe9\xad\
+\x85\x2e\xf2\x38\x36\x96\xff\xdd\xa6\x09\x26\x6a\xf1\xf1\xf1\xc2\
+\xfa\x35\x83\x50\xb3\x7a\x71\xc9\xf3\x49\xa8\x68\x03\x53\xfd\xde\
+\x7f\xbd\xbb\xd7\xc4\xfb\x4b\xbb\x6a\x6e\x24\x87\x01\x37\x48\x04\
+\xf6\x28\x26\x02\x54\xd2\x7b\xfd\x7e\x51\xfc\x77\xbb\x04\xca\x17\
+\x7d\x8c\x6a\x65\x1e\x20\xf2\x69\x80\xcd\x3e\xff\xdd\xc8\x02\xf8\
+\xe4\xb7\xb6\xb8\x61\xa2\xa4\xb7\x53\xfb\xaa\x18\x32\xb0\xbe\x43\
+\xe9\xbd\xb6\x20\x04\xc0\x46\x72\xba\x00\xd0\xd1\xdf\xfb\xf0\x20\
+\x56\xfd\xf0\x87\xc4\x0d\x70\x05\x64\xfe\x37\x6b\x52\x0e\xdf\xaf\
+\xec\x67\x94\x43\xb1\x60\xf1\x6e\xac\xfb\xe5\xbc\xee\xb6\x9f\x9f\
+\x17\x3e\x7c\xa7\x3b\x3a\xb6\xab\x9c\xf5\xa4\xd4\x07\xc0\xe5\x81\
+\xc0\xd3\x53\x0a\x88\x80\x8a\xf7\xed\xa7\x1e\x7e\x11\x31\x81\x7c\
+\x97\x1e\xca\x3f\x78\xae\x7a\x28\x2c\x67\x78\x64\x1d\x83\x7c\xfe\
+\x77\x36\x3a\xb7\xa4\xd7\x11\x72\xa5\x00\xc8\x59\x0c\x94\xd3\x05\
+\x80\x78\x14\x19\xcf\x53\x6a\xff\x3a\x77\xd7\xe9\xc7\xb6\x85\x32\
+\xa5\x0b\xe0\xcb\xff\xf5\x41\x95\xca\x45\x8c\xce\xef\xe5\xc1\x6b\
+\x71\x37\x3c\xeb\x37\xac\xfc\x4c\x11\xac\xfe\xa6\x3f\x0a\x17\x92\
+\x36\xd0\x44\x2a\x73\x07\xae\x0d\x07\x9e\x1c\x90\x4d\x04\xf8\x5e\
+\x7d\x6c\xf0\xcf\x5d\xdd\x8b\xa7\xf7\x6a\xa9\x56\xe6\x21\x5e\x7b\
+\x69\x17\x6f\xe8\x61\x0d\xb7\x1e\x15\xc2\x27\xe4\xf3\x9b\x28\xe9\
+\xed\xdb\xa7\x16\x5e\xea\x5d\x5b\xb1\x99\x5f\x4b\xae\x2c\x06\x12\
+\x02\x60\x99\x9b\xb7\xa2\x31\x6b\xee\x36\x5e\x51\x27\xf7\x26\xa7\
+\xa6\xa8\x54\xa1\x10\xe6\xcf\x6d\x87\x16\xcd\xcb\x1b\xa5\x10\x50\
+\xa0\x72\xde\xc2\x9d\x48\xd2\xdb\xc0\x94\xa2\xe1\x0b\xe6\xb5\x33\
+\x7d\xb0\xe4\xdb\xcc\x1d\x98\x2e\x4b\x4c\x40\xb3\x63\x4f\x55\x2c\
+\xfc\xb1\x3b\x62\x13\xa5\x25\xbd\xf5\x2a\xdd\xc5\x9c\x3e\x7b\xad\
+\x5a\x8e\x34\xd7\xc6\x8b\x66\xfe\x17\x7b\xd5\x42\x9f\x5e\xf6\x97\
+\xf4\x3a\x82\x10\x00\x1b\xc9\x2d\x02\x40\xdc\xbf\x1f\x8b\x95\xdf\
+\x9d\xc6\xbe\x03\xd7\x10\xfd\x24\x51\xd3\x65\x57\xa6\x59\x94\xcc\
+\x7d\xaa\x5f\xcf\x1f\xe8\x8b\x26\x8d\xcb\x62\xe2\xd8\xe6\x7c\x56\
+\x37\x95\x3e\x3d\x6d\xf6\x56\xec\xd8\x75\x49\x77\x9b\x4c\xe2\x6f\
+\xbe\x78\x89\xbb\x0b\x66\x49\x66\x5f\x70\xe8\x64\x66\x09\xec\x73\
+\x9a\x08\xd0\xcc\xbf\xf3\xaf\xea\x78\x6b\x83\xe9\x92\xde\xa9\x3d\
+\x0e\xa2\xe1\x33\x4c\x7c\xb2\x75\x01\xb4\x25\xbd\xed\x10\xe6\xa4\
+\x36\x5e\xce\x44\x23\x00\x09\xba\xcf\x20\x04\xc0\x02\xb9\x49\x00\
+\xb4\x50\x75\x1d\x25\xdb\x44\x46\x25\xc8\x2a\x00\x41\xf9\x7d\x99\
+\xb9\x5f\x14\xd5\xaa\x14\x35\x5b\x37\x11\x17\x9f\x82\x96\x6d\xbf\
+\x60\xff\x66\xf5\x4f\xa8\x55\xa3\x04\x56\x2e\xef\x6b\x6c\xfe\x1b\
+\x42\xee\xc0\xe5\x97\x80\xa7\x67\x9c\x22\x02\xbb\xce\xd6\xe0\x6d\
+\xbc\x0c\x4b\x7a\x29\x13\x71\x9a\xb5\x25\xbd\x4f\x82\xf0\x9e\x09\
+\x9f\x9f\xcc\xfe\x6e\x5d\xaa\x61\xb0\x13\x4a\x7a\xed\x85\x2f\xc1\
+\x8e\xdb\x90\x3b\x05\xe0\xf6\x9d\x18\xdd\x9d\x0d\xea\x95\xc2\xba\
+\x1f\x06\x3b\xe5\x0d\xfa\x0e\xfc\x81\x27\xa8\x68\x29\x50\x06\xe8\
+\xf9\x91\xe5\xef\x2b\x2a\xcc\xf2\x35\x79\xfa\x5b\x35\x1e\x5d\xcd\
+\xba\x5d\xac\x68\x20\x8e\xed\x9f\xa8\xe0\xd7\xe7\x5a\xe8\xfb\xd9\
+\xf4\xdb\x3f\xbc\xd4\x5a\x9f\xf1\xa3\x9b\x61\xfa\xe4\x96\xfc\x82\
+\xb5\x48\xca\x43\xe0\xda\x68\x66\x09\xec\xb5\xfb\x3c\xd2\x33\x34\
+\x3d\xfc\x66\x7f\xdf\x9b\xef\xd2\xab\x9f\xe7\x1c\x9c\x2f\x81\xa7\
+\x20\xf3\x2d\xba\x2d\x9c\x0e\x6d\xd3\xf5\xe9\xd6\x36\x3c\xc9\x47\
+\xff\x18\xf4\x39\x78\x49\x2f\x33\xfb\x7d\x7d\x94\x37\xfb\x89\x7c\
+\xfe\xde\xfc\xfa\xea\xd0\xfd\x6b\xbe\xe4\xaa\xa5\x69\xe3\xd2\x42\
+\x00\xb2\x43\x08\x80\x7c\x50\x6e\xc2\xec\xd7\xb6\x63\xf7\xbe\xac\
+\x2f\x81\xf2\x04\x36\xad\x1b\x86\x1a\xd5\x8a\x59\x7f\xa0\xa4\x9b\
+\xc0\x8d\x99\x9a\x98\x80\x8d\x50\xfe\xfe\xae\xb3\xb4\x4b\x6f\x57\
+\x3c\x89\xa7\x99\x3f\xeb\xb7\x2d\x10\x90\xa0\x6b\xe3\xe5\xe9\x61\
+\x29\xb7\xbf\xa0\xae\xa4\x57\xff\x18\xe4\x06\xf5\xe8\x56\x83\xf7\
+\xf1\xf3\xf7\xf3\x86\xd2\x90\xb5\x51\x28\x24\x1f\x82\x82\xfd\xe0\
+\xe5\xe9\x81\xe7\xda\x2e\x17\x02\x60\x0b\x42\x00\xe4\xe3\xd6\xed\
+\x68\xee\x62\x51\x3c\x42\x4b\x75\x36\xf0\x37\xac\x19\x6c\x7b\x21\
+\x4c\x12\xf3\xb9\xae\x8f\x07\x62\x0e\x5a\xfd\x12\x9a\xf9\xb5\x3e\
+\xff\xe3\xa7\xfa\xed\x90\xd5\x9a\x92\xde\xae\x87\xf9\xcc\x9f\xdd\
+\xe0\xa7\xdf\x98\xcc\xfe\x77\x37\x76\x30\x9a\xf9\x69\xf0\x6b\x4b\
+\x7a\x95\x9e\xf9\x49\x48\x83\x83\xfc\x50\x88\xb9\x51\x94\x5d\xa8\
+\xb5\xa6\x84\x00\xd8\x88\x10\x00\xf9\xf8\x69\xfd\x39\x2c\x7a\x6b\
+\x8f\xee\x36\x5d\xa3\x53\x26\x3c\x87\x09\x63\x9b\xc3\xc3\x1a\xf3\
+\xdf\x90\x94\x08\xe0\xca\x00\x20\xf6\x84\xc5\xa7\xd2\x6f\x43\x83\
+\x7f\xc1\x4f\xdd\x11\x9b\x20\xf5\xf9\x69\xf0\x4f\xee\x76\x88\x77\
+\xef\xf5\xb0\x70\x1a\xe1\x8f\x83\xf1\x41\x66\x49\xaf\xa1\xd9\xdf\
+\x93\xcd\xfc\x03\xfa\xd5\x55\x7c\xf0\x07\x04\xf8\xa0\x48\xa1\x00\
+\xfe\xaf\x21\x42\x00\x6c\x44\x08\x80\x3c\x24\x24\xa6\x60\xfc\x94\
+\x4d\x38\x71\xea\x96\xee\x3e\x0a\x1a\xae\x5d\x35\x00\x55\xab\x14\
+\xb3\xe8\x6f\x9b\x25\x39\x1c\x08\x65\xdf\x61\xf4\x6e\xb3\x4f\x49\
+\x4b\x57\x61\xef\xf9\xaa\xcc\xe7\xef\x63\xe4\xf3\x93\xd9\x3f\x96\
+\x36\xed\xe0\x3b\xf6\x64\xff\x56\x94\xd6\xfb\xd9\xf6\xd6\x99\xb9\
+\xfd\xc6\x3e\x7f\xef\x9e\xca\x2e\xf5\x51\x05\x61\x91\xc2\x81\xc8\
+\xcf\xbe\x47\x3a\x77\x53\x31\x14\x21\x00\x36\x22\x04\x40\x1e\xa8\
+\xcd\xf7\xd8\x49\x1b\x33\x23\xd2\x1a\xe8\x77\x5b\xbb\x6a\x20\x37\
+\x9d\x1d\x82\xc7\x04\x66\x30\x11\xd8\x65\xf4\x90\xc6\xe7\xa7\x5d\
+\x7a\x3b\x23\x3a\x3e\x40\xf2\x58\x70\xbe\xac\x2d\xba\x2d\x99\xfd\
+\xb7\x1e\x15\xc4\x67\xdb\x5a\xf1\x75\x7e\x43\xb3\xbf\x5b\x97\xea\
+\xe8\xff\x52\x5d\xc5\x06\x3f\xbd\x27\x99\xfb\x05\x0b\xe6\x83\x37\
+\xfb\x3b\xbb\xe0\xa9\x10\x00\x1b\x11\x02\x20\x0f\x2b\x57\x9d\xc6\
+\x07\x9f\x1c\x92\xdc\xf7\xda\xec\x36\x18\x6e\x50\x24\x64\x37\xc9\
+\x77\x80\xab\x23\x99\x3b\x70\x54\x77\x17\x2d\xcb\xee\x3c\x5b\x83\
+\x0f\xfe\xa8\x38\xa9\xcf\xef\xe7\x9d\xc6\xd7\xf9\x1b\x57\xb6\xec\
+\xf3\x53\x1b\xaf\xa5\xbf\x74\xe2\x75\xfd\xae\xf4\xf9\xe9\x9d\x03\
+\x03\x7d\x50\x98\x99\xfb\xfe\xfe\xde\x56\xad\x9a\xe4\x4a\x01\x68\
+\xd7\x65\x85\x3a\x4c\x2f\x0f\x40\x08\x80\x7b\x93\x9a\x9a\xce\x53\
+\x7f\xf5\xfb\xfc\xd3\x67\xff\x7a\x79\x5f\x54\xab\x6a\x43\xf4\xdf\
+\x12\x3c\x26\x30\x98\x8b\x40\x06\xf7\xf9\x6b\x60\xfe\xda\xee\x88\
+\x4b\x92\x16\xf3\x50\x92\x8f\x66\x97\x5e\xcb\x66\xff\x9d\x47\x05\
+\xf0\xd1\x96\x76\xbc\x91\xa7\x3e\x34\xf8\x7a\xf7\xac\x89\x7e\x7d\
+\xeb\x28\x30\xf8\x99\x60\xf9\x7a\xf3\x3c\x89\x20\x36\xf3\x5b\xb5\
+\x5c\x9a\x89\xa1\x00\x34\x6f\x5a\x16\x3f\x7c\x33\x30\x67\x0b\x00\
+\x15\x03\xe9\x57\xbb\x09\x01\x30\x0f\x25\xfe\x50\xdf\xbd\xd0\x9b\
+\x8f\x11\x1b\x9b\x2c\x5f\x51\x0d\xbb\x28\x69\xed\xb9\x6c\x99\x02\
+\x28\x5f\xae\x20\x8f\x4a\x6b\xf9\xf3\xec\x5d\x8c\x99\xb8\x11\x4f\
+\xf5\x36\x4f\x69\xf3\xc2\x33\x58\xf6\x71\x2f\xe7\x27\xc9\x30\x4b\
+\x20\xed\xea\x34\xec\x39\x70\x0b\xf3\xd6\xf4\x40\x42\x32\x05\xc6\
+\xa4\x3e\x3f\xed\x2c\xd4\xb4\xca\x0d\x76\x8e\xd9\x1f\x8a\x7c\x7e\
+\x6d\x1b\x2f\x93\x3e\x3f\x95\xf4\xca\xbc\xd4\x47\x26\x7e\x08\x33\
+\xf5\x43\x82\xfd\x78\x5a\xb1\x2d\x83\x9f\x30\x14\x80\x96\xcd\x2b\
+\xe4\xfc\x62\x20\x21\x00\x96\xa1\x81\x4f\xcb\x6d\x14\x79\xff\x7d\
+\xf7\x65\x84\xdf\x8b\xe1\xfb\x1d\xc8\x09\xcd\x84\x45\x8b\x06\xa0\
+\x55\xcb\x4a\xdc\xb4\x2f\x5d\x2a\x98\xdf\xff\xc9\xb2\xa3\x58\xf1\
+\xcd\x49\xc9\xf7\xf3\xce\xe2\xce\xe8\xdb\xbb\xb6\x2c\xe7\x71\x70\
+\xdf\x49\xcc\x5d\xb8\x0b\x51\x4f\xf5\x33\x0b\xd5\x08\xca\x97\xc4\
+\x77\x15\xb2\xc6\xe7\xbf\x13\x19\xc2\x93\x7c\x48\x04\xf4\x07\xbf\
+\xb7\xb7\x07\x3a\x75\xa8\x8a\xc1\x03\xea\xcb\x3a\xf3\x93\x80\x52\
+\x5a\x35\xcd\xfa\xb4\x44\x6a\xeb\xc0\xd7\x22\x04\xc0\x46\x72\x83\
+\x00\xd0\xe0\xa7\x02\x90\x99\x73\xb7\xe3\xf4\x1f\xb7\x5d\x52\x0c\
+\x44\xeb\xfb\x6f\x2d\xec\xc8\x53\x83\x7b\xbc\xf4\x1d\xdf\xe5\x57\
+\x4b\x91\xc2\x01\xec\xf7\x1a\xc4\xac\x85\x10\x07\xde\xc1\xdc\x67\
+\x07\x0f\x36\x1e\x3c\x12\xaa\x7f\x2f\x6f\x31\x3e\xa3\xe7\x7e\x34\
+\xaa\x7c\xcb\x2a\x9f\xff\x9d\xcc\x36\x5e\xfa\x83\xdf\xd3\x53\x85\
+\xce\x1d\x35\x25\xbd\x72\x34\xf0\xd4\x42\xa5\xd1\xf4\x1d\x05\x06\
+\xf8\x4a\x2c\x29\x7b\x10\x02\x60\x23\xb9\x41\x00\x1e\x47\x25\x60\
+\xda\xec\xdf\x70\xea\xcc\x6d\xa7\x1f\xdb\x16\xca\x95\x0d\xc1\xb8\
+\x51\x4d\x79\xe5\x9f\x3e\x3d\xba\x56\xc7\xd2\x37\x3b\xcb\x32\x88\
+\xe8\x37\x98\x30\x75\x13\xf6\x1d\xbc\xa6\xbb\x8f\xca\x79\x27\x74\
+\x39\xc2\x37\xed\xb0\x04\xed\xce\xab\xd9\xa5\x57\xea\xf3\xd3\x40\
+\xa4\xaa\x3e\xca\xf0\xf3\x91\x69\xe6\xa7\xa0\x22\x05\xf8\x42\x0a\
+\xf8\x3b\x3c\xf0\xb5\x08\x01\xb0\x91\x9c\x2e\x00\x34\xfb\x2f\x5b\
+\x71\x1c\xcb\x57\x9c\x70\xc9\xcc\xaf\x0f\x59\xad\x41\xf9\xfd\x10\
+\x13\x2b\xad\xa7\xff\x9c\xf9\xfe\x1d\xda\x55\xb6\xdb\xac\xb5\x04\
+\x59\x3d\x8b\x96\xec\x46\xd8\xed\x68\x94\x29\x1d\x8c\x61\xed\x2e\
+\xa0\x4e\xd1\x5d\x6c\x50\x65\xff\x7d\x90\xb9\xaf\x2d\xe9\xd5\x9f\
+\xf9\xf9\xe0\xef\x5d\x9b\xf7\xf1\x93\x23\xbd\xd7\x33\x33\x8b\x8f\
+\x96\xf5\x28\x26\xe2\xcc\xef\x45\x08\x80\x8d\xf4\x1b\xb2\x56\xb2\
+\x85\x77\x70\x29\xf0\x6a\x40\xda\x37\x2f\x3b\xdc\x45\x00\xee\x3f\
+\x88\xc5\x88\x71\x1b\x70\x3d\x34\xcb\xe4\xf6\x2f\x00\x54\xeb\x02\
+\x14\x2c\x0f\x58\xdb\xdf\xdf\x66\xd8\x67\x7f\x4a\x41\xf8\xdd\xc0\
+\x93\x3b\xe6\x9f\x46\x17\xfa\xa1\x3d\xe3\xb8\x79\x2b\x17\x19\x19\
+\x9a\x5d\x9d\xc3\xef\xc7\xa0\x44\xb1\x20\x94\x2c\x14\x83\x88\xb3\
+\x0b\x10\x7b\xdf\x74\xc6\x20\xfd\x6e\x94\xe1\x47\xd1\x7e\xc3\x80\
+\x9f\x66\xc7\x9e\xca\x99\xdd\x7b\x9d\x3b\xf3\xd3\x38\xa7\xe5\xbc\
+\xa2\x85\x03\xf9\xbf\xce\x9a\xf5\xf5\x11\x02\x60\x23\xd3\x5f\xdd\
+\x86\xed\xbf\x5f\xd4\xdd\xf6\x67\x6e\x6a\x87\xf9\x64\x09\xe4\x0c\
+\x01\x38\x72\xec\x06\x26\xcd\x90\x36\x05\x6d\x30\x08\xa8\xd9\x53\
+\x99\xdf\x3c\xfc\x82\x1a\xfb\xde\x32\xff\x78\xaf\xee\x35\xf0\xfe\
+\xdb\x5d\x65\x9b\xfd\xcd\x91\x91\xfc\x10\xb7\x8f\x8e\x41\x7c\xe4\
+\x3f\x46\x8f\x3d\x88\xce\x8f\x77\x33\x4b\x7a\x0d\xa3\xfd\xdd\x3a\
+\x57\xd3\x04\xfc\x9c\xec\xae\x50\x74\xbf\x30\xf3\xf3\x0b\x04\xfb\
+\xf1\xd2\x61\xb9\x10\x02\x60\x23\x3b\xf7\x5c\xe6\x0d\x2b\xf4\xcd\
+\xe7\xfc\x25\x34\x5b\x63\xf9\x06\x98\x7f\x5d\x3c\x9d\x8e\x05\x01\
+\x08\x3b\x09\xc4\x45\x64\xdd\x96\x43\x00\xb6\x31\xf1\xa2\xb6\xe0\
+\xfa\xb4\x67\x02\x56\xb2\xb6\x32\xbf\x79\xd2\x53\x35\xd6\x8f\x34\
+\xfd\x98\xbf\x9f\x17\x3e\x7e\xaf\x07\xda\xb6\x7e\xd6\xfe\xd4\x5f\
+\xbb\x51\x33\x11\x88\x40\xf8\xa9\x99\x12\x4b\x80\xaa\xfa\xa8\x81\
+\xa7\x61\x92\x8f\x76\xa9\x8f\xfc\x7e\x67\xce\xfc\x34\xcb\x53\xb5\
+\x5e\xc1\x42\xf9\xb8\xe9\x2f\xb7\x10\x0a\x01\xb0\x11\x0a\xa0\x4d\
+\x9f\xb3\x15\x27\x4f\xdf\x72\xfc\x60\x16\x90\x45\x00\x76\x30\x01\
+\x98\x2b\x15\x80\x0e\x0b\x80\x12\xb5\x94\xf9\xcd\x53\xe2\xd5\xf8\
+\x79\xb8\xe9\xc7\xca\x97\x0b\xc1\x86\xb5\x43\x78\x90\xcb\x55\xa4\
+\xc5\x87\xe1\xc1\xd9\x37\x10\x13\x7e\x84\x9b\xfb\xcb\xb6\x1b\xfb\
+\xfc\xb4\xde\xde\xab\x47\x0d\xbe\x4c\xe9\x2c\x9f\x9f\x8a\x9d\x02\
+\xb4\x59\x7c\x7e\xf6\x2f\xeb\xd9\x8a\x10\x00\x1b\xa1\x20\x1a\x05\
+\x01\xc7\x4f\xf9\x55\x92\xb7\x2e\x07\x79\x4d\x00\x1a\x37\x2c\x8d\
+\x95\x9f\xbf\x84\x7c\xf9\xac\x4b\x63\x95\x03\xca\x4a\x7c\x7c\xff\
+\x2a\x7e\x5b\xfb\x29\x7e\xde\x13\xc2\x7c\xff\x02\x90\xf8\xfc\x94\
+\xde\xdb\xa1\x0a\x86\x0c\x74\x5e\x7a\xaf\xb6\x68\x87\xd2\x78\x49\
+\x5c\x94\x44\x08\x80\x1d\x90\x08\xd0\x12\xda\x6b\x8b\x76\xe2\x6e\
+\x78\x8c\xe3\x07\x34\x43\x5e\x12\x00\x32\x7d\xab\x57\x2e\x84\x76\
+\x6d\x9e\xc5\x98\x51\x2d\x14\xef\x91\x97\x92\x92\x86\x63\x27\xc2\
+\xb0\xff\xe0\x35\x1c\x3f\x15\x86\xf0\x7b\xb1\x46\xcf\x21\x51\xea\
+\xd1\xad\x3a\x06\xd2\x5e\x7d\x4e\xf0\xf9\xc9\xc4\x0f\x61\xe6\x7e\
+\xa1\x82\xf9\x1c\x2f\x78\xb2\x93\x5c\x29\x00\x6d\xa9\x27\xa0\x4c\
+\xc5\x40\x5a\xb4\x29\xb4\x6b\x7f\x3e\x8b\x43\x47\x42\xf9\x92\x12\
+\x35\xd5\x74\x26\x79\x49\x00\x02\x03\xbc\x51\xed\xd9\x42\x7c\xe0\
+\x37\x6d\x52\x1e\x43\x06\x35\x62\x33\xa2\x7c\x2b\x01\xf4\xfb\x51\
+\xea\xf1\xf9\xbf\xef\xf1\x4d\x48\xf6\xec\xbf\xca\xdb\x91\xa7\xa7\
+\x9b\x6e\xdc\xa8\xf1\xf9\xeb\xf0\xa5\x3e\x47\x07\x3f\x19\x37\xb4\
+\xda\x41\xe6\xbe\xb3\x97\xf5\x6c\x25\x57\x16\x03\xc9\x59\x0d\x68\
+\x08\x6d\x5c\xf9\xf8\x71\x3c\xa2\x63\x12\xcd\x5e\x3c\xc4\xcd\xb0\
+\x68\x64\x58\x58\x06\x58\xf9\xed\x29\x5c\xb9\xfa\x48\x77\x3b\x2f\
+\x09\x40\xa9\x12\x81\x28\x5b\x2a\x88\x0f\x06\xb2\x06\x9a\x35\xad\
+\x80\xfe\x2f\xd7\xe7\xc5\x2d\xce\x82\xbe\xfe\x18\xf6\x3b\xdd\x60\
+\xd6\xe1\xe1\x63\x37\x70\x80\xcd\xf6\x64\xc1\x51\x23\xd2\xec\x20\
+\xb3\xfc\xf9\xe7\x2a\xf2\x9d\x7a\x1d\x19\xfc\x34\xce\xc9\x6d\xa0\
+\x18\x07\xb9\x39\xd9\x36\x39\xc9\x7c\x2e\xad\x04\xf8\xca\x28\x12\
+\x42\x00\x14\xe2\xd2\x95\x08\x8b\x89\x37\x6f\xbe\xbd\x07\xe7\xfe\
+\xce\xea\x38\x9c\x1b\x05\x20\x99\x09\xc0\x3a\x03\x01\xa0\x6b\xbb\
+\x56\xb5\x22\xcc\x0a\xc8\xea\x58\x43\x22\x40\x96\xc0\xd0\xc1\x8d\
+\x79\xea\xab\xbd\x03\x80\x66\x7a\xda\x5e\xec\xfe\x83\xa7\xbc\xd7\
+\x20\x2d\x83\x5e\xbc\xfc\x10\xf1\xf1\x96\x7b\xf9\x93\x35\x52\x30\
+\xc4\x1f\x8d\x1a\x95\x45\x8b\x66\x15\x1c\xda\xa8\x93\xd2\x84\x69\
+\xd6\xa7\x26\x27\xb6\xf8\xf9\x01\x4c\x28\xca\x96\x0d\xb1\xaf\x23\
+\x92\x15\x08\x01\x50\x08\x21\x00\x1a\xe2\x1e\xa9\xf1\xab\xc1\x47\
+\xca\x1f\xe8\xc3\xcd\x7f\x43\x3f\x98\xae\xf9\x86\x0d\xcb\x61\xd4\
+\x88\x66\x36\x37\xd3\xa0\x81\x4f\x05\x4e\x7b\xf7\x5f\xe3\x79\xff\
+\x67\xcf\xdf\x65\x42\x60\x9d\x8b\x46\x7d\xf3\xaa\x57\x2d\x86\x5a\
+\x35\x4b\xf0\x74\x65\xda\xaa\xdb\x5e\xb4\x35\xfa\x34\xeb\xdb\x13\
+\xd7\xa0\xd7\x57\xad\x52\x44\xb6\x5c\x00\x21\x00\x0a\x21\x04\x40\
+\x63\x82\x5f\xda\xa9\xc6\x1f\xdf\x4b\xef\x2f\x5b\x3a\x08\xa5\x8a\
+\x07\x9a\x9c\xe5\xe9\x2e\xb2\x04\x06\x0e\x68\xc8\xd3\x86\xb3\x3f\
+\xbe\x1a\x37\x6e\x46\xf1\x2d\xcf\xc8\xa7\x3f\x7b\x2e\x1c\xf1\x09\
+\x29\x16\xbf\x77\x7a\x5f\xaa\xaa\xab\x54\xb1\x30\x6a\xd7\x2e\xc1\
+\xb7\x2c\xa3\xfa\x7a\x73\x6d\xb4\xac\xc5\xdf\x9f\x99\xfb\xc1\xfe\
+\xdc\x82\xd1\xbe\x8f\xad\x08\x0b\xc0\x36\x84\x00\x58\xc0\x95\x02\
+\x90\x92\x00\x1c\xfe\x54\x8d\x7b\x59\x7b\x7e\xf2\x41\x56\xa7\x46\
+\x51\xde\x2b\xc0\x1c\xba\x98\x40\xbf\xfa\x12\x11\x20\x41\x49\x4b\
+\x4f\x47\x04\xbb\x80\xff\xf9\xef\x01\x76\xed\xb9\x82\xf3\x17\xc2\
+\xf1\xe0\x61\x5c\xb6\xf1\x18\x82\x4c\x72\xca\xad\xaf\x58\xbe\x10\
+\x9f\xe9\x69\xd0\xd3\x2c\xad\x72\x30\xdd\x96\x5e\x4d\x33\x3d\x1d\
+\x8b\x9a\x70\x7a\xda\x7b\x3c\x95\x66\x79\xb0\x70\xe1\x40\x11\x03\
+\xb0\x01\x21\x00\x16\x70\xa5\x00\x44\x85\xa9\xb1\x7b\x31\x13\x82\
+\xac\xeb\x8d\x47\xff\x6b\x55\x2f\x6a\xb1\x04\x81\x44\xa0\x71\xa3\
+\x72\x18\xf1\x4a\x53\x78\x79\x7b\x20\x29\x31\x8d\xf7\x11\xa4\xcc\
+\xc6\x33\x7f\xde\xc1\x9d\xbb\x4f\xac\x98\xe9\xc1\x83\x78\xb4\x33\
+\x11\x6d\x33\x46\x03\xbf\x58\xd1\xfc\x4e\xcb\xb1\xa7\xe3\x50\xea\
+\x2e\x2d\xeb\x79\x7b\xbb\x36\xba\x6f\x2d\x42\x00\x14\x42\x08\x00\
+\x70\x61\x93\x1a\xe7\xd6\x49\xef\x2b\x5f\x36\x18\x25\x8b\x05\x5a\
+\xf5\x7a\x32\xf1\x2b\x54\xd4\xf8\xc3\x87\x8e\xde\xb0\x3a\x07\xc3\
+\xd7\xd7\x13\x55\x2b\x17\x45\xa3\x86\x65\xd8\x05\x5e\x96\x0d\xd0\
+\x00\x27\x0f\x4e\x35\x6f\xce\x41\xc9\x3c\x8e\x04\x2c\x5d\x81\x10\
+\x00\x85\xc8\xeb\x02\x90\x9a\x08\xec\x59\xa2\x46\xe4\xf5\xac\xfb\
+\xa8\x7b\x4e\x8d\xca\x85\xf9\x92\x98\x29\x68\xc0\xd3\x77\x16\x9f\
+\x90\x8a\xe8\x98\x24\x44\x3d\x49\x42\x4a\x72\x3a\xd2\xad\x28\x63\
+\xa6\x63\x52\x00\xaf\x51\x83\x32\xfc\xff\xb4\xe6\x2e\xc7\xe0\xa4\
+\xe0\x24\x05\x0d\xc9\x35\x71\x34\x66\xe0\x0a\x84\x00\x28\x44\x5e\
+\x17\x80\x07\x17\xd5\x38\xf8\xa1\xd4\xfc\x2f\x10\xec\xcb\xa3\xff\
+\x86\x83\x26\x8d\xf9\xef\x14\xb1\x7f\x92\x39\xe8\x13\x12\x53\x99\
+\x4f\x6f\x79\xd0\xd3\x00\x27\x93\x9e\x06\x7c\xfd\xba\xa5\x78\xff\
+\x41\xf2\xc3\xe5\x18\x94\x3c\x86\x10\x92\x8f\x9b\xfc\x72\x35\x00\
+\x51\x02\x21\x00\x0a\x91\xd7\x05\xe0\xec\xcf\x6a\xfc\xb3\x59\x7a\
+\x5f\xa5\xf2\x05\x50\xac\x48\x80\x6e\x47\xe2\xd4\xd4\x0c\x44\x45\
+\x27\xe2\x31\x1b\xf4\x71\x71\x29\x56\xcd\xf4\x44\xc1\x82\xfe\x68\
+\xd2\xa8\x2c\x1a\xd6\x2b\x83\x1a\xd5\x8b\x31\x93\xdf\x5b\xd6\x6a\
+\x42\xca\x57\x28\xca\x7e\x1b\x3f\x07\x7a\xf1\xb9\x0b\xb9\x52\x00\
+\xe4\x6c\x0b\x6e\x2f\x79\x59\x00\xd2\x53\xd5\xf8\x6d\x06\xf0\xf4\
+\x61\xd6\x7d\xe4\x97\x57\xa7\xd9\xdf\x43\xc5\x66\xfa\x64\x3e\xf0\
+\x63\x9e\x26\x5b\xdd\x94\x98\xbe\x9b\x9a\x35\x4a\xa0\x65\x8b\xf2\
+\xa8\x51\xad\xb8\x22\xb5\x03\x54\xf9\x57\xa4\x70\x3e\x9e\xa2\x9c\
+\xd3\x07\xbe\x16\xd1\x16\x5c\x21\xf2\xb2\x00\xdc\xff\x57\x8d\x7d\
+\x4b\x81\x8c\xb4\xac\xfb\xfc\x98\x00\x50\x97\x1b\xca\xc8\x4b\x4d\
+\xcb\xb0\x38\xf0\x29\xc2\x4e\x7e\xfc\xb3\xcf\x14\xc6\x73\xcd\xcb\
+\x33\xff\xbe\x20\x4f\xb0\xf1\xf2\x94\x63\xe0\xab\x75\x29\xc9\xda\
+\x7f\x83\x83\x7c\xb9\xc9\x9f\x2f\xc0\x87\xef\xaa\x9b\x5b\xc8\x95\
+\xc5\x40\x42\x00\xcc\xa3\xb4\x00\x64\xa4\x03\x7f\xae\x51\xe3\xd2\
+\xef\xb6\xbf\x96\x06\x1e\xf9\xf0\xcf\x54\x2a\x8c\xe6\x4d\xca\xa1\
+\x6a\x95\xa2\x28\x59\x22\x88\xc7\x04\xa2\xa2\x12\x90\x66\x45\x5c\
+\x40\xd3\x85\x45\xa5\x09\xd0\x81\xff\x47\xf7\xb7\x8a\x8d\x63\x1a\
+\xcc\xd4\xce\x8d\xfe\xa5\x14\x5d\x5a\xb7\xa7\xdb\xb4\xd2\xe0\xc1\
+\x07\x3f\xf8\xdf\x9e\x9e\x1a\x21\xa0\x54\xde\x12\xc5\x83\x14\x2f\
+\xdb\x95\x0b\x21\x00\x0a\x91\x57\x05\x20\x39\x4e\x8d\xdf\x5f\x07\
+\x62\xef\x5b\xff\x1a\x1a\x68\x34\xd8\xc9\xaf\xa7\x60\x1e\xed\x1f\
+\xa0\x6f\x72\xd3\x9a\x7f\x4a\x6a\x86\xc1\x6b\xa8\xbc\x36\x73\x10\
+\x67\x0e\x60\x2f\xf6\xaf\xf6\x6f\x8f\xcc\x81\xcd\x07\xb8\xf6\xb6\
+\x1d\xeb\xff\x74\x1a\x74\x3e\x96\xb2\x12\x73\x0a\x42\x00\x14\x22\
+\xaf\x0a\x40\xf8\x79\x8d\xf9\x6f\x09\x2a\x8b\x7d\xa6\x62\x21\xd4\
+\xad\x53\x0a\xad\x5f\xa8\xc4\xa3\xf9\xe4\xd7\x7b\xf2\x41\xab\x19\
+\xb0\xf4\x37\xd5\x0b\xdc\xb9\xf3\x04\x69\xec\xbb\xa4\xc1\xec\xe9\
+\xe5\x61\xb1\x75\x96\x33\xfd\x75\x2e\x00\x25\x83\x9d\x5a\xa5\xe8\
+\x4a\x84\x00\x28\x44\x5e\x15\x80\xcb\xbb\xd5\x38\xfd\x6d\xf6\xcf\
+\xa1\x99\x7e\xf2\xf8\x16\x7c\xdd\x9e\x2a\xe6\xb4\xbe\x37\x37\xd5\
+\x69\xa6\xd6\xfe\x9d\x39\x90\xa3\xa3\x13\x10\x11\x19\xcf\x4b\xb1\
+\x95\x84\xde\x9e\x56\x00\xc8\x0d\x71\xa4\x40\xc8\x9d\x10\x02\xa0\
+\x10\x79\x55\x00\x22\x6f\xa8\xb1\x67\x31\x90\x9a\xd9\x3d\xcd\xc3\
+\x4b\x1a\x0c\x24\x46\x0c\x6b\x84\x79\xb3\xda\x58\x7d\x4c\x5a\x36\
+\x4c\x4a\x4a\x63\x6e\x80\x73\x1b\xb0\x58\xc2\x23\xb3\x4d\x77\x6e\
+\x19\xfc\x84\x10\x00\x85\xc8\xab\x02\xa0\x66\x93\xf4\xbd\x0b\x6a\
+\xdc\x38\x02\x78\xe7\x03\x0a\x57\x02\x8e\x7f\x29\x7d\x8e\xad\x02\
+\x20\x70\x1e\x42\x00\x14\xc2\x6d\x04\xc0\x05\x6d\xc1\x69\x89\x4f\
+\x4d\x11\x7b\x95\xc6\x12\x58\x67\xd0\x16\x7c\x24\x13\x80\xb9\x42\
+\x00\x5c\x82\x10\x00\x85\x70\x17\x01\xa0\xa6\x97\x53\x66\xfd\x26\
+\xe9\x5f\xd8\x6c\x2c\x50\xb9\xad\x32\xbf\xf9\x63\xe6\x12\x6c\x9f\
+\x2b\xbd\x6f\xe6\xd4\x17\xf8\x1e\x81\x02\xe5\x11\x02\xa0\x10\xee\
+\x22\x00\xd7\x43\x23\x31\x6a\xc2\x2f\x92\xae\xb7\x21\xe5\x80\x46\
+\xc3\x80\x42\x15\xc0\xd7\xc6\xe5\x80\xac\x80\xb8\x87\xc0\xb9\x0d\
+\xc0\xdd\xbf\xb2\xee\xa7\x65\xbb\x1f\xbe\xe9\x87\xc6\x0d\xcb\xca\
+\xf3\xc6\x82\x6c\x11\x02\xa0\x10\xee\x22\x00\x74\x0e\x6f\xbc\xb5\
+\x07\x3f\xff\x72\xde\xf1\x83\x39\x81\xba\xb5\x4b\x62\xfd\x9a\xc1\
+\xb2\xec\x7b\x27\xb0\x4c\xae\x14\x00\x25\xda\x82\xdb\x8a\xbb\x08\
+\x00\x41\x2d\xcc\x27\x4f\xdf\x8c\xcb\x7a\x1d\x88\x5d\x41\xd1\x22\
+\x81\xf8\xf8\xbd\xee\x7c\x19\x50\xe0\x1a\x72\x65\x31\x90\xa8\x06\
+\xcc\x1e\x3a\x8f\xbf\x2f\xdc\xc3\xcc\x79\xdb\x79\x56\x9d\x2b\x28\
+\x52\x24\x00\xb3\xa7\xb5\xe2\x1b\x6d\x78\xca\xb8\xf9\xa5\x20\x7b\
+\x84\x00\x28\x84\x3b\x09\x00\x41\x6b\xe9\x14\x0f\xf8\xf0\xd3\xc3\
+\x38\x7a\xe2\x26\x2f\xc5\x55\x02\x32\xf5\x6b\x56\x2f\x8e\x39\x33\
+\x5a\xa1\x51\x83\xd2\xb2\xee\x7c\x2b\xb0\x4c\x9e\x10\x00\xca\xdd\
+\x1e\x3a\xa8\x81\x4b\x4f\x8c\x1a\x57\x5a\xda\x18\x64\xf7\xde\xab\
+\xbc\x95\xb5\x16\x39\x05\x40\x0b\x89\xd2\xb5\xeb\x8f\x70\xfc\xd4\
+\x2d\x3c\x78\x10\x6b\x75\x39\xae\xcd\xb0\x5f\x86\xaa\xe9\x28\xb7\
+\x9f\x1a\x76\x08\x9f\xdf\x3d\xc8\x13\x02\x90\x53\x51\x42\x00\x04\
+\x79\x9b\x5c\x29\x00\x6d\xbb\x7c\xa9\xbe\x75\x5b\x08\x80\x40\x60\
+\x89\x5c\x29\x00\xfd\x06\xaf\x56\xff\x75\xde\x86\xfa\x53\x37\x45\
+\x08\x80\x40\x6e\x72\xa5\x00\x10\x9d\x7a\xae\x54\x87\x86\x46\x41\
+\x2e\x97\x56\x09\x84\x00\x08\xe4\x26\xd7\x0a\x40\x4e\xa4\x4f\xff\
+\xef\xd4\x17\xfe\xcd\x6a\x9c\x27\x04\x40\x20\x37\x42\x00\xdc\x88\
+\xc1\x23\xd6\xaa\x4f\x9d\xb9\xab\xbb\x2d\x04\x40\x20\x37\x42\x00\
+\xdc\x08\x21\x00\x02\xa5\x11\x02\xe0\x46\x0c\x1d\xf9\x93\xfa\xc4\
+\xe9\xdb\xba\xdb\x42\x00\x04\x72\x63\xd4\x16\xbc\x49\x59\xfc\xf0\
+\x6d\x0e\x6f\x0b\x9e\x53\x19\x3e\x66\xbd\x9a\xb2\xf2\xb4\x08\x01\
+\x10\xc8\x4d\xae\x2c\x06\xca\xa9\x08\x01\x10\x28\x8d\x10\x00\x37\
+\x42\x08\x80\x40\x69\x84\x00\xb8\x11\x42\x00\x04\x4a\x23\x04\xc0\
+\x8d\x10\x02\x20\x50\x1a\x21\x00\x6e\x84\x10\x00\x81\xd2\x08\x01\
+\x70\x23\x84\x00\x08\x94\x46\x08\x80\x1b\x21\x04\x40\xa0\x34\x42\
+\x00\xdc\x08\x21\x00\x02\xa5\x11\x02\xe0\x46\x08\x01\x10\x28\x8d\
+\x10\x00\x37\x42\x08\x80\x40\x69\x84\x00\xb8\x11\x43\x46\xfc\xa8\
+\x3e\x79\xe6\x8e\xee\xb6\x10\x00\x81\xdc\x18\x0a\x40\xb3\xc6\x65\
+\xb0\x66\xd5\xa0\x1c\x3b\x8e\x72\xec\x89\x13\xa2\x1a\x50\xa0\x34\
+\xa2\x1a\xd0\x8d\x10\x02\x20\x50\x1a\x21\x00\x6e\x84\x10\x00\x81\
+\xd2\x08\x01\x70\x23\x84\x00\x08\x94\x46\x08\x80\x1b\x21\x04\x40\
+\xa0\x34\x42\x00\xdc\x08\x21\x00\x02\xa5\x11\x02\xe0\x46\x08\x01\
+\x10\x28\x8d\x10\x00\x37\xc2\x50\x00\xbc\xbd\x3d\x51\xbb\x66\x71\
+\x57\x9f\x96\x20\x17\x73\xe1\xdf\x07\x48\x4d\x4d\xd7\xdd\x16\x02\
+\xe0\x42\x0c\x05\x40\x20\x50\x1a\x21\x00\x2e\x64\xe8\xc8\x1f\xd5\
+\x27\x4e\xdf\x71\xfc\x40\x02\x81\x9d\x34\x6f\x52\x06\x3f\x7c\x2b\
+\x32\x01\x5d\xc2\x67\xcb\x0f\xab\x97\xad\x38\x29\xdf\x16\xdd\x02\
+\x41\x36\xa8\xd8\xe8\x99\x3a\xa1\x39\x26\x8d\x7f\x3e\xc7\x8e\xa3\
+\x1c\x7b\xe2\x5a\xde\xfb\xf8\xa0\xfa\xe0\xa1\xeb\x48\xcf\x30\xad\
+\x02\x6a\x75\x06\x32\x32\xac\x57\x08\x4f\x4f\x4f\xab\x9f\xab\x66\
+\xca\x93\x91\x91\x61\xc3\xb1\x3d\x60\xed\x57\x6e\xf3\xb1\x3d\x3c\
+\x34\x57\xa4\x0c\xc7\xf6\x60\xc7\x56\xb9\xc1\xb1\x49\xe9\xd3\xdd\
+\xe4\xd8\x5e\x5e\x1e\x68\xdf\xba\x32\x66\xcf\x68\x9d\xa3\xc7\x50\
+\x8e\x3e\x79\x81\x40\xe0\x18\x42\x00\x04\x82\x3c\x8c\x10\x00\x81\
+\x20\x0f\x23\x04\x40\x20\xc8\xc3\x08\x01\x10\x08\xf2\x30\x42\x00\
+\x04\x82\x3c\x8c\x10\x00\x81\x20\x0f\x23\x04\x40\x20\xc8\xc3\x08\
+\x01\x10\x08\xf2\x30\x42\x00\x04\x82\x3c\x8c\x10\x00\x81\x20\x0f\
+\x23\x04\x40\x20\xc8\xc3\x08\x01\x10\x08\xf2\x30\x42\x00\x04\x82\
+\x3c\x8c\x10\x00\x81\x20\x0f\x23\x04\x40\x20\xc8\xc3\xfc\x1f\x99\
+\xa5\xf4\xb3\xb4\x84\x9c\x85\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x00\xe0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x00\x95\x49\x44\x41\x54\x48\x89\xed\x95\x41\x0a\
+\x83\x30\x10\x45\x1f\x5d\x58\x6f\x24\x18\xbc\x5e\xab\x5e\x4c\x7a\
+\x90\xc4\x4b\x14\xda\x45\x13\x48\x35\x12\xa7\xa6\x82\x92\x0f\x9f\
+\x81\x04\xfe\x9b\xc9\x62\x02\x67\xd1\x15\xe8\x01\x03\xbc\x02\x7e\
+\x00\xe5\x16\x40\xbf\x10\xec\xbb\xdd\x02\x70\x9d\xd7\x81\xbb\x0a\
+\x78\x5a\x57\xbf\x02\x5c\x97\x4b\x6a\x89\x4f\xe8\x6c\x80\x0e\x28\
+\x24\x80\x12\x18\x04\x90\xd9\x93\xc6\x00\x12\x29\x9b\xa5\xff\x05\
+\xf8\xca\xbb\x24\x0c\x0d\x2a\x03\x32\x20\x03\x76\x04\x8c\xb6\xaa\
+\x04\x99\x8d\xad\xc6\x3f\x94\xac\xe3\xb5\xbe\xf9\x80\x82\xcf\x0e\
+\xd7\x09\x82\x35\x70\x67\xf2\x1f\x1c\x57\x6f\xcd\xad\x63\x52\x3c\
+\xde\x4d\x9c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x5d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x12\x49\x44\x41\x54\x48\x89\xbd\x95\xcf\x6a\
+\xc2\x40\x10\x87\x3f\x44\x2c\xf6\x28\x36\x28\x78\xef\x3b\xb4\xf8\
+\x3e\xbe\x89\x96\xbe\x47\x8b\x7f\x8e\x3e\x80\xc5\xa3\xb7\xe6\xa0\
+\x17\x8f\x2a\xf8\x00\xed\x41\x41\x0f\xfe\x02\x41\x77\xb3\xeb\x66\
+\x71\x60\x98\x64\x76\xe6\xfb\x6d\x66\x49\x02\x71\xed\x59\x1e\xdd\
+\x9a\xc0\x04\x38\xca\xc7\x40\x23\x16\x3c\x01\x52\xe0\x04\xfc\xc9\
+\x4f\xc0\x28\x5f\xf4\x04\x7c\x02\x5b\x2d\xda\x7c\x5e\x00\x4f\x81\
+\x16\xd0\x91\xc8\x01\xa8\x67\x85\x1f\x0e\xb0\x49\xe0\x1a\x9e\x28\
+\xdf\x06\xfe\xaf\x05\xb2\x9d\xbf\xf9\x4d\xc5\x0a\xcf\xe7\x87\xf9\
+\x86\x6c\x87\xb1\xe0\x29\x97\x83\xbf\x5b\xe0\x05\xf8\x55\xed\x92\
+\xcb\xcc\x8b\xf2\x77\x09\x04\xc3\x7d\x04\x4a\xc1\x5d\x02\xa5\xe1\
+\x2e\x81\x05\xee\x03\x4d\xcc\xad\x6e\x81\x57\xe5\xf7\x9e\xf0\x39\
+\xb7\x2f\x63\xa1\x40\x4f\xf9\x2f\xdd\xbb\xc6\x62\x9d\x84\x6d\xe1\
+\x5b\xf9\xa9\xae\xf7\x96\x9d\x07\x0b\x98\xbe\x4d\x0b\x0b\xdc\xc8\
+\xa9\x5a\x0a\x33\x5b\x2b\xfe\x00\x33\xc5\x95\xa3\xc7\x4f\x39\xd0\
+\x6e\x38\x95\x08\xd0\x42\x7b\x98\xc0\x4e\xf1\xbd\x04\xab\xab\xb8\
+\x35\x2d\x0e\xf0\xfb\xe1\xf8\x78\xdf\x24\x50\x93\xc8\xa6\x04\x78\
+\x23\x78\x2d\xe0\xe9\xc3\xed\x0c\xe8\x8e\xae\x8a\xf5\xd0\x8a\x2c\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\x53\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x08\x49\x44\x41\x54\x48\x89\xed\xd2\xbf\x2b\
+\x85\x71\x14\xc7\xf1\xd7\x7d\x32\x49\x22\x75\x8b\x18\xc4\x62\x30\
+\xa1\x94\xcd\xc0\xe2\x5f\x30\x31\x90\x6c\x26\xab\x45\x19\xfc\x05\
+\xca\x6c\x15\x9b\x2c\x16\x49\x8c\x64\xa1\xc8\xa6\x0c\x32\xb9\x0c\
+\xf7\x3c\x79\xba\x3d\x8f\x7b\x6f\x96\x3b\x3c\xef\x3a\xc3\xf7\xfc\
+\xf8\x9c\xef\xf9\x7e\x0f\x25\x25\x1d\x4f\xa5\x49\x3c\xc1\x2c\xc6\
+\x31\x8c\x4f\x3c\xe0\x16\xcf\xff\x69\xdc\x8f\xbd\x10\xf9\xce\xb1\
+\x2f\x1c\x63\xa1\xe0\x52\x6b\x98\x2c\x12\x5f\xc2\x4b\x46\xec\x0e\
+\x87\xd8\xc1\x3e\x4e\xf0\x91\x89\x1f\xa1\x27\x53\x3f\x17\xfe\xd3\
+\x3c\xf1\x0d\xd4\x22\xe1\x1c\x33\x7f\x4c\xb8\x85\xf7\xc8\xbd\x46\
+\x35\x62\xf3\xe1\x3b\x6b\x2c\x5a\x54\x1f\xbd\x16\xc5\xcd\xfe\x07\
+\xc6\x70\xef\x77\xd2\x91\xa2\x06\xdd\x78\x8a\xc0\x76\x0b\xc2\x59\
+\xaa\xb8\x89\xda\x47\x2c\xe7\x35\x58\x0f\xe7\x95\xfa\x27\xb5\x4b\
+\x1f\x2e\x42\xe3\x2d\xdb\xa0\x2b\x12\xd2\x6d\xd8\x55\x7f\xa2\x56\
+\x48\xb0\x89\xc1\x38\x5f\x62\x08\xa3\x71\xee\xcd\x26\x4f\x60\x55\
+\x6b\xef\x9e\x32\x25\x7f\x85\x53\x7b\xd5\xa6\x60\x23\x15\xac\x60\
+\xa0\xc1\x9f\x60\x1a\x07\x0a\x56\xb5\xa4\xa4\xc3\xf8\x01\x99\x78\
+\x45\x67\xe4\xac\x4d\x88\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
 \x00\x00\x02\x7c\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -150,84 +1335,6 @@ qt_resource_data = b"\
 \x7f\xc8\xff\x90\x93\xf8\xd0\x90\x4b\x84\x44\x88\x53\x42\xe2\x9f\
 \x7e\x33\x76\xc7\x6a\xae\x49\x78\xb8\x85\xec\x00\x00\x00\x00\x49\
 \x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x5d\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01\x12\x49\x44\x41\x54\x48\x89\xbd\x95\xcf\x6a\
-\xc2\x40\x10\x87\x3f\x44\x2c\xf6\x28\x36\x28\x78\xef\x3b\xb4\xf8\
-\x3e\xbe\x89\x96\xbe\x47\x8b\x7f\x8e\x3e\x80\xc5\xa3\xb7\xe6\xa0\
-\x17\x8f\x2a\xf8\x00\xed\x41\x41\x0f\xfe\x02\x41\x77\xb3\xeb\x66\
-\x71\x60\x98\x64\x76\xe6\xfb\x6d\x66\x49\x02\x71\xed\x59\x1e\xdd\
-\x9a\xc0\x04\x38\xca\xc7\x40\x23\x16\x3c\x01\x52\xe0\x04\xfc\xc9\
-\x4f\xc0\x28\x5f\xf4\x04\x7c\x02\x5b\x2d\xda\x7c\x5e\x00\x4f\x81\
-\x16\xd0\x91\xc8\x01\xa8\x67\x85\x1f\x0e\xb0\x49\xe0\x1a\x9e\x28\
-\xdf\x06\xfe\xaf\x05\xb2\x9d\xbf\xf9\x4d\xc5\x0a\xcf\xe7\x87\xf9\
-\x86\x6c\x87\xb1\xe0\x29\x97\x83\xbf\x5b\xe0\x05\xf8\x55\xed\x92\
-\xcb\xcc\x8b\xf2\x77\x09\x04\xc3\x7d\x04\x4a\xc1\x5d\x02\xa5\xe1\
-\x2e\x81\x05\xee\x03\x4d\xcc\xad\x6e\x81\x57\xe5\xf7\x9e\xf0\x39\
-\xb7\x2f\x63\xa1\x40\x4f\xf9\x2f\xdd\xbb\xc6\x62\x9d\x84\x6d\xe1\
-\x5b\xf9\xa9\xae\xf7\x96\x9d\x07\x0b\x98\xbe\x4d\x0b\x0b\xdc\xc8\
-\xa9\x5a\x0a\x33\x5b\x2b\xfe\x00\x33\xc5\x95\xa3\xc7\x4f\x39\xd0\
-\x6e\x38\x95\x08\xd0\x42\x7b\x98\xc0\x4e\xf1\xbd\x04\xab\xab\xb8\
-\x35\x2d\x0e\xf0\xfb\xe1\xf8\x78\xdf\x24\x50\x93\xc8\xa6\x04\x78\
-\x23\x78\x2d\xe0\xe9\xc3\xed\x0c\xe8\x8e\xae\x8a\xf5\xd0\x8a\x2c\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x03\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\xb8\x49\x44\x41\x54\x48\x89\xdd\x95\x4b\x0e\
-\x82\x30\x10\x86\x3f\x8c\xd1\x13\x48\xe2\x55\x34\x5e\xcf\x07\xd7\
-\x62\xc9\x0e\x16\x9e\x00\x3c\x06\x6e\xa6\xa6\x34\xb4\x99\x11\x12\
-\x63\xff\x64\xd2\xe7\xfc\x5f\xdb\x59\x14\x72\xd2\x1e\xa8\x80\x01\
-\x18\x0d\xd1\x00\xa5\x06\x50\x19\x8d\xfd\xe8\x34\x10\x77\xf2\x93\
-\x8c\x5d\x72\x4a\xa5\x98\xab\x20\xa1\xa1\x06\x00\x70\x00\x5a\xd9\
-\xfb\x04\x8e\x6b\x03\xd4\x90\x18\x20\x15\xb5\xb7\xdf\x7f\xae\x46\
-\x03\xa8\x8d\x00\x07\x89\xde\xdc\xf2\x24\x29\x4d\x7c\x36\x2b\x18\
-\x26\xf5\x53\x80\xa6\x06\xb1\x5a\x7c\x54\x78\xfd\x31\x98\xb3\xd6\
-\x23\xcc\x2b\x00\xb6\x86\xc4\x98\x92\x07\xc9\xbb\xc8\xff\x07\x78\
-\x49\x7b\x5e\xe0\x77\x91\x76\x98\x5b\xbc\xf3\xfd\x87\x13\xc6\x75\
-\x0e\xb0\x03\x1e\x40\xbf\xc0\xb8\x07\x6e\xe2\x95\x89\xde\xa7\xf1\
-\x86\xe6\xe0\x15\x09\x0f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x00\xe0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x95\x49\x44\x41\x54\x48\x89\xed\x95\x41\x0a\
-\x83\x30\x10\x45\x1f\x5d\x58\x6f\x24\x18\xbc\x5e\xab\x5e\x4c\x7a\
-\x90\xc4\x4b\x14\xda\x45\x13\x48\x35\x12\xa7\xa6\x82\x92\x0f\x9f\
-\x81\x04\xfe\x9b\xc9\x62\x02\x67\xd1\x15\xe8\x01\x03\xbc\x02\x7e\
-\x00\xe5\x16\x40\xbf\x10\xec\xbb\xdd\x02\x70\x9d\xd7\x81\xbb\x0a\
-\x78\x5a\x57\xbf\x02\x5c\x97\x4b\x6a\x89\x4f\xe8\x6c\x80\x0e\x28\
-\x24\x80\x12\x18\x04\x90\xd9\x93\xc6\x00\x12\x29\x9b\xa5\xff\x05\
-\xf8\xca\xbb\x24\x0c\x0d\x2a\x03\x32\x20\x03\x76\x04\x8c\xb6\xaa\
-\x04\x99\x8d\xad\xc6\x3f\x94\xac\xe3\xb5\xbe\xf9\x80\x82\xcf\x0e\
-\xd7\x09\x82\x35\x70\x67\xf2\x1f\x1c\x57\x6f\xcd\xad\x63\x52\x3c\
-\xde\x4d\x9c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x04\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\xb9\x49\x44\x41\x54\x48\x89\xed\x92\x3d\x0a\
-\xc2\x40\x10\x85\xbf\xc2\x46\x4b\xd1\x45\xc1\xde\xab\x79\x32\xc5\
-\x9f\xd2\x03\x28\x29\xd3\xb9\x85\x36\xb6\x16\x39\x40\x2c\x14\x62\
-\x91\x17\x08\xb2\x26\x88\xb3\x85\x90\x07\x8f\xdd\x1d\x76\xbe\x19\
-\x66\x17\xfe\x44\x03\xd9\x5c\x23\x60\x07\x3c\xe5\x2d\x30\xb4\x82\
-\x3b\xc0\x03\x05\x90\xcb\x05\xb0\xb1\x86\x7b\x60\x02\xcc\x54\xe4\
-\x01\xf4\x2d\xe1\x4e\xf1\x29\x70\xff\xb5\xc0\x27\x78\x3d\xbe\x8e\
-\x09\xf7\x94\x0f\xff\xb5\xc6\xc0\x49\x90\x33\xe5\xcc\x9b\xe2\x1d\
-\xbc\x83\x47\x82\x03\xa4\xb4\xff\x73\x17\x4e\x6d\xd7\x5c\x90\x2c\
-\x06\x1c\x60\x21\xd0\x52\x67\xb3\xb1\x54\x5a\x09\xb6\xd7\x3e\xc3\
-\xa8\xf3\x4a\x37\x01\xeb\x4e\xdf\xe0\x49\xe0\x4e\xc8\x49\x95\xd0\
-\xab\x25\x5f\xb5\x1e\x81\x83\xd6\x8b\x45\xe7\x9d\x1a\xf5\x02\x4d\
-\x27\x6e\xe8\x7d\x7d\x4e\x3d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
 \x00\x00\x01\xa7\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -257,48 +1364,6 @@ qt_resource_data = b"\
 \x02\xdc\x61\x9a\xb1\x8e\x19\x05\xc7\x98\xf1\x5e\x2e\x4a\xfe\x2b\
 \xf8\x04\xf2\x73\x5e\xdc\xf9\xef\x28\x5f\x00\x00\x00\x00\x49\x45\
 \x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x53\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x01\x08\x49\x44\x41\x54\x48\x89\xed\xd2\xbf\x2b\
-\x85\x71\x14\xc7\xf1\xd7\x7d\x32\x49\x22\x75\x8b\x18\xc4\x62\x30\
-\xa1\x94\xcd\xc0\xe2\x5f\x30\x31\x90\x6c\x26\xab\x45\x19\xfc\x05\
-\xca\x6c\x15\x9b\x2c\x16\x49\x8c\x64\xa1\xc8\xa6\x0c\x32\xb9\x0c\
-\xf7\x3c\x79\xba\x3d\x8f\x7b\x6f\x96\x3b\x3c\xef\x3a\xc3\xf7\xfc\
-\xf8\x9c\xef\xf9\x7e\x0f\x25\x25\x1d\x4f\xa5\x49\x3c\xc1\x2c\xc6\
-\x31\x8c\x4f\x3c\xe0\x16\xcf\xff\x69\xdc\x8f\xbd\x10\xf9\xce\xb1\
-\x2f\x1c\x63\xa1\xe0\x52\x6b\x98\x2c\x12\x5f\xc2\x4b\x46\xec\x0e\
-\x87\xd8\xc1\x3e\x4e\xf0\x91\x89\x1f\xa1\x27\x53\x3f\x17\xfe\xd3\
-\x3c\xf1\x0d\xd4\x22\xe1\x1c\x33\x7f\x4c\xb8\x85\xf7\xc8\xbd\x46\
-\x35\x62\xf3\xe1\x3b\x6b\x2c\x5a\x54\x1f\xbd\x16\xc5\xcd\xfe\x07\
-\xc6\x70\xef\x77\xd2\x91\xa2\x06\xdd\x78\x8a\xc0\x76\x0b\xc2\x59\
-\xaa\xb8\x89\xda\x47\x2c\xe7\x35\x58\x0f\xe7\x95\xfa\x27\xb5\x4b\
-\x1f\x2e\x42\xe3\x2d\xdb\xa0\x2b\x12\xd2\x6d\xd8\x55\x7f\xa2\x56\
-\x48\xb0\x89\xc1\x38\x5f\x62\x08\xa3\x71\xee\xcd\x26\x4f\x60\x55\
-\x6b\xef\x9e\x32\x25\x7f\x85\x53\x7b\xd5\xa6\x60\x23\x15\xac\x60\
-\xa0\xc1\x9f\x60\x1a\x07\x0a\x56\xb5\xa4\xa4\xc3\xf8\x01\x99\x78\
-\x45\x67\xe4\xac\x4d\x88\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x00\xfb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x04\x03\x00\x00\x00\x12\x59\x20\xcb\
-\x00\x00\x00\x30\x50\x4c\x54\x45\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xff\xff\x5a\x81\x3a\x19\x00\x00\x00\x0e\
-\x74\x52\x4e\x53\x00\x06\x07\x3a\x3b\x3d\x86\x87\x88\x89\x8a\xc3\
-\xe5\xe6\x16\xa0\x37\x02\x00\x00\x00\x01\x62\x4b\x47\x44\x0f\x18\
-\xba\x00\xd9\x00\x00\x00\x5f\x49\x44\x41\x54\x18\xd3\x63\x60\x40\
-\x05\xdc\xef\xc0\x60\x03\x98\xc3\x07\xe1\x3c\x80\x70\x1e\x20\x48\
-\x32\x38\x4c\x6b\xdf\x41\xc1\x4d\x01\x06\xae\x77\x70\xd0\xc0\xc0\
-\xfb\x18\x66\xb9\xdf\x01\x98\x46\x88\x2e\x34\x0e\xcc\x6d\x60\x0e\
-\xcc\x6d\x10\x0e\xd4\x1e\x20\xcd\xfb\x04\xc6\x89\x3b\xc0\xc0\x01\
-\x75\x3c\x50\x71\x02\x03\xe3\x1c\x18\xe7\xb8\x00\x7e\x57\x23\x7b\
-\x1b\x25\x40\x10\x00\x00\x53\xc1\x60\xb3\x87\xbb\xc1\xfb\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 "
 
 qt_resource_name = b"\
@@ -306,109 +1371,116 @@ qt_resource_name = b"\
 \x00\x6f\xa6\x53\
 \x00\x69\
 \x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0d\
-\x09\xc3\x5e\x07\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x2d\x00\x70\x00\x6c\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
 \x03\xc6\x59\xa7\
 \x00\x70\
 \x00\x6c\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x04\xb2\x58\xc7\
-\x00\x75\
-\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0e\
 \x04\x1b\xda\x07\
 \x00\x72\
 \x00\x65\x00\x66\x00\x72\x00\x65\x00\x73\x00\x68\x00\x2d\x00\x63\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x0b\xdf\x21\x47\
-\x00\x73\
-\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x0c\x9c\x06\xa7\
-\x00\x6c\
-\x00\x61\x00\x79\x00\x65\x00\x72\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
-\x0b\x07\x5a\x27\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x07\x0b\x21\x47\
 \x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x64\x00\x69\x00\x74\x00\x2d\x00\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
 \x08\xc8\x58\x67\
 \x00\x73\
 \x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x09\xc3\x5e\x07\
+\x00\x66\
+\x00\x69\x00\x6c\x00\x65\x00\x2d\x00\x70\x00\x6c\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0a\x2a\x77\xe7\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x0a\xb1\xba\xa7\
+\x00\x61\
+\x00\x70\x00\x70\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x0a\
 \x0a\xc8\xfb\x07\
 \x00\x66\
 \x00\x6f\x00\x6c\x00\x64\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x07\x0b\x21\x47\
+\x00\x08\
+\x0b\x07\x5a\x27\
 \x00\x65\
-\x00\x64\x00\x69\x00\x74\x00\x2d\x00\x33\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0d\xc5\xb9\x87\
-\x00\x70\
-\x00\x6f\x00\x77\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x64\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x08\
 \x0b\xb2\x58\x47\
 \x00\x72\
 \x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0a\x2a\x77\xe7\
+\x00\x0c\
+\x0b\xdf\x21\x47\
+\x00\x73\
+\x00\x65\x00\x74\x00\x74\x00\x69\x00\x6e\x00\x67\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0c\x9c\x06\xa7\
+\x00\x6c\
+\x00\x61\x00\x79\x00\x65\x00\x72\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x0d\xc5\xb9\x87\
 \x00\x70\
-\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x6f\x00\x77\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x02\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x00\xff\
-\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xe9\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x01\x90\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x52\
-\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x09\x67\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
 \x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x44\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x5c\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x6e\
-\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x08\x06\
-\x00\x00\x01\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x05\
-\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x04\xaa\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x07\x2a\
-\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x5a\
+\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x00\x91\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x02\x52\
+\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x03\xab\
+\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x04\xb3\
+\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x05\xba\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x06\xb9\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x00\x07\xb8\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x4a\x20\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x4b\x04\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x4c\x65\
+\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x4d\xbc\
+\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x50\x3c\
+\x00\x00\x01\x64\x00\x00\x00\x00\x00\x01\x00\x00\x51\x18\
 "
 
 qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0d\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x00\xff\
-\x00\x00\x01\x89\x7e\x5d\x41\x61\
-\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x02\xe9\
-\x00\x00\x01\x89\x7e\x5d\x41\x9a\
-\x00\x00\x00\x46\x00\x00\x00\x00\x00\x01\x00\x00\x01\x90\
-\x00\x00\x01\x89\x91\x8b\x59\x4e\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x52\
-\x00\x00\x01\x89\x7e\x5d\x42\x01\
-\x00\x00\x00\xcc\x00\x00\x00\x00\x00\x01\x00\x00\x09\x67\
-\x00\x00\x01\x89\x7e\x5d\x41\xb3\
 \x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x89\x7e\x5d\x42\x1c\
-\x00\x00\x01\x44\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x5c\
-\x00\x00\x01\x89\x88\x86\x8c\x7e\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x0a\x6e\
-\x00\x00\x01\x89\x7e\x5d\x42\x36\
-\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00\x08\x06\
-\x00\x00\x01\x89\x7e\x5d\x41\xe7\
-\x00\x00\x01\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x0e\x05\
-\x00\x00\x01\x89\x91\x8b\x52\x2c\
-\x00\x00\x00\x7e\x00\x00\x00\x00\x00\x01\x00\x00\x04\xaa\
-\x00\x00\x01\x89\x7e\x5d\x41\xcd\
-\x00\x00\x00\x9c\x00\x00\x00\x00\x00\x01\x00\x00\x07\x2a\
-\x00\x00\x01\x89\x88\x86\x40\xc6\
-\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x5a\
-\x00\x00\x01\x89\x7e\x5d\x41\x82\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\x26\x00\x00\x00\x00\x00\x01\x00\x00\x00\x91\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x02\x52\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\x5e\x00\x00\x00\x00\x00\x01\x00\x00\x03\xab\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\x78\x00\x00\x00\x00\x00\x01\x00\x00\x04\xb3\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x05\xba\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\xae\x00\x00\x00\x00\x00\x01\x00\x00\x06\xb9\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\xca\x00\x00\x00\x00\x00\x01\x00\x00\x07\xb8\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x00\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x4a\x20\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x4b\x04\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x00\x4c\x65\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x01\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x4d\xbc\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x50\x3c\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
+\x00\x00\x01\x64\x00\x00\x00\x00\x00\x01\x00\x00\x51\x18\
+\x00\x00\x01\x92\x29\xb4\xa6\xb0\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
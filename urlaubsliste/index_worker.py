@@ -0,0 +1,32 @@
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from content_index import INDEX_FILE, LIST_DIR, ContentIndex
+
+
+class IndexSignals(QObject):
+    finished = pyqtSignal(int)  # Number of reindexed lists
+    failed = pyqtSignal(str)
+
+
+class IndexWorker(QRunnable):
+    """Brings the content index up to date on a thread pool."""
+
+    def __init__(self, directory=LIST_DIR, file=INDEX_FILE):
+        super().__init__()
+        self.directory = directory
+        self.file = file
+        self.signals = IndexSignals()
+
+    def run(self):
+        try:
+            # SQLite connections can't be shared between threads
+            index = ContentIndex(self.file)
+            try:
+                updated, _ = index.update(self.directory)
+            finally:
+                index.close()
+        except Exception as e:
+            # Whoever waits for the update must always hear back
+            self.signals.failed.emit(str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit(updated)
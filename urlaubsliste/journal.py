@@ -0,0 +1,323 @@
+"""
+Recovery journal of the edits to the open list. Every journal is a file of
+JSON lines: a header with the path of the list and, unless the list file
+itself is the starting point, a snapshot of it. Each further line is a
+command that was done, undone or redone, see `history.Command.to_dict()`.
+
+Edits are buffered by `Journal.append()` and handed to a writer thread by
+`Journal.flush()`, so writing costs the size of the edit, not of the list.
+Once a journal has many entries, the writer thread replaces it with a new
+snapshot. Next to the journal, the writer thread keeps a copy of the list
+file it starts from, so the edits can be recovered even if the file was
+changed or deleted since. While a journal is in use, its lock file is
+locked, so other instances of the app leave it alone.
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import IO, Iterator, Optional
+
+from history import Command, command_from_dict
+from model import FileBackend, List, backend_for, codec
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+RECOVERY_DIR = Path(os.path.expanduser("~/Documents/Urlaubslisten/.recovery"))
+JOURNAL_SUFFIX = ".journal"
+# The list file the journal starts from, and the lock of a journal in use
+COPY_SUFFIX = ".base"
+LOCK_SUFFIX = ".lock"
+# Journals that couldn't be recovered are kept with this suffix
+BROKEN_SUFFIX = ".broken"
+# Entries after which the journal is compacted into a snapshot
+COMPACT_AFTER = 1000
+
+
+def _header(
+    list_: List,
+    snapshot: bool,
+    compacted: bool = False,
+    copy: Optional[str] = None,
+) -> str:
+    if snapshot:
+        list_.materialize()
+    header = {
+        "path": str(list_.path) if list_.path else None,
+        "snapshot": list_.raw if snapshot else None,
+        # The snapshot contains edits, not only the list as it was loaded
+        "compacted": compacted,
+        # Name of the copy of the list file, in the journal's directory
+        "copy": copy,
+    }
+    return codec.dumps(header).decode("utf-8") + "\n"
+
+
+def _lock(file: Path) -> Optional[IO]:
+    """
+    Open and lock `file` without waiting. None if another process holds
+    the lock. Locks are released when their process ends, even by a crash.
+    """
+    fp = open(file, "a+b")
+    try:
+        if fcntl is not None:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        fp.close()
+        return None
+    return fp
+
+
+def _unlock(fp: IO):
+    if fcntl is None:
+        fp.seek(0)
+        msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+    fp.close()
+
+
+def journal_header(file: Path) -> dict:
+    with open(file, "r", encoding="utf-8") as fp:
+        return json.loads(fp.readline())
+
+
+def discard(file: Path):
+    """Delete the journal `file` and the files that belong to it."""
+    for suffix in (COPY_SUFFIX, LOCK_SUFFIX):
+        file.with_suffix(suffix).unlink(missing_ok=True)
+    file.unlink(missing_ok=True)
+
+
+def set_aside(file: Path) -> Path:
+    """
+    Rename the journal `file` so it isn't offered again, but can still be
+    looked at. Returns the new name.
+    """
+    target = file.with_suffix(BROKEN_SUFFIX)
+    os.replace(file, target)
+    copy = file.with_suffix(COPY_SUFFIX)
+    if copy.exists():
+        os.replace(copy, target.with_name(target.name + COPY_SUFFIX))
+    file.with_suffix(LOCK_SUFFIX).unlink(missing_ok=True)
+    return target
+
+
+def replay(file: str | Path) -> tuple[List, int]:
+    """
+    The list of the journal `file` with all entries applied, and the
+    number of entries. The entries are applied to the list as the journal
+    started from it, not to its file as it is now. If that file doesn't
+    exist anymore, the list is returned as a new, unsaved one. A torn
+    last line, as a crash may leave behind, is ignored.
+    """
+    file = Path(file)
+    with open(file, "r", encoding="utf-8") as fp:
+        header = json.loads(fp.readline())
+        path = header["path"]
+        if path is not None and not os.path.exists(path):
+            path = None
+        copy = header.get("copy")
+        if copy is not None and not (file.parent / copy).exists():
+            copy = None
+        if header["snapshot"] is not None:
+            list_ = List(header["snapshot"], path)
+        elif copy is not None:
+            list_ = List.from_file(file.parent / copy)
+            list_.path = path
+        else:
+            list_ = List.from_file(header["path"])
+        entries = 0
+        for line in fp:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            command = command_from_dict(entry["command"])
+            if entry["action"] == "undo":
+                command.undo(list_)
+            else:
+                command.redo(list_)
+            entries += 1
+    return list_, entries
+
+
+def find_recoverable(directory: Path = RECOVERY_DIR) -> Iterator[Path]:
+    """
+    Journals with entries that are newer than their list file, the most
+    recent first. Outdated journals are deleted.
+    """
+    if not directory.is_dir():
+        return
+    journals = sorted(
+        directory.glob("*" + JOURNAL_SUFFIX),
+        key=lambda file: file.stat().st_mtime,
+        reverse=True,
+    )
+    for file in journals:
+        lock = _lock(file.with_suffix(LOCK_SUFFIX))
+        if lock is None:
+            # In use by another instance of the app
+            continue
+        _unlock(lock)
+        try:
+            with open(file, "r", encoding="utf-8") as fp:
+                header = json.loads(fp.readline())
+                changed = bool(fp.readline()) or header["compacted"]
+            path = header["path"]
+            # The edits to a deleted list are still worth recovering
+            outdated = not changed or (
+                path is not None
+                and os.path.exists(path)
+                and os.path.getmtime(path) >= file.stat().st_mtime
+            )
+        except (OSError, ValueError, KeyError):
+            outdated = True
+        if outdated:
+            discard(file)
+        else:
+            yield file
+
+
+class Journal:
+    """
+    Journal of the edits to one list, written to a new file in
+    `directory`. All file operations happen on a writer thread, in the
+    order they were requested.
+    """
+
+    def __init__(
+        self, directory: Path = RECOVERY_DIR, file: Optional[Path] = None
+    ):
+        """Continue the journal `file` if given."""
+        if file is None:
+            directory.mkdir(parents=True, exist_ok=True)
+            file = directory / (
+                f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+                + JOURNAL_SUFFIX
+            )
+        self.file = Path(file)
+        self.copy = self.file.with_suffix(COPY_SUFFIX)
+        self._lock = _lock(self.file.with_suffix(LOCK_SUFFIX))
+        self.compact_after = COMPACT_AFTER
+        self._pending: list[str] = []
+        self._entries = 0
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._write, name="journal", daemon=True
+        )
+        self._thread.start()
+
+    def reset(self, list_: List):
+        """
+        Start over from `list_`. Only lists that weren't saved yet are
+        written to the journal, the others start from their file.
+        """
+        self._pending.clear()
+        if list_.path is None:
+            self._queue.put(("reset", (_header(list_, True), None)))
+            return
+        header = _header(list_, False, copy=self.copy.name)
+        self._queue.put(("reset", (header, list_.path)))
+
+    def append(self, action: str, command: Command):
+        """Buffer an entry, to be written by the next `flush()`."""
+        entry = {"action": action, "command": command.to_dict()}
+        self._pending.append(codec.dumps(entry).decode("utf-8") + "\n")
+
+    def flush(self):
+        """Hand the buffered entries to the writer thread."""
+        if self._pending:
+            self._queue.put(("append", "".join(self._pending)))
+            self._pending.clear()
+
+    def close(self, delete: bool = True):
+        """
+        Write the remaining entries, or delete the journal if the list
+        doesn't need to be recovered, and stop the writer thread.
+        """
+        if delete:
+            self._pending.clear()
+            self._queue.put(("delete", None))
+        else:
+            self.flush()
+        self._queue.put(("stop", None))
+        self._thread.join()
+        if self._lock is not None:
+            _unlock(self._lock)
+            self.file.with_suffix(LOCK_SUFFIX).unlink(missing_ok=True)
+
+    def _write(self):
+        while True:
+            action, data = self._queue.get()
+            if action == "stop":
+                return
+            try:
+                if action == "append":
+                    self._append(data)
+                elif action == "reset":
+                    header, path = data
+                    if path is not None:
+                        try:
+                            self._copy(path)
+                        except OSError:
+                            # Replaying falls back to the list file
+                            self.copy.unlink(missing_ok=True)
+                    self._replace(header)
+                    self._entries = 0
+                elif action == "delete":
+                    self.file.unlink(missing_ok=True)
+                    self.copy.unlink(missing_ok=True)
+            except (OSError, ValueError, KeyError):
+                # The journal is only a safety net, editing must go on
+                pass
+
+    def _append(self, lines: str):
+        with open(self.file, "a", encoding="utf-8") as fp:
+            fp.write(lines)
+            fp.flush()
+            os.fsync(fp.fileno())
+        self._entries += lines.count("\n")
+        if self._entries >= self.compact_after:
+            list_, _ = replay(self.file)
+            self._replace(_header(list_, True, compacted=True))
+            self._entries = 0
+
+    def _copy(self, path: str | Path):
+        temp = self.copy.with_name(self.copy.name + ".tmp")
+        temp.unlink(missing_ok=True)
+        if isinstance(backend_for(path), FileBackend):
+            # Saving replaces list files rather than changing them, so a
+            # hard link keeps the version the journal starts from
+            try:
+                os.link(path, temp)
+            except OSError:
+                shutil.copyfile(path, temp)
+        else:
+            shutil.copyfile(path, temp)
+        os.replace(temp, self.copy)
+
+    def _replace(self, content: str):
+        fd, temp_path = tempfile.mkstemp(
+            prefix=f".{self.file.name}.", suffix=".tmp", dir=self.file.parent
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                fp.write(content)
+                fp.flush()
+                os.fsync(fp.fileno())
+            os.replace(temp_path, self.file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from copy import deepcopy
+from typing import Any, Callable, Optional
+
+
+class Pending:
+    """Placeholder for the not yet decoded items of a category."""
+    __slots__ = ("span", "count")
+
+    def __init__(self, span: Any, count: int):
+        self.span = span
+        self.count = count
+
+
+class LazyCategories(dict):
+    """
+    Categories of a list whose items are only decoded when a category is
+    first accessed. Until then its value is a `Pending` that `decode`
+    turns into the items. `close` is called once everything is decoded.
+
+    Everything that hands out values decodes them first, so this behaves
+    like a plain dict of item lists. Only `length()` can tell the number
+    of items of a category without decoding it.
+    """
+
+    def __init__(
+        self,
+        pending: dict[str, Pending],
+        decode: Callable[[Pending], list],
+        close: Optional[Callable[[], None]] = None,
+    ):
+        super().__init__(pending)
+        self._decode = decode
+        self._close = close
+        self._pending = len(pending)
+
+    def __getitem__(self, key: str) -> list:
+        value = super().__getitem__(key)
+        if isinstance(value, Pending):
+            value = self._decode(value)
+            super().__setitem__(key, value)
+            self._decoded_one()
+        return value
+
+    def __setitem__(self, key: str, value: list):
+        if isinstance(super().get(key), Pending):
+            self._decoded_one()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str):
+        if isinstance(super().__getitem__(key), Pending):
+            self._decoded_one()
+        super().__delitem__(key)
+
+    # Overriding __iter__ stops dict() and dict.update() from copying the
+    # stored values directly, they'd copy the placeholders.
+    def __iter__(self):
+        return super().__iter__()
+
+    def _decoded_one(self):
+        self._pending -= 1
+        if not self._pending and self._close is not None:
+            self._close()
+            self._close = None
+
+    def is_pending(self, key: str) -> bool:
+        """True if the items of `key` weren't decoded yet."""
+        return isinstance(super().__getitem__(key), Pending)
+
+    def length(self, key: str) -> int:
+        value = super().__getitem__(key)
+        if isinstance(value, Pending):
+            return value.count
+        return len(value)
+
+    def materialize(self):
+        """Decode all categories."""
+        for key in self:
+            self[key]
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    def pop(self, key: str, *default):
+        if key not in self:
+            return super().pop(key, *default)
+        value = self[key]
+        super().__delitem__(key)
+        return value
+
+    def setdefault(self, key: str, default=None):
+        if key in self:
+            return self[key]
+        super().__setitem__(key, default)
+        return default
+
+    def clear(self):
+        super().clear()
+        self._pending = 1
+        self._decoded_one()
+
+    def popitem(self):
+        self.materialize()
+        return super().popitem()
+
+    def values(self):
+        self.materialize()
+        return super().values()
+
+    def items(self):
+        self.materialize()
+        return super().items()
+
+    def copy(self) -> dict:
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        self.materialize()
+        return super().__eq__(other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        self.materialize()
+        return super().__repr__()
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {key: deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (dict, (list(self.items()),))
@@ -0,0 +1,164 @@
+"""
+Lazy loading of big JSON list files. One pass over the (memory mapped)
+file finds the span and item count of every category, their items are
+only decoded once the category is first accessed.
+
+Only the layout the app writes is understood: scalar metadata and a
+structure with categories of strings and nulls. Anything else makes
+`load()` return None, so the file can be parsed the usual way.
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Callable, Optional
+
+from lazy import LazyCategories, Pending
+from utils import intern_items
+
+_WS = rb"[ \t\n\r]*"
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_ITEM = rb"(?:" + _STRING + rb"|null)"
+
+_TOKEN = re.compile(_WS + rb"([{},])" + _WS)
+_KEY = re.compile(_WS + rb"(" + _STRING + rb")" + _WS + rb":" + _WS)
+_SCALAR = re.compile(_STRING + rb"|null|true|false|-?[0-9][0-9.eE+-]*")
+_ITEMS = re.compile(
+    rb"\[" + _WS
+    + rb"(?:" + _ITEM + _WS + rb"(?:," + _WS + _ITEM + _WS + rb")*)?"
+    + rb"\]"
+)
+_FIRST_ITEM = re.compile(rb"\[" + _WS + rb"(.?)")
+# The empty group makes findall() return empty strings instead of copies
+# of the items, which only counts them
+_COUNT_ITEMS = re.compile(_ITEM + rb"()")
+
+
+class _Unsupported(Exception):
+    pass
+
+
+def _token(data, pos: int) -> tuple[bytes, int]:
+    match = _TOKEN.match(data, pos)
+    if match is None:
+        raise _Unsupported
+    return match[1], match.end()
+
+
+def _object(data, pos: int, value: Callable) -> tuple[dict, int]:
+    """
+    The object at `pos` and the position after it. `value(data, key, pos)`
+    reads the value of each member the same way.
+    """
+    token, pos = _token(data, pos)
+    if token != b"{":
+        raise _Unsupported
+    result = {}
+    match = _TOKEN.match(data, pos)
+    if match is not None and match[1] == b"}":
+        return result, match.end()
+    while True:
+        match = _KEY.match(data, pos)
+        if match is None:
+            raise _Unsupported
+        key = json.loads(match[1])
+        result[key], pos = value(data, key, match.end())
+        token, pos = _token(data, pos)
+        if token == b"}":
+            return result, pos
+        if token != b",":
+            raise _Unsupported
+
+
+def _scalar(data, key: str, pos: int) -> tuple[object, int]:
+    match = _SCALAR.match(data, pos)
+    if match is None:
+        raise _Unsupported
+    return json.loads(match[0]), match.end()
+
+
+def _scan_items(data, start: int) -> Optional[tuple[int, int]]:
+    """
+    Fast path for the usual arrays without escapes and nulls: all their
+    quotes delimit strings, so an array ends at the first bracket after
+    an even number of quotes and has half as many items as it has quotes.
+    Returns the end and item count, or None if the array isn't like that.
+    """
+    if data[start:start + 1] != b"[":
+        return None
+    pos = start
+    quotes = 0
+    while True:
+        end = data.find(b"]", pos)
+        if end == -1:
+            return None
+        quotes += data[pos:end].count(b'"')
+        pos = end + 1
+        if quotes % 2 == 0:
+            break
+    if data.find(b"\\", start, pos) != -1:
+        return None
+    if data.find(b"null", start, pos) != -1:
+        return None
+    # Catches arrays of other values, strings mixed with them only show
+    # up when decoding
+    first = _FIRST_ITEM.match(data, start)
+    last = data[max(start, pos - 64):pos - 1].rstrip(b" \t\n\r")[-1:]
+    if (first[1], last) not in ((b"]", b"["), (b'"', b'"')):
+        return None
+    return pos, quotes // 2
+
+
+def _category(data, key: str, pos: int) -> tuple[Pending, int]:
+    scanned = _scan_items(data, pos)
+    if scanned is not None:
+        end, count = scanned
+        return Pending((pos, end), count), end
+    match = _ITEMS.match(data, pos)
+    if match is None:
+        raise _Unsupported
+    count = len(_COUNT_ITEMS.findall(data, match.start(), match.end()))
+    return Pending(match.span(), count), match.end()
+
+
+def _categories(data, key: str, pos: int) -> tuple[dict, int]:
+    return _object(data, pos, _category)
+
+
+def _structure_member(data, key: str, pos: int) -> tuple[object, int]:
+    return (_categories if key == "categories" else _scalar)(data, key, pos)
+
+
+def _structure(data, key: str, pos: int) -> tuple[dict, int]:
+    return _object(data, pos, _structure_member)
+
+
+def _member(data, key: str, pos: int) -> tuple[object, int]:
+    return (_structure if key == "structure" else _scalar)(data, key, pos)
+
+
+def load(data, loads: Callable[[bytes], object]) -> Optional[dict]:
+    """
+    The raw list in the JSON `data`, with categories that `loads` only
+    decodes on first access. `data` is kept until all of them are, and
+    closed then if it can be. None if the file can't be loaded lazily.
+    """
+    try:
+        raw, _ = _object(data, 0, _member)
+        categories = raw["structure"]["categories"]
+    except (_Unsupported, KeyError, TypeError, ValueError):
+        return None
+
+    def decode(category: Pending) -> list:
+        start, end = category.span
+        items = loads(data[start:end])
+        # The fast path doesn't check the items, their count would be
+        # off for anything but strings
+        if not isinstance(items, list) or len(items) != category.count:
+            raise ValueError("Malformed category in the list file.")
+        return intern_items(items)
+
+    raw["structure"]["categories"] = LazyCategories(
+        categories, decode, getattr(data, "close", None)
+    )
+    return raw
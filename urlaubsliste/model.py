@@ -1,9 +1,240 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
-from utils import deep_merge
+from typing import Any, Iterator, Optional
+
+import container
+import lazy_json
+from lazy import LazyCategories
+from storage import SqliteBackend, StorageBackend, replace_file
+from utils import MERGE_APPEND, MERGE_STRATEGIES, deep_merge, intern_items
+
+try:
+    import orjson
+except ImportError:  # Optional, the standard library is used instead
+    orjson = None
+
+
+# Number of parsed lists kept by the `resolution_cache`
+RESOLUTION_CACHE_SIZE = 64
+# Maximum length of a base list chain
+MAX_BASE_LIST_DEPTH = 32
+# Number of characters read at once by `read_header()`
+HEADER_CHUNK_SIZE = 4096
+HEADER_KEYS = ("name", "base_list")
+# Write buffer size of `List.save()`
+SAVE_BUFFER_SIZE = 1 << 16
+# Levels of the raw list written piece by piece by `OrjsonCodec`, down to
+# the items of each category
+ORJSON_STREAM_DEPTH = 3
+# Lists saved with this suffix use the binary format of `container`
+BINARY_SUFFIX = ".ullb"
+# JSON files at least this big are loaded lazily, see `lazy_json`
+LAZY_LOAD_SIZE = 16 << 20
+# Some editors start UTF-8 files with a byte order mark
+BOM = b"\xef\xbb\xbf"
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class JsonCodec:
+    """
+    Reads and writes list files with the standard library. The output is
+    compact UTF-8 JSON, byte for byte the same as that of `OrjsonCodec`.
+    """
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, separators=(",", ":")
+        )
+
+    def loads(self, data: bytes) -> dict:
+        return json.loads(data)
+
+    def dumps(self, raw: dict) -> bytes:
+        return self._encoder.encode(raw).encode("utf-8")
+
+    def iter_dumps(self, raw: dict) -> Iterator[bytes]:
+        """`dumps()` in chunks, without building the whole output."""
+        for chunk in self._encoder.iterencode(raw):
+            yield chunk.encode("utf-8")
+
+
+class OrjsonCodec:
+    """Reads and writes list files with the much faster orjson."""
+
+    def loads(self, data: bytes) -> dict:
+        # Unlike json, orjson doesn't skip it
+        if data[:len(BOM)] == BOM:
+            data = data[len(BOM):]
+        return orjson.loads(data)
+
+    def dumps(self, raw: dict) -> bytes:
+        return orjson.dumps(raw)
+
+    def iter_dumps(self, raw: dict) -> Iterator[bytes]:
+        """
+        `dumps()` in chunks of one category each. orjson can't stream, the
+        whole output would be in memory besides the list.
+        """
+        return _iter_orjson(raw, ORJSON_STREAM_DEPTH)
+
+
+def _iter_orjson(value: Any, depth: int) -> Iterator[bytes]:
+    """The dicts of `value` down to `depth` in chunks, the rest at once."""
+    if depth == 0 or not isinstance(value, dict):
+        yield orjson.dumps(value)
+        return
+    separator = b"{"
+    for key, item in value.items():
+        yield separator + orjson.dumps(key) + b":"
+        yield from _iter_orjson(item, depth - 1)
+        separator = b","
+    yield b"}" if separator == b"," else b"{}"
+
+
+codec = OrjsonCodec() if orjson is not None else JsonCodec()
+
+
+def _read_file(path: str | Path) -> dict:
+    """The raw list at `path`, in either format."""
+    with open(path, "rb") as fp:
+        content = fp.read(len(container.MAGIC))
+        if content == container.MAGIC:
+            return container.load(path)
+        if os.fstat(fp.fileno()).st_size >= LAZY_LOAD_SIZE:
+            data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            raw = lazy_json.load(data, codec.loads)
+            if raw is not None:
+                return raw
+            data.close()
+        content += fp.read()
+    return _intern_categories(codec.loads(content))
+
+
+def _intern_categories(raw: dict) -> dict:
+    """
+    Intern the items of `raw`. Lists in a base list chain repeat the same
+    items, which then only exist once in memory.
+    """
+    categories = raw.get("structure", {}).get("categories", {})
+    for category, items in categories.items():
+        categories[category] = intern_items(items)
+    return raw
+
+
+def _iter_dumps(raw: dict, binary: bool) -> Iterator[bytes]:
+    if binary:
+        return container.iter_dumps(raw)
+    return codec.iter_dumps(raw)
+
+
+def _content_hash(raw: dict, binary: bool) -> str:
+    digest = hashlib.sha256()
+    for chunk in _iter_dumps(raw, binary):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _signature(path: Path) -> tuple[int, int]:
+    """Modification time and size of the file at `path`."""
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_hash(path: Path) -> str:
+    """Hash of the content of the file at `path`, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        while chunk := fp.read(SAVE_BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _has_content(path: Path, state: Any, content_hash: str) -> bool:
+    """
+    Whether the file at `path` has the content with `content_hash`. The
+    file is only read if it changed since the save or load of `state`.
+    """
+    if not (isinstance(state, tuple) and state[1] == path and path.exists()):
+        return False
+    saved_hash, _, signature = state
+    # Compare with the file as it is, it may have been changed by
+    # something else since
+    if saved_hash is None or _signature(path) != signature:
+        saved_hash = _file_hash(path)
+    return saved_hash == content_hash
+
+
+def _materialize(raw: dict):
+    categories = raw["structure"]["categories"]
+    if isinstance(categories, LazyCategories):
+        categories.materialize()
+
+
+class FileBackend(StorageBackend):
+    """
+    JSON and binary list files, see `_read_file()`. Every save rewrites
+    the whole file, unless it has the same content as the list. The
+    state is the content hash, path and `_signature()` of the file after
+    the last save, or None for the hash after a load, as it's only needed
+    once the list is saved.
+    """
+
+    def handles(self, path: Path) -> bool:
+        return True
+
+    def load(self, path: Path) -> tuple[dict, tuple]:
+        return _read_file(path), (None, path.resolve(), None)
+
+    def save(
+        self, raw: dict, path: Path, backup: bool, state: Any
+    ) -> tuple[str, Path, tuple[int, int]]:
+        """
+        Save without ever leaving a truncated file behind, see
+        `replace_file()`. Paths ending with `BINARY_SUFFIX` are saved in
+        the binary format.
+        """
+        path = path.resolve()
+        binary = path.suffix == BINARY_SUFFIX
+        # Also releases the memory map of a binary list, which otherwise
+        # can't be replaced on Windows
+        _materialize(raw)
+        content_hash = ""
+
+        def write(temp_path: str) -> bool:
+            nonlocal content_hash
+            # The content is hashed while it's written, to not serialize
+            # the list twice
+            digest = hashlib.sha256()
+            with open(temp_path, "wb", buffering=SAVE_BUFFER_SIZE) as fp:
+                for chunk in _iter_dumps(raw, binary):
+                    digest.update(chunk)
+                    fp.write(chunk)
+                content_hash = digest.hexdigest()
+                if _has_content(path, state, content_hash):
+                    return False
+                fp.flush()
+                os.fsync(fp.fileno())
+            return True
+
+        replace_file(path, write, backup)
+        return content_hash, path, _signature(path)
+
+    def read_header(self, path: Path) -> dict:
+        return _read_file_header(path)
+
+
+def backend_for(path: str | Path) -> StorageBackend:
+    """The first backend of `BACKENDS` that handles `path`."""
+    path = Path(path)
+    return next(backend for backend in BACKENDS if backend.handles(path))
 
 
 class List:
@@ -16,13 +247,32 @@ class List:
         """
         self.raw = raw
         self.path = path
-        self._orm = None
+        # State of the storage backend after the last load or save, to
+        # only write what changed
+        self._storage_state: Any = None
+
+    @property
+    def raw(self) -> dict:
+        return self._raw
+
+    @raw.setter
+    def raw(self, value: dict):
+        # The ORM wraps the raw dict by reference, so it only has to be
+        # rebuilt when the dict itself gets replaced.
+        self._raw = value
+        self._orm = AnnotatedORM(value)
 
     @classmethod
     def from_file(cls, path: str | Path) -> "List":
-        with open(path, "r") as fp:
-            raw = json.load(fp)
-        return cls(raw, path)
+        """
+        Load a list with the backend for `path`. Categories of binary
+        lists, databases and big JSON lists are only decoded once they're
+        accessed.
+        """
+        raw, state = backend_for(path).load(Path(path))
+        list_ = cls(raw, path)
+        list_._storage_state = state
+        return list_
 
     @classmethod
     def new(cls, name: str) -> "List":
@@ -46,6 +296,11 @@ class List:
         self.orm.structure.categories[new_category_name] = content
         self.orm.structure.categories.pop(category_name)
 
+    def reorder_categories(self, order: list[str]):
+        categories = self.orm.structure.categories
+        for key in order:
+            categories[key] = categories.pop(key)
+
     def change_baselist(self, new_path: Path | str):
         self.orm.base_list = str(Path(new_path).resolve())
 
@@ -72,30 +327,94 @@ class List:
 
     @property
     def orm(self) -> "AnnotatedORM":
-        self._orm = AnnotatedORM(self.raw)
         return self._orm
 
     def get_items_for_category(self, category: str) -> list[Optional[str]]:
         return self.orm.structure.categories[category]
 
     def get_amount_of_items_for_category(self, category: str) -> int:
-        return len(self.get_items_for_category(category))
+        categories = self.orm.structure.categories
+        if isinstance(categories, LazyCategories):
+            # Doesn't need to decode the category
+            return categories.length(category)
+        return len(categories[category])
+
+    def materialize(self):
+        """Decode all categories that were loaded lazily."""
+        _materialize(self.raw)
 
     def serialize(self) -> str:
-        return json.dumps(self.raw)
+        self.materialize()
+        return codec.dumps(self.raw).decode("utf-8")
+
+    def content_hash(self, binary: bool = False) -> str:
+        """Hash of the saved file content, computed in chunks."""
+        self.materialize()
+        return _content_hash(self.raw, binary)
+
+    def save(self, path: str | Path, backup: bool = False):
+        """
+        Save the list to `path` with the backend for it, see
+        `FileBackend.save()` and `storage.SqliteBackend.save()`. Neither
+        ever leaves a half written list behind. With `backup`, the
+        previous file is kept as `<path>.bak`. If the list was loaded from
+        or saved to `path`, nothing is written that the file there
+        already contains.
+        """
+        path = Path(path).resolve()
+        # A failed save may leave the state half updated, the next save
+        # then writes the whole list
+        state, self._storage_state = self._storage_state, None
+        self._storage_state = backend_for(path).save(
+            self.raw, path, backup, state
+        )
 
-    def get_raw_extended_with_parent(self) -> dict:
+    def get_raw_extended_with_parent(
+        self, max_depth: int = MAX_BASE_LIST_DEPTH
+    ) -> dict:
+        """
+        The list merged with all of its base lists. The result shares
+        unchanged categories with this list and the cached base lists, so
+        it must not be modified. Raises a
+        `BaseListCycleError` if a base list is (indirectly) its own base
+        list, a `BaseListDepthError` if there are more than `max_depth`
+        base lists and a `MergeStrategyError` if a list has an unknown
+        merge strategy.
+        """
         parent = self.orm.base_list
         if parent is None:
             return self.raw
-        with open(parent, mode="r") as fp:
-            parent_raw = json.load(fp)
-        merged_parent_list = List(
-            List(parent_raw).get_raw_extended_with_parent()
-        )
-        categories_self = self.orm.structure.categories
-        categories_parent = merged_parent_list.orm.structure.categories
-        merged_categories = deep_merge(categories_self, categories_parent)
+        chain = [self.raw]
+        visited = [Path(self.path).resolve()] if self.path else []
+        visited_set = set(visited)
+        bases = None
+        if self.path and os.path.exists(self.path):
+            bases = backend_for(self.path).resolve_bases(
+                Path(self.path), parent, max_depth
+            )
+        if bases is None:
+            bases = _read_base_lists(parent)
+        for path, raw in bases:
+            if path in visited_set:
+                raise BaseListCycleError(
+                    visited[visited.index(path):] + [path]
+                )
+            if len(chain) > max_depth:
+                raise BaseListDepthError(max_depth)
+            visited.append(path)
+            visited_set.add(path)
+            chain.append(raw)
+        # Merge downwards, starting at the topmost base list
+        merged_categories = chain[-1]["structure"]["categories"]
+        for raw in reversed(chain[:-1]):
+            strategy = raw.get("merge_strategy", MERGE_APPEND)
+            if strategy not in MERGE_STRATEGIES:
+                raise MergeStrategyError(raw.get("name"), strategy)
+            merged_categories = deep_merge(
+                raw["structure"]["categories"],
+                merged_categories,
+                strategy,
+            )
         full_raw = {
             "name": self.orm.name,
             "base_list": self.orm.base_list,
@@ -106,7 +425,107 @@ class List:
         return full_raw
 
 
+def _read_base_lists(parent: str) -> Iterator[tuple[Path, dict]]:
+    """The base list `parent` and its base lists, from their files."""
+    while parent is not None:
+        path = Path(parent).resolve()
+        raw = resolution_cache.load(path)
+        yield path, raw
+        parent = raw["base_list"]
+
+
+def _read_file_header(path: str | Path) -> dict:
+    """
+    Read only the `name` and `base_list` of the JSON or binary list at
+    `path`. These are written before the `structure`, so parsing can stop
+    right before it. Falls back to parsing the whole file if they aren't.
+    """
+    if container.is_container(path):
+        header = container.read_header(path)
+        return {key: header.get(key) for key in HEADER_KEYS}
+    decoder = json.JSONDecoder()
+    header = {}
+    with open(path, "r", encoding="utf-8-sig") as fp:
+        buffer = fp.read(HEADER_CHUNK_SIZE)
+        pos = _WHITESPACE.match(buffer).end()
+        if buffer[pos:pos + 1] != "{":
+            raise ValueError("Not a list file.")
+        pos += 1
+        while not all(key in header for key in HEADER_KEYS):
+            start = pos
+            try:
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if buffer[pos] == ",":
+                    pos = _WHITESPACE.match(buffer, pos + 1).end()
+                if buffer[pos] == "}":
+                    break
+                key, pos = decoder.raw_decode(buffer, pos)
+                pos = _WHITESPACE.match(buffer, pos).end()
+                if buffer[pos] != ":":
+                    raise ValueError("Not a list file.")
+                if key == "structure":
+                    fp.seek(0)
+                    raw = json.load(fp)
+                    return {key: raw.get(key) for key in HEADER_KEYS}
+                pos = _WHITESPACE.match(buffer, pos + 1).end()
+                value, pos = decoder.raw_decode(buffer, pos)
+                if pos == len(buffer):
+                    # A number might continue in the next chunk
+                    raise IndexError
+            except (IndexError, json.JSONDecodeError) as e:
+                # The current value doesn't fit in the buffer, read more
+                # and parse it again
+                pos = start
+                chunk = fp.read(HEADER_CHUNK_SIZE)
+                if not chunk:
+                    if isinstance(e, IndexError):
+                        raise json.JSONDecodeError(
+                            "Unexpected end of file", buffer, len(buffer)
+                        ) from None
+                    raise
+                buffer += chunk
+                continue
+            header[key] = value
+    return {key: header.get(key) for key in HEADER_KEYS}
+
+
+def read_header(path: str | Path) -> dict:
+    """Read only the `name` and `base_list` of the list at `path`."""
+    header = backend_for(path).read_header(Path(path))
+    return {key: header.get(key) for key in HEADER_KEYS}
+
+
+class BaseListError(Exception):
+    pass
+
+
+class BaseListCycleError(BaseListError):
+    def __init__(self, cycle: list[Path]):
+        self.cycle = cycle
+        super().__init__(
+            "The base lists form a cycle: "
+            + " -> ".join(str(path) for path in cycle)
+        )
+
+
+class BaseListDepthError(BaseListError):
+    def __init__(self, max_depth: int):
+        self.max_depth = max_depth
+        super().__init__(f"There are more than {max_depth} base lists.")
+
+
+class MergeStrategyError(BaseListError, ValueError):
+    def __init__(self, name: Optional[str], strategy: Any):
+        self.name = name
+        self.strategy = strategy
+        super().__init__(
+            f"Unknown merge strategy {strategy!r} of the list {name!r}."
+        )
+
+
 class AnnotatedORM:
+    __slots__ = ("data", "structure")
+
     def __init__(self, data: dict):
         self.data = data
         self.structure = AnnotatedStructure(data["structure"])
@@ -123,7 +542,7 @@ class AnnotatedORM:
         value = Path(value)
         if not value.exists():
             raise FileNotFoundError("The file doesn't exist.")
-        if List.from_file(value).orm.name == self.name:
+        if read_header(value)["name"] == self.name:
             raise ValueError("Both Lists have the same Name.")
         self.data["base_list"] = str(value)
 
@@ -131,13 +550,81 @@ class AnnotatedORM:
     def name(self):
         return self.data["name"]
 
+    @property
+    def merge_strategy(self) -> str:
+        """How this list's items are merged with those of its base list."""
+        return self.data.get("merge_strategy", MERGE_APPEND)
+
+    @merge_strategy.setter
+    def merge_strategy(self, value: str):
+        if value not in MERGE_STRATEGIES:
+            raise ValueError(f"Unknown merge strategy {value!r}.")
+        self.data["merge_strategy"] = value
+
     @name.setter
     def name(self, value):
         self.data["name"] = value
 
 
 class AnnotatedStructure:
+    __slots__ = ("categories",)
+
     def __init__(self, structure: dict):
         self.categories: dict[str, list[Optional[str]]] = structure[
             "categories"
         ]
+
+
+class ResolutionCache:
+    """
+    Parsed lists by resolved path, used to resolve base lists. A file is
+    only read again once its modification time or size changed. The least
+    recently used lists are dropped when there are more than `maxsize`.
+    """
+
+    def __init__(self, maxsize: int = RESOLUTION_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Path, tuple[tuple[int, int], dict]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, path: str | Path) -> dict:
+        """
+        The raw list at `path`. It's shared with later callers, so it must
+        not be modified.
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            self._entries.move_to_end(path)
+            return entry[1]
+        self.misses += 1
+        raw, _ = backend_for(path).load(path)
+        self._entries[path] = (signature, raw)
+        self._entries.move_to_end(path)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return raw
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+resolution_cache = ResolutionCache()
+
+
+# Tried in this order by `backend_for()`, the file backend takes any path
+BACKENDS: list[StorageBackend] = [
+    SqliteBackend(resolution_cache.load, MAX_BASE_LIST_DEPTH),
+    FileBackend(),
+]
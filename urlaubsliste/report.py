@@ -0,0 +1,227 @@
+from itertools import chain, islice
+from typing import Iterable
+
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.colors import black
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import (
+    PageBreak,
+    SimpleDocTemplate,
+    Spacer,
+    Paragraph,
+    Table,
+    TableStyle,
+)
+
+from utils import LANDSCAPE, PORTRAIT
+
+
+# Estimated height of a table row without wrapped lines, in points
+ROW_HEIGHT = 18
+# Default left and right padding of table cells, in points
+CELL_PADDING = 6
+# Default page margin of SimpleDocTemplate, in points
+PAGE_MARGIN = inch
+# Bounds for the width of a report column before stretching, in points
+MIN_COLUMN_WIDTH = 60
+MAX_COLUMN_WIDTH = 200
+
+
+class ReportCancelled(Exception):
+    pass
+
+
+class FlowableStream:
+    """
+    Provides the list operations `doc.build()` does on its flowables, but
+    takes them from an iterator one at a time. That way only the flowables
+    of the current page exist at once, not those of the whole document.
+    """
+
+    def __init__(self, flowables: Iterable):
+        self._iterator = iter(flowables)
+        self._buffer = []
+
+    def _fill(self):
+        if not self._buffer:
+            self._buffer.extend(islice(self._iterator, 1))
+
+    def __len__(self) -> int:
+        self._fill()
+        return len(self._buffer)
+
+    def __getitem__(self, index):
+        self._fill()
+        return self._buffer[index]
+
+    def __setitem__(self, index, value):
+        self._buffer[index] = value
+
+    def __delitem__(self, index):
+        del self._buffer[index]
+
+    def insert(self, index, value):
+        self._buffer.insert(index, value)
+
+
+def measure_column(list_, category: str) -> float:
+    """Width a column needs to show all of its content unwrapped."""
+    width = stringWidth(category, 'Helvetica-Bold', 12)
+    for item in list_.get_items_for_category(category):
+        if item:
+            width = max(width, stringWidth(item, 'Helvetica', 10))
+    return width + 2 * CELL_PADDING
+
+
+def plan_layout(list_, orientation=None):
+    """
+    Choose the page size and split the categories into groups of columns
+    that fit next to each other on a page. Without an `orientation`,
+    landscape is used if the columns don't fit on a portrait page.
+    Returns the page size and the groups as lists of (category, width).
+    """
+    natural_widths = [
+        (category, min(
+            max(measure_column(list_, category), MIN_COLUMN_WIDTH),
+            MAX_COLUMN_WIDTH,
+        ))
+        for category in list_.categories
+    ]
+    total_width = sum(width for _, width in natural_widths)
+    if orientation is None:
+        portrait_width = A4[0] - 2 * PAGE_MARGIN
+        orientation = PORTRAIT if total_width <= portrait_width else LANDSCAPE
+    pagesize = landscape(A4) if orientation == LANDSCAPE else A4
+    frame_width = pagesize[0] - 2 * PAGE_MARGIN
+
+    groups = [[]]
+    group_width = 0
+    for category, width in natural_widths:
+        if groups[-1] and group_width + width > frame_width:
+            groups.append([])
+            group_width = 0
+        groups[-1].append((category, width))
+        group_width += width
+    # Stretch the columns of each group to the full page width
+    for i, group in enumerate(groups):
+        group_width = sum(width for _, width in group)
+        groups[i] = [
+            (category, width * frame_width / group_width)
+            for category, width in group
+        ]
+    return pagesize, groups
+
+
+def _table_rows(list_, columns):
+    """
+    Yield the content rows of the report table for `columns`, a list of
+    (category, width). Items that fit into their cell stay plain strings,
+    only longer ones become wrapping Paragraphs.
+    """
+    normalstyle = ParagraphStyle(
+        "Tablecontent",
+        fontName='Helvetica',
+        fontSize=10,
+    )
+    columns = [
+        (list_.get_items_for_category(category), width - 2 * CELL_PADDING)
+        for category, width in columns
+    ]
+    longest_category_length = max(len(content) for content, _ in columns)
+    for i in range(longest_category_length):
+        values = []
+        for content, available_width in columns:
+            try:
+                value = content[i]
+            except IndexError:
+                value = ""
+            if (
+                value
+                and stringWidth(value, 'Helvetica', 10) > available_width
+            ):
+                value = Paragraph(value, style=normalstyle)
+            values.append(value)
+        yield values
+
+
+def _chunks(iterator, size):
+    iterator = iter(iterator)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def create_report(list_, file, on_page=None, orientation=None):
+    """
+    Write the PDF of `list_` to `file`. `on_page(canvas, doc)` is called
+    at the start of every page, raising `ReportCancelled` in it stops
+    the report. See `plan_layout()` for `orientation`.
+
+    Categories that don't fit next to each other continue on the following
+    pages. The table is laid out in chunks of about one page, each with
+    its own header row, and rows are only created when reportlab gets to
+    them.
+    """
+    if not list_.categories:
+        raise ValueError("List is empty")
+    headerstyle = ParagraphStyle(
+        "Tableheader",
+        fontName='Helvetica-Bold',
+        fontSize=12,
+    )
+    pagesize, groups = plan_layout(list_, orientation)
+
+    doc = SimpleDocTemplate(file, pagesize=pagesize)
+    style = getSampleStyleSheet()['Title']
+    style.fontName = 'Helvetica-Bold'
+    style.fontSize = 24
+    style.textColor = black
+    style.alignment = TA_CENTER
+    label = list_.name
+
+    table_style = TableStyle([
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),  # X-Align
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # V-Align
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),  # Table font
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header font
+        ('FONTSIZE', (0, 0), (-1, -1), 10),  # Table font size
+        ('FONTSIZE', (0, 0), (-1, 0), 12),  # Header font size
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),  # Table bottom padding
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),  # Header bottom padding
+        ('GRID', (0, 0), (-1, -1), 1, black),  # Visible grid
+        ('WORDWRAP', (0, 0), (-1, -1), True),  # Enable textwrap
+    ])
+    rows_per_table = max(int(doc.height // ROW_HEIGHT) - 1, 1)
+
+    def elements():
+        yield Paragraph(label, style)
+        yield Spacer(1, 50)
+        for i, group in enumerate(groups):
+            if i:
+                yield PageBreak()
+            header = [
+                Paragraph(category, style=headerstyle)
+                for category, _ in group
+            ]
+            column_widths = [width for _, width in group]
+            chunks = _chunks(_table_rows(list_, group), rows_per_table)
+            # Groups of empty categories still get a table with the headers
+            for chunk in chain([next(chunks, [])], chunks):
+                table = Table(
+                    [header] + chunk,
+                    colWidths=column_widths,
+                    repeatRows=1,
+                )
+                table.setStyle(table_style)
+                yield table
+
+    if on_page is None:
+        doc.build(FlowableStream(elements()))
+    else:
+        doc.build(
+            FlowableStream(elements()),
+            onFirstPage=on_page,
+            onLaterPages=on_page,
+        )
@@ -0,0 +1,60 @@
+import os
+import threading
+from tempfile import NamedTemporaryFile
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from model import List
+
+
+class ReportSignals(QObject):
+    progress = pyqtSignal(int)  # Number of the page being laid out
+    finished = pyqtSignal(str)  # Path of the PDF
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class ReportWorker(QRunnable):
+    """
+    Creates the PDF of a list on a thread pool. The list must not be
+    changed while the worker runs, so pass a copy of the shown one.
+    """
+
+    def __init__(self, list_: List, orientation: Optional[str] = None):
+        super().__init__()
+        self.list = list_
+        self.orientation = orientation
+        self.signals = ReportSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
+        # reportlab takes long to import, so it's only loaded when needed
+        from report import ReportCancelled, create_report
+
+        def on_page(canvas, doc):
+            if self._cancel.is_set():
+                raise ReportCancelled()
+            self.signals.progress.emit(canvas.getPageNumber())
+
+        tempfile = NamedTemporaryFile("wb", suffix=".pdf", delete=False)
+        try:
+            create_report(
+                self.list,
+                tempfile,
+                on_page=on_page,
+                orientation=self.orientation,
+            )
+        except Exception as e:
+            tempfile.close()
+            os.unlink(tempfile.name)
+            if isinstance(e, ReportCancelled):
+                self.signals.cancelled.emit()
+            else:
+                self.signals.failed.emit(str(e))
+            return
+        tempfile.close()
+        self.signals.finished.emit(tempfile.name)
@@ -0,0 +1,195 @@
+"""
+In-memory substring search over the items of a list. Items are indexed by
+the trigrams of their case folded text, which also finds parts of German
+compound words ("bürste" in "Zahnbürste").
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+from utils import common_prefix
+
+# Length of the indexed substrings, shorter queries search their keys
+TRIGRAM = 3
+# Shorter queries match most items, they aren't searched
+MIN_QUERY = 2
+
+
+def _fold(item: Optional[str]) -> str:
+    return item.casefold() if item else ""
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i:i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+class SearchIndex:
+    """
+    Trigram index of the items of some categories. The postings refer to
+    distinct item texts, and each text to the ids of its items, so a
+    search only touches the matching items. Ids stay the same when items
+    move to other rows, only the rows of the ids are rebuilt then, on the
+    next search. `sync()` updates the index after the items changed.
+    """
+
+    def __init__(self, categories: Optional[dict[str, list]] = None):
+        # The items as they were indexed, their folded texts and their ids
+        self._items: dict[str, list] = {}
+        self._texts: dict[str, list[str]] = {}
+        self._item_ids: dict[str, list[int]] = {}
+        self._next_id = 0
+        self._category_of: dict[int, str] = {}
+        # Row of each id, by category, None after rows moved
+        self._row_of: dict[str, Optional[dict[int, int]]] = {}
+        # The ids of each text and the texts of each trigram
+        self._ids: dict[str, set[int]] = {}
+        self._postings: dict[str, set[str]] = {}
+        # Texts without any trigram
+        self._short: set[str] = set()
+        if categories is not None:
+            self.sync(categories)
+
+    def __len__(self) -> int:
+        return sum(len(texts) for texts in self._texts.values())
+
+    def _add(self, text: str, category: str, item_id: int):
+        if not text:
+            return
+        ids = self._ids.get(text)
+        if ids is None:
+            ids = self._ids[text] = set()
+            if len(text) < TRIGRAM:
+                self._short.add(text)
+            for trigram in _trigrams(text):
+                self._postings.setdefault(trigram, set()).add(text)
+        ids.add(item_id)
+        self._category_of[item_id] = category
+
+    def _remove(self, texts: list[str], ids: list[int]):
+        for text, item_id in zip(texts, ids):
+            if not text:
+                continue
+            del self._category_of[item_id]
+            text_ids = self._ids[text]
+            text_ids.discard(item_id)
+            if text_ids:
+                continue
+            del self._ids[text]
+            self._short.discard(text)
+            for trigram in _trigrams(text):
+                postings = self._postings[trigram]
+                postings.discard(text)
+                if not postings:
+                    del self._postings[trigram]
+
+    def _drop(self, category: str):
+        self._remove(
+            self._texts.pop(category, []), self._item_ids.pop(category, [])
+        )
+        self._row_of.pop(category, None)
+        self._items.pop(category, None)
+
+    def _update(self, category: str, items: list):
+        """
+        Reindex the part of `category` between the unchanged start and end
+        of its items, which is just the edited item for most edits.
+        """
+        old = self._items.get(category)
+        if old == items:
+            return
+        if old is None:
+            old = []
+        texts = self._texts.setdefault(category, [])
+        ids = self._item_ids.setdefault(category, [])
+        start = common_prefix(old, items)
+        end = common_prefix(old[start:][::-1], items[start:][::-1])
+        removed = ids[start:len(ids) - end]
+        self._remove(texts[start:len(texts) - end], removed)
+        added = [_fold(item) for item in items[start:len(items) - end]]
+        new_ids = range(self._next_id, self._next_id + len(added))
+        self._next_id += len(added)
+        for text, item_id in zip(added, new_ids):
+            self._add(text, category, item_id)
+        texts[start:len(texts) - end] = added
+        ids[start:len(ids) - end] = new_ids
+        self._items[category] = list(items)
+        row_of = self._row_of.get(category)
+        if row_of is None or len(removed) != len(new_ids):
+            self._row_of[category] = None
+            return
+        for item_id in removed:
+            del row_of[item_id]
+        for row, item_id in enumerate(new_ids, start):
+            row_of[item_id] = row
+
+    def _rows(self, category: str) -> dict[int, int]:
+        row_of = self._row_of.get(category)
+        if row_of is None:
+            ids = self._item_ids[category]
+            row_of = self._row_of[category] = dict(zip(ids, range(len(ids))))
+        return row_of
+
+    def sync(
+        self,
+        categories: dict[str, list],
+        changed: Optional[Iterable[str]] = None,
+    ):
+        """
+        Update the index to the items of `categories`. Only the categories
+        in `changed` are compared if it's given.
+        """
+        if changed is None:
+            for category in list(self._items):
+                if category not in categories:
+                    self._drop(category)
+            changed = categories
+        for category in changed:
+            if category in categories:
+                self._update(category, categories[category])
+            else:
+                self._drop(category)
+
+    def matching_texts(self, query: str) -> set[str]:
+        query = _fold(query)
+        if len(query) < MIN_QUERY:
+            return set()
+        if len(query) < TRIGRAM:
+            # Longer texts containing the query have a trigram containing
+            # it, and there are far fewer trigrams than texts
+            texts = {text for text in self._short if query in text}
+            for trigram, postings in self._postings.items():
+                if query in trigram:
+                    texts |= postings
+            return texts
+        postings = sorted(
+            (self._postings.get(trigram, set())
+             for trigram in _trigrams(query)),
+            key=len,
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        return {text for text in candidates if query in text}
+
+    def _matching_ids(self, query: str) -> set[int]:
+        return set().union(*map(self._ids.__getitem__,
+                                self.matching_texts(query)))
+
+    def search(self, query: str) -> dict[str, list[int]]:
+        """The rows of the items containing `query`, by category."""
+        rows: dict[str, list[int]] = {}
+        for item_id in self._matching_ids(query):
+            category = self._category_of[item_id]
+            category_rows = rows.get(category)
+            if category_rows is None:
+                category_rows = rows[category] = []
+            category_rows.append(item_id)
+        # In the order of the categories
+        return {
+            category: sorted(map(self._rows(category).__getitem__,
+                                 rows[category]))
+            for category in self._texts
+            if category in rows
+        }
+
+    def count(self, query: str) -> int:
+        """Number of items containing `query`."""
+        return len(self._matching_ids(query))
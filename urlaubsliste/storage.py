@@ -0,0 +1,624 @@
+"""
+Storage backends of lists. `model.List` loads and saves a list through
+the first backend in `model.BACKENDS` that handles its path. Whole-file
+JSON and binary lists are `model.FileBackend`'s, `SqliteBackend` keeps a
+list in an SQLite database with a row per item instead:
+
+    lists:      the list itself (MAIN_LIST) and copies of its base lists
+    categories: the categories of every list, with position and size
+    items:      the items of every category, by position
+
+Saving only writes the rows that changed since the list was loaded or
+last saved. The copies of the base lists are refreshed by `save()` when
+their files changed, so the base lists can be resolved with one query
+rather than by reading every file of the chain.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from itertools import count, repeat
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from lazy import LazyCategories, Pending
+from utils import common_prefix, intern_items
+
+DATABASE_SUFFIX = ".ulldb"
+SQLITE_MAGIC = b"SQLite format 3\x00"
+# "ULLD", tells list databases apart from other SQLite files
+APPLICATION_ID = 0x554C4C44
+SCHEMA_VERSION = 1
+# Row of the list stored in the database, the others are base lists
+MAIN_LIST = 1
+
+SCHEMA = """
+CREATE TABLE lists (
+    id INTEGER PRIMARY KEY,
+    source TEXT UNIQUE,
+    mtime_ns INTEGER,
+    size INTEGER,
+    header TEXT NOT NULL,
+    base INTEGER REFERENCES lists(id)
+);
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    list INTEGER NOT NULL REFERENCES lists(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE INDEX categories_list ON categories(list, position);
+CREATE TABLE items (
+    category INTEGER NOT NULL REFERENCES categories(id),
+    position INTEGER NOT NULL,
+    item TEXT,
+    PRIMARY KEY (category, position)
+) WITHOUT ROWID;
+"""
+
+# The list `source` and its base lists, following the `base` links
+_CHAIN = """
+WITH RECURSIVE chain(id, depth) AS (
+    SELECT id, 0 FROM lists WHERE source = ?
+    UNION ALL
+    SELECT lists.base, chain.depth + 1 FROM chain
+    JOIN lists ON lists.id = chain.id
+    WHERE lists.base IS NOT NULL AND chain.depth < ?
+)
+"""
+
+
+class StorageBackend:
+    """
+    Loads and saves lists in one format. Along with a list, `load()`
+    returns a state that `save()` gets back, to tell what changed since.
+    """
+
+    def handles(self, path: Path) -> bool:
+        raise NotImplementedError
+
+    def load(self, path: Path) -> tuple[dict, Any]:
+        """The raw list at `path` and the state of the backend for it."""
+        raise NotImplementedError
+
+    def save(self, raw: dict, path: Path, backup: bool, state: Any) -> Any:
+        """
+        Save `raw` to `path` and return the new state. `state` is what the
+        last `load()` or `save()` of the list returned, of any backend.
+        With `backup`, the previous file is kept as `<path>.bak`.
+        """
+        raise NotImplementedError
+
+    def read_header(self, path: Path) -> dict:
+        """Everything but the structure of the list at `path`."""
+        raise NotImplementedError
+
+    def resolve_bases(
+        self, path: Path, base_list: str, max_depth: int
+    ) -> Optional[list[tuple[Path, dict]]]:
+        """
+        The chain of base lists, starting with `base_list`, of the list
+        saved at `path`, as resolved paths and raw lists. It ends after
+        `max_depth` + 1 lists. None if the backend doesn't know the chain,
+        the base lists are read from their files then.
+        """
+        return None
+
+
+def replace_file(
+    path: Path, write: Callable[[str], bool], backup: bool
+) -> bool:
+    """
+    Replace `path` without ever leaving a truncated file behind:
+    `write()` writes the new content to the temporary file it gets,
+    which then replaces `path` with its permissions. With `backup`, the
+    previous file is kept as `<path>.bak`. If `write()` returns False or
+    raises, `path` stays as it is. Returns whether `path` was replaced.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    os.close(fd)
+    try:
+        if not write(temp_path):
+            os.unlink(temp_path)
+            return False
+        if path.exists():
+            shutil.copymode(path, temp_path)
+            if backup:
+                shutil.copy2(path, path.with_name(path.name + ".bak"))
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return True
+
+
+class _Saved:
+    """What a list database contains, as far as the list was decoded."""
+    __slots__ = ("path", "header", "order", "categories")
+
+    def __init__(self, path: Path, header: dict):
+        self.path = path
+        self.header = header
+        self.order: list[str] = []
+        # Id and items of each category, the items are None until decoded
+        self.categories: dict[str, list] = {}
+
+
+def _connect(path: Path, readonly: bool = False) -> sqlite3.Connection:
+    if readonly:
+        # Lazily loaded categories may be decoded on any thread
+        return sqlite3.connect(
+            path.as_uri() + "?mode=ro", uri=True, check_same_thread=False
+        )
+    return sqlite3.connect(path)
+
+
+def _check(connection: sqlite3.Connection):
+    (application_id,) = connection.execute(
+        "PRAGMA application_id"
+    ).fetchone()
+    (version,) = connection.execute("PRAGMA user_version").fetchone()
+    if application_id != APPLICATION_ID:
+        raise ValueError("Not a list database.")
+    if version > SCHEMA_VERSION:
+        raise ValueError("The list database is from a newer version.")
+
+
+def _header(raw: dict) -> dict:
+    return {key: value for key, value in raw.items() if key != "structure"}
+
+
+def _dumps(header: dict) -> str:
+    return json.dumps(header, ensure_ascii=False)
+
+
+def _read_items(
+    connection: sqlite3.Connection, category_id: int
+) -> list[Optional[str]]:
+    # Building one JSON array in SQLite and parsing it is about twice as
+    # fast as fetching a row per item
+    (items,) = connection.execute(
+        "SELECT json_group_array(item) FROM (SELECT item FROM items "
+        "WHERE category = ? ORDER BY position)",
+        (category_id,),
+    ).fetchone()
+    return json.loads(items)
+
+
+def _insert_category(
+    connection: sqlite3.Connection,
+    list_id: int,
+    position: int,
+    name: str,
+    items: list[Optional[str]],
+) -> int:
+    category_id = connection.execute(
+        "INSERT INTO categories (list, position, name, count) "
+        "VALUES (?, ?, ?, ?)",
+        (list_id, position, name, len(items)),
+    ).lastrowid
+    connection.executemany(
+        "INSERT INTO items (category, position, item) VALUES (?, ?, ?)",
+        zip(repeat(category_id), count(), items),
+    )
+    return category_id
+
+
+def _delete_category(connection: sqlite3.Connection, category_id: int):
+    connection.execute("DELETE FROM items WHERE category = ?", (category_id,))
+    connection.execute("DELETE FROM categories WHERE id = ?", (category_id,))
+
+
+def _delete_categories_of(connection: sqlite3.Connection, list_id: int):
+    connection.execute(
+        "DELETE FROM items WHERE category IN "
+        "(SELECT id FROM categories WHERE list = ?)",
+        (list_id,),
+    )
+    connection.execute("DELETE FROM categories WHERE list = ?", (list_id,))
+
+
+def _write_items(
+    connection: sqlite3.Connection,
+    category_id: int,
+    old: Optional[list],
+    items: list[Optional[str]],
+):
+    """
+    Write the rows of a category that had the `old` items, None if they
+    aren't known. Edits that keep the number of items only update the
+    items that changed, otherwise every item after the first change is
+    written again.
+    """
+    start = common_prefix(old, items) if old is not None else 0
+    if old is not None and len(old) == len(items):
+        end = len(items) - common_prefix(
+            old[start:][::-1], items[start:][::-1]
+        )
+        connection.executemany(
+            "UPDATE items SET item = ? WHERE category = ? AND position = ?",
+            (
+                (items[position], category_id, position)
+                for position in range(start, end)
+                if items[position] != old[position]
+            ),
+        )
+        return
+    connection.execute(
+        "DELETE FROM items WHERE category = ? AND position >= ?",
+        (category_id, start),
+    )
+    connection.executemany(
+        "INSERT INTO items (category, position, item) VALUES (?, ?, ?)",
+        zip(repeat(category_id), count(start), items[start:]),
+    )
+    connection.execute(
+        "UPDATE categories SET count = ? WHERE id = ?",
+        (len(items), category_id),
+    )
+
+
+class SqliteBackend(StorageBackend):
+    """
+    Lists in SQLite databases. `load_base(path)` reads the base lists to
+    copy into the database, in any format. Like the file formats, the
+    database is only ever replaced as a whole or changed in a transaction.
+    """
+
+    def __init__(self, load_base: Callable[[Path], dict], max_depth: int):
+        self.load_base = load_base
+        self.max_depth = max_depth
+        # The last resolved chain and the file signatures it's valid for
+        self._resolved: Optional[tuple[Path, list, list]] = None
+
+    def handles(self, path: Path) -> bool:
+        if path.suffix == DATABASE_SUFFIX:
+            return True
+        try:
+            with open(path, "rb") as fp:
+                return fp.read(len(SQLITE_MAGIC)) == SQLITE_MAGIC
+        except OSError:
+            return False
+
+    def load(self, path: Path) -> tuple[dict, _Saved]:
+        """
+        The list in the database at `path`. Its categories are read when
+        they're first accessed, the database stays open until then.
+        """
+        path = path.resolve()
+        # Opening a missing database would fail with an unclear message
+        path.stat()
+        connection = _connect(path, readonly=True)
+        try:
+            _check(connection)
+            row = connection.execute(
+                "SELECT header FROM lists WHERE id = ?", (MAIN_LIST,)
+            ).fetchone()
+            if row is None:
+                raise ValueError("The list database is empty.")
+            rows = connection.execute(
+                "SELECT id, name, count FROM categories WHERE list = ? "
+                "ORDER BY position",
+                (MAIN_LIST,),
+            ).fetchall()
+        except sqlite3.DatabaseError as e:
+            connection.close()
+            raise ValueError(f"Not a list database: {e}") from e
+        except BaseException:
+            connection.close()
+            raise
+        saved = _Saved(path, json.loads(row[0]))
+        pending = {}
+        for category_id, name, size in rows:
+            saved.order.append(name)
+            saved.categories[name] = [category_id, None]
+            pending[name] = Pending((category_id, name), size)
+
+        def decode(category: Pending) -> list:
+            category_id, name = category.span
+            items = intern_items(_read_items(connection, category_id))
+            entry = saved.categories.get(name)
+            if entry is not None and entry[0] == category_id:
+                entry[1] = list(items)
+            return items
+
+        if not pending:
+            connection.close()
+        raw = dict(saved.header)
+        raw["structure"] = {
+            "categories": LazyCategories(pending, decode, connection.close)
+        }
+        return raw, saved
+
+    def save(
+        self, raw: dict, path: Path, backup: bool, state: Any
+    ) -> _Saved:
+        """
+        Update the database the list was loaded from or last saved to,
+        otherwise write a new one that replaces `path`.
+        """
+        path = path.resolve()
+        if isinstance(state, _Saved) and state.path == path and path.exists():
+            if backup:
+                shutil.copy2(path, path.with_name(path.name + ".bak"))
+            connection = _connect(path)
+            try:
+                with connection:
+                    self._update(connection, raw, state)
+                    self._refresh_bases(
+                        connection, path, raw.get("base_list")
+                    )
+            finally:
+                connection.close()
+            return state
+        categories = raw["structure"]["categories"]
+        if isinstance(categories, LazyCategories):
+            categories.materialize()
+
+        def write(temp_path: str) -> bool:
+            nonlocal state
+            connection = _connect(Path(temp_path))
+            try:
+                with connection:
+                    state = self._create(connection, raw, path)
+                    self._refresh_bases(
+                        connection, path, raw.get("base_list")
+                    )
+            finally:
+                connection.close()
+            return True
+
+        replace_file(path, write, backup)
+        return state
+
+    def _create(
+        self, connection: sqlite3.Connection, raw: dict, path: Path
+    ) -> _Saved:
+        connection.executescript(SCHEMA)
+        connection.execute(f"PRAGMA application_id = {APPLICATION_ID}")
+        connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        header = _header(raw)
+        connection.execute(
+            "INSERT INTO lists (id, header) VALUES (?, ?)",
+            (MAIN_LIST, _dumps(header)),
+        )
+        saved = _Saved(path, header)
+        categories = raw["structure"]["categories"]
+        for position, name in enumerate(categories):
+            items = categories[name]
+            category_id = _insert_category(
+                connection, MAIN_LIST, position, name, items
+            )
+            saved.order.append(name)
+            saved.categories[name] = [category_id, list(items)]
+        return saved
+
+    def _update(
+        self, connection: sqlite3.Connection, raw: dict, saved: _Saved
+    ):
+        """
+        Write what changed since `saved` and update it. If the transaction
+        fails, `saved` must not be used again.
+        """
+        header = _header(raw)
+        if header != saved.header:
+            connection.execute(
+                "UPDATE lists SET header = ? WHERE id = ?",
+                (_dumps(header), MAIN_LIST),
+            )
+            saved.header = header
+        categories = raw["structure"]["categories"]
+        lazy = isinstance(categories, LazyCategories)
+        for name in [name for name in saved.categories
+                     if name not in categories]:
+            category_id, _ = saved.categories.pop(name)
+            _delete_category(connection, category_id)
+        for position, name in enumerate(categories):
+            entry = saved.categories.get(name)
+            if entry is None:
+                items = categories[name]
+                category_id = _insert_category(
+                    connection, MAIN_LIST, position, name, items
+                )
+                saved.categories[name] = [category_id, list(items)]
+                continue
+            # Categories that were never decoded can't have changed
+            if lazy and categories.is_pending(name):
+                continue
+            category_id, old = entry
+            items = categories[name]
+            if old != items:
+                _write_items(connection, category_id, old, items)
+                entry[1] = list(items)
+        order = list(categories)
+        if order != saved.order:
+            connection.executemany(
+                "UPDATE categories SET position = ? WHERE id = ?",
+                (
+                    (position, saved.categories[name][0])
+                    for position, name in enumerate(order)
+                ),
+            )
+            saved.order = order
+
+    def _refresh_bases(
+        self,
+        connection: sqlite3.Connection,
+        path: Path,
+        base_list: Optional[str],
+    ):
+        """
+        Bring the copies of the base lists of the list saved to `path` up
+        to date with their files and drop those that aren't base lists
+        anymore. A base list that can't be read, or `path` itself, ends
+        the chain; it's read from its file when resolving.
+        """
+        ids: dict[str, int] = {}
+        previous = MAIN_LIST
+        base = None
+        while base_list is not None and len(ids) <= self.max_depth:
+            base_path = Path(base_list).resolve()
+            source = str(base_path)
+            if base_path == path:
+                # Would change with every save
+                break
+            if source in ids:
+                # Kept, so resolving finds the cycle
+                base = ids[source]
+                break
+            try:
+                stat = base_path.stat()
+                row = connection.execute(
+                    "SELECT id, mtime_ns, size, header FROM lists "
+                    "WHERE source = ?",
+                    (source,),
+                ).fetchone()
+                if row is not None and row[1:3] == (
+                    stat.st_mtime_ns, stat.st_size
+                ):
+                    list_id, header = row[0], json.loads(row[3])
+                else:
+                    list_id, header = self._copy_base(
+                        connection,
+                        row[0] if row is not None else None,
+                        source,
+                        stat,
+                        self.load_base(base_path),
+                    )
+            except (OSError, ValueError, KeyError, TypeError):
+                break
+            connection.execute(
+                "UPDATE lists SET base = ? WHERE id = ? AND base IS NOT ?",
+                (list_id, previous, list_id),
+            )
+            ids[source] = previous = list_id
+            base_list = header.get("base_list")
+        connection.execute(
+            "UPDATE lists SET base = ? WHERE id = ? AND base IS NOT ?",
+            (base, previous, base),
+        )
+        kept = set(ids.values())
+        for (list_id,) in connection.execute(
+            "SELECT id FROM lists WHERE id != ?", (MAIN_LIST,)
+        ).fetchall():
+            if list_id not in kept:
+                _delete_categories_of(connection, list_id)
+                connection.execute(
+                    "DELETE FROM lists WHERE id = ?", (list_id,)
+                )
+
+    def _copy_base(
+        self,
+        connection: sqlite3.Connection,
+        list_id: Optional[int],
+        source: str,
+        stat: os.stat_result,
+        raw: dict,
+    ) -> tuple[int, dict]:
+        header = _header(raw)
+        if list_id is None:
+            list_id = connection.execute(
+                "INSERT INTO lists (source, mtime_ns, size, header) "
+                "VALUES (?, ?, ?, ?)",
+                (source, stat.st_mtime_ns, stat.st_size, _dumps(header)),
+            ).lastrowid
+        else:
+            connection.execute(
+                "UPDATE lists SET mtime_ns = ?, size = ?, header = ? "
+                "WHERE id = ?",
+                (stat.st_mtime_ns, stat.st_size, _dumps(header), list_id),
+            )
+            _delete_categories_of(connection, list_id)
+        categories = raw["structure"]["categories"]
+        for position, name in enumerate(categories):
+            _insert_category(
+                connection, list_id, position, name, categories[name]
+            )
+        return list_id, header
+
+    def read_header(self, path: Path) -> dict:
+        path.stat()
+        connection = _connect(path.resolve(), readonly=True)
+        try:
+            _check(connection)
+            row = connection.execute(
+                "SELECT header FROM lists WHERE id = ?", (MAIN_LIST,)
+            ).fetchone()
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"Not a list database: {e}") from e
+        finally:
+            connection.close()
+        if row is None:
+            raise ValueError("The list database is empty.")
+        return json.loads(row[0])
+
+    def resolve_bases(
+        self, path: Path, base_list: str, max_depth: int
+    ) -> Optional[list[tuple[Path, dict]]]:
+        """
+        The copies of the base lists, if none of their files changed since
+        they were copied. The chain and its categories are found with one
+        query each, and the result is kept until a file of the chain
+        changes.
+        """
+        path = path.resolve()
+        source = str(Path(base_list).resolve())
+        try:
+            connection = _connect(path, readonly=True)
+        except sqlite3.Error:
+            return None
+        try:
+            rows = connection.execute(
+                _CHAIN + "SELECT lists.source, lists.mtime_ns, lists.size, "
+                "lists.header FROM chain JOIN lists ON lists.id = chain.id "
+                "ORDER BY chain.depth",
+                (source, max_depth),
+            ).fetchall()
+            if not rows:
+                return None
+            signatures = []
+            for file, mtime_ns, size, _ in rows:
+                stat = os.stat(file)
+                if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size):
+                    return None
+                signatures.append((file, mtime_ns, size))
+            headers = [json.loads(row[3]) for row in rows]
+            if (
+                headers[-1].get("base_list") is not None
+                and len(rows) <= max_depth
+            ):
+                # The rest of the chain couldn't be copied
+                return None
+            if self._resolved is not None and self._resolved[:2] == (
+                path, signatures
+            ):
+                return self._resolved[2]
+            bases = [
+                {**header, "structure": {"categories": {}}}
+                for header in headers
+            ]
+            for depth, category_id, name in connection.execute(
+                _CHAIN + "SELECT chain.depth, categories.id, categories.name "
+                "FROM chain JOIN categories ON categories.list = chain.id "
+                "ORDER BY chain.depth, categories.position",
+                (source, max_depth),
+            ).fetchall():
+                bases[depth]["structure"]["categories"][name] = intern_items(
+                    _read_items(connection, category_id)
+                )
+        except (OSError, ValueError, sqlite3.Error):
+            return None
+        finally:
+            connection.close()
+        resolved = [(Path(row[0]), raw) for row, raw in zip(rows, bases)]
+        self._resolved = (path, signatures, resolved)
+        return resolved
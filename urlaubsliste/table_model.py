@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor
+
+from history import Command, History, InsertItem, RemoveItem, SetItem
+from model import List
+
+# Background of the cells that match the search
+MATCH_BRUSH = QBrush(QColor(255, 236, 140))
+
+
+class ListTableModel(QAbstractTableModel):
+    """
+    Shows a `List` with one column per category. Cells are read from and
+    written to the list directly, nothing gets copied. Editable models
+    have one extra row for adding new items. Edits are recorded in
+    `history` if one is given. Cells set by `setMatches()` are
+    highlighted.
+    """
+    listChanged = pyqtSignal()
+
+    def __init__(
+        self,
+        list_: Optional[List] = None,
+        editable: bool = True,
+        history: Optional[History] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.editable = editable
+        self.history = history
+        self._list = list_
+        self._categories: list[str] = []
+        self._row_count = 0
+        self._matches: dict[str, set[int]] = {}
+        self._load()
+
+    def _load(self):
+        self._categories = self._list.categories if self._list else []
+        self._row_count = self._count_rows()
+
+    def _count_rows(self) -> int:
+        if not self._categories:
+            return 0
+        longest_category_length = max(
+            self._list.get_amount_of_items_for_category(category)
+            for category in self._categories
+        )
+        return longest_category_length + (1 if self.editable else 0)
+
+    def setList(self, list_: Optional[List]):
+        """
+        Show another list, or the same list after it was changed from
+        outside the model. Resets the whole model.
+        """
+        self.beginResetModel()
+        self._list = list_
+        self._load()
+        self.endResetModel()
+
+    def setMatches(self, matches: dict[str, list[int]]):
+        """Highlight the given rows of each category."""
+        self._matches = {
+            category: set(rows) for category, rows in matches.items()
+        }
+        if self._row_count and self._categories:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self._row_count - 1, len(self._categories) - 1),
+                [Qt.BackgroundRole],
+            )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._categories)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.BackgroundRole:
+            rows = self._matches.get(self._categories[index.column()])
+            if rows is not None and index.row() in rows:
+                return MATCH_BRUSH
+            return None
+        if role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        items = self._list.get_items_for_category(
+            self._categories[index.column()]
+        )
+        if index.row() < len(items):
+            return items[index.row()]
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.DisplayRole,
+    ) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._categories[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if self.editable and index.isValid():
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(
+        self,
+        index: QModelIndex,
+        value: Any,
+        role: int = Qt.EditRole,
+    ) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        value = value or ""
+        column = index.column()
+        row = index.row()
+        category = self._categories[column]
+        items = self._list.get_items_for_category(category)
+        if row < len(items):
+            if items[row] == value:
+                return False
+            if value:
+                self._execute(SetItem(category, row, value))
+                first, last = row, row
+            else:
+                # Empty cells aren't stored, the items below move up
+                self._execute(RemoveItem(category, row))
+                first, last = row, len(items)
+        else:
+            if not value:
+                return False
+            # There are no gaps between items, so the new item always
+            # lands directly after the last one of its category
+            self._execute(InsertItem(category, len(items), value))
+            first, last = len(items) - 1, row
+        self._fit_row_count()
+        last = min(last, self._row_count - 1)
+        self.dataChanged.emit(
+            self.index(first, column),
+            self.index(last, column),
+            [Qt.DisplayRole, Qt.EditRole],
+        )
+        self.listChanged.emit()
+        return True
+
+    def _execute(self, command: Command):
+        if self.history is None:
+            command.redo(self._list)
+        else:
+            self.history.execute(self._list, command)
+
+    def _fit_row_count(self):
+        row_count = self._count_rows()
+        if row_count > self._row_count:
+            self.beginInsertRows(QModelIndex(), self._row_count, row_count - 1)
+            self._row_count = row_count
+            self.endInsertRows()
+        elif row_count < self._row_count:
+            self.beginRemoveRows(QModelIndex(), row_count, self._row_count - 1)
+            self._row_count = row_count
+            self.endRemoveRows()
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file 'c:\Users\Dominik\code\projects\Urlaubsliste Deluxe\urlaubsliste\ui\item_editor.ui'
+# Form implementation generated from reading ui file 'urlaubsliste/ui/item_editor.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.9
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'urlaubsliste/ui/open_by_content.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(640, 480)
+        self.verticalLayout = QtWidgets.QVBoxLayout(Dialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.searchEdit = QtWidgets.QLineEdit(Dialog)
+        font = QtGui.QFont()
+        font.setFamily("Calibri")
+        font.setPointSize(12)
+        self.searchEdit.setFont(font)
+        self.searchEdit.setClearButtonEnabled(True)
+        self.searchEdit.setObjectName("searchEdit")
+        self.verticalLayout.addWidget(self.searchEdit)
+        self.results = QtWidgets.QTableWidget(Dialog)
+        self.results.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.results.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.results.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.results.setColumnCount(3)
+        self.results.setObjectName("results")
+        self.results.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.results.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.results.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.results.setHorizontalHeaderItem(2, item)
+        self.results.horizontalHeader().setStretchLastSection(True)
+        self.results.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.results)
+        self.statusLabel = QtWidgets.QLabel(Dialog)
+        self.statusLabel.setText("")
+        self.statusLabel.setObjectName("statusLabel")
+        self.verticalLayout.addWidget(self.statusLabel)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Open)
+        self.buttonBox.setObjectName("buttonBox")
+        self.verticalLayout.addWidget(self.buttonBox)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.searchEdit.setPlaceholderText(_translate("Dialog", "Gegenstand suchen..."))
+        item = self.results.horizontalHeaderItem(0)
+        item.setText(_translate("Dialog", "Liste"))
+        item = self.results.horizontalHeaderItem(1)
+        item.setText(_translate("Dialog", "Kategorie"))
+        item = self.results.horizontalHeaderItem(2)
+        item.setText(_translate("Dialog", "Gegenstand"))
@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file 'c:\Users\Dominik\code\projects\Urlaubsliste Deluxe\urlaubsliste\ui\preview.ui'
+# Form implementation generated from reading ui file 'urlaubsliste/ui/preview.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.9
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -44,12 +44,10 @@ class Ui_Dialog(object):
         self.gridLayout.addWidget(self.title, 3, 0, 1, 1)
         self.horizontalLayout = QtWidgets.QHBoxLayout()
         self.horizontalLayout.setObjectName("horizontalLayout")
-        self.table = QtWidgets.QTableWidget(Dialog)
+        self.table = QtWidgets.QTableView(Dialog)
         self.table.setStyleSheet("background:transparent;")
         self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.table.setObjectName("table")
-        self.table.setColumnCount(0)
-        self.table.setRowCount(0)
         self.horizontalLayout.addWidget(self.table)
         self.verticalLayout = QtWidgets.QVBoxLayout()
         self.verticalLayout.setObjectName("verticalLayout")
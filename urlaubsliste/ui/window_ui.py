@@ -1,8 +1,8 @@
 # -*- coding: utf-8 -*-
 
-# Form implementation generated from reading ui file 'c:\Users\Dominik\code\projects\Urlaubsliste Deluxe\urlaubsliste\ui\window.ui'
+# Form implementation generated from reading ui file 'urlaubsliste/ui/window.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.9
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -33,7 +33,11 @@ class Ui_MainWindow(object):
         self.title.setWordWrap(False)
         self.title.setObjectName("title")
         self.verticalLayout.addWidget(self.title)
-        self.table = QtWidgets.QTableWidget(self.centralwidget)
+        self.filterEdit = QtWidgets.QLineEdit(self.centralwidget)
+        self.filterEdit.setClearButtonEnabled(True)
+        self.filterEdit.setObjectName("filterEdit")
+        self.verticalLayout.addWidget(self.filterEdit)
+        self.table = QtWidgets.QTableView(self.centralwidget)
         self.table.setEnabled(True)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
@@ -56,8 +60,6 @@ class Ui_MainWindow(object):
         self.table.setShowGrid(True)
         self.table.setGridStyle(QtCore.Qt.SolidLine)
         self.table.setObjectName("table")
-        self.table.setColumnCount(0)
-        self.table.setRowCount(0)
         self.table.horizontalHeader().setCascadingSectionResizes(True)
         self.table.horizontalHeader().setStretchLastSection(False)
         self.verticalLayout.addWidget(self.table)
@@ -141,12 +143,24 @@ class Ui_MainWindow(object):
         icon11.addPixmap(QtGui.QPixmap(":/icons/redo.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         self.actionRedo.setIcon(icon11)
         self.actionRedo.setObjectName("actionRedo")
+        self.actionPrintLandscape = QtWidgets.QAction(MainWindow)
+        self.actionPrintLandscape.setIcon(icon9)
+        self.actionPrintLandscape.setObjectName("actionPrintLandscape")
+        self.actionOffnenNachInhalt = QtWidgets.QAction(MainWindow)
+        self.actionOffnenNachInhalt.setIcon(icon2)
+        self.actionOffnenNachInhalt.setObjectName("actionOffnenNachInhalt")
+        self.actionSicherungskopie = QtWidgets.QAction(MainWindow)
+        self.actionSicherungskopie.setCheckable(True)
+        self.actionSicherungskopie.setChecked(True)
+        self.actionSicherungskopie.setObjectName("actionSicherungskopie")
         self.menuDatei.addAction(self.actionNeueUrlaubsliste)
         self.menuDatei.addSeparator()
         self.menuDatei.addAction(self.actionOffnen)
+        self.menuDatei.addAction(self.actionOffnenNachInhalt)
         self.menuDatei.addSeparator()
         self.menuDatei.addAction(self.actionListeSpeichern)
         self.menuDatei.addAction(self.actionListeSpeichernUnter)
+        self.menuDatei.addAction(self.actionSicherungskopie)
         self.menuDatei.addSeparator()
         self.menuDatei.addAction(self.actionBeenden)
         self.menuAktionen.addAction(self.actionListentitelAndern)
@@ -161,6 +175,7 @@ class Ui_MainWindow(object):
         self.menuAnsicht.addSeparator()
         self.menuAnsicht.addAction(self.actionVorschau)
         self.menuAnsicht.addAction(self.actionDrucken)
+        self.menuAnsicht.addAction(self.actionPrintLandscape)
         self.menubar.addAction(self.menuDatei.menuAction())
         self.menubar.addAction(self.menuAktionen.menuAction())
         self.menubar.addAction(self.menuAnsicht.menuAction())
@@ -187,6 +202,7 @@ class Ui_MainWindow(object):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
         self.title.setText(_translate("MainWindow", "Listentitel"))
+        self.filterEdit.setPlaceholderText(_translate("MainWindow", "Suchen..."))
         self.menuDatei.setTitle(_translate("MainWindow", "Datei"))
         self.menuAktionen.setTitle(_translate("MainWindow", "Bearbeiten"))
         self.menuAnsicht.setTitle(_translate("MainWindow", "Ansicht"))
@@ -220,4 +236,12 @@ class Ui_MainWindow(object):
         self.actionRedo.setText(_translate("MainWindow", "Wiederherstellen"))
         self.actionRedo.setToolTip(_translate("MainWindow", "Letzte Rückgängigmachung wiederherstellen"))
         self.actionRedo.setShortcut(_translate("MainWindow", "Ctrl+Shift+Z"))
+        self.actionPrintLandscape.setText(_translate("MainWindow", "Querformat Drucken"))
+        self.actionPrintLandscape.setToolTip(_translate("MainWindow", "Liste im Querformat drucken (bei sehr vielen Kategorien)"))
+        self.actionPrintLandscape.setShortcut(_translate("MainWindow", "Ctrl+Shift+P"))
+        self.actionOffnenNachInhalt.setText(_translate("MainWindow", "Nach Inhalt öffnen..."))
+        self.actionOffnenNachInhalt.setToolTip(_translate("MainWindow", "Liste anhand eines Gegenstands finden und öffnen"))
+        self.actionOffnenNachInhalt.setShortcut(_translate("MainWindow", "Ctrl+Shift+O"))
+        self.actionSicherungskopie.setText(_translate("MainWindow", "Sicherungskopie behalten"))
+        self.actionSicherungskopie.setToolTip(_translate("MainWindow", "Beim Speichern die vorherige Datei als .bak behalten"))
 import icons_rc
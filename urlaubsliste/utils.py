@@ -1,98 +1,76 @@
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_CENTER
-from reportlab.lib.colors import black
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Spacer,
-    Paragraph,
-    Table,
-    TableStyle,
-)
+import sys
 
+# Orientations of printed reports, see `report.plan_layout()`
+PORTRAIT = "portrait"
+LANDSCAPE = "landscape"
 
-def deep_merge(dict1: dict, dict2: dict):
+# How `deep_merge()` combines lists that exist in both dicts
+MERGE_APPEND = "append"  # Parent items, then child items
+MERGE_DEDUPLICATE = "deduplicate"  # Like append, but every item only once
+MERGE_OVERRIDE = "override"  # Child items replace parent items
+MERGE_STRATEGIES = (MERGE_APPEND, MERGE_DEDUPLICATE, MERGE_OVERRIDE)
+
+
+def deep_merge(
+    dict1: dict, dict2: dict, strategy: str = MERGE_APPEND
+) -> dict:
     """
-    `dict2` will be modified
+    Merge `dict1` into `dict2` without modifying either of them. The result
+    shares all values that didn't have to be merged with the inputs, so it
+    must not be modified either.
     """
+    merged = dict(dict2)
     for key, val in dict1.items():
         if isinstance(val, dict):
-            dict2_node = dict2.setdefault(key, {})
-            deep_merge(val, dict2_node)
+            merged[key] = deep_merge(val, dict2.get(key, {}), strategy)
         elif isinstance(val, list):
-            dict2_node = dict2.setdefault(key, [])
-            dict2_node.extend(val)
+            parent_val = dict2.get(key)
+            if parent_val is None or strategy == MERGE_OVERRIDE:
+                combined = val
+            else:
+                combined = parent_val + val
+            if strategy == MERGE_DEDUPLICATE:
+                combined = deduplicate(combined)
+            merged[key] = combined
         else:
             if key not in dict2:
-                dict2[key] = val
+                merged[key] = val
 
-    return dict2
+    return merged
 
 
-def create_report(list_, file):
-    if not list_.categories:
-        raise ValueError("List is empty")
-    table_data = []
-    # Set first row
-    headerstyle = ParagraphStyle(
-        "Tableheader",
-        fontName='Helvetica-Bold',
-        fontSize=12,
-    )
-    table_data.append(
-        [Paragraph(i, style=headerstyle) for i in list_.categories]
-    )
-    longest_category_length = 0
-    for category in list_.categories:
-        category_length = list_.get_amount_of_items_for_category(
-            category
-        )
-        if category_length > longest_category_length:
-            longest_category_length = category_length
-    normalstyle = ParagraphStyle(
-        "Tablecontent",
-        fontName='Helvetica',
-        fontSize=10,
-    )
-    for i in range(longest_category_length):
-        values = []
-        for category in list_.categories:
-            content = list_.get_items_for_category(category)
-            try:
-                value = Paragraph(content[i], style=normalstyle)
-            except IndexError:
-                value = Paragraph("", style=normalstyle)
-            values.append(value)
-        table_data.append(values)
+def deduplicate(items: list) -> list:
+    """`items` without repetitions, keeping the first occurrences."""
+    seen = set()
+    unique = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            unique.append(item)
+    return unique
 
-    doc = SimpleDocTemplate(file, filesize=A4)
-    style = getSampleStyleSheet()['Title']
-    style.fontName = 'Helvetica-Bold'
-    style.fontSize = 24
-    style.textColor = black
-    style.alignment = TA_CENTER
-    elements = []
-    label = list_.name
 
-    available_width = doc.width
-    num_columns = len(table_data[0])
-    column_width = available_width / num_columns
-    table = Table(table_data, colWidths=[column_width] * num_columns)
-    table_style = TableStyle([
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),  # X-Align
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),  # V-Align
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),  # Table font
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),  # Header font
-        ('FONTSIZE', (0, 0), (-1, -1), 10),  # Table font size
-        ('FONTSIZE', (0, 0), (-1, 0), 12),  # Header font size
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 4),  # Table bottom padding
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 6),  # Header bottom padding
-        ('GRID', (0, 0), (-1, -1), 1, black),  # Visible grid
-        ('WORDWRAP', (0, 0), (-1, -1), True),  # Enable textwrap
-    ])
-    table.setStyle(table_style)
+def common_prefix(a: list, b: list) -> int:
+    """
+    Length of the common start of `a` and `b`. Bisects with slice
+    comparisons, which is a lot faster than comparing item by item.
+    """
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[low:middle] == b[low:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
 
-    elements.append(Paragraph(label, style))
-    elements.append(Spacer(1, 50))
-    elements.append(table)
-    doc.build(elements)
+def intern_items(items: list) -> list:
+    """
+    `items` with their strings interned, so equal items share one object
+    across all loaded lists.
+    """
+    return [
+        sys.intern(item) if isinstance(item, str) else item
+        for item in items
+    ]
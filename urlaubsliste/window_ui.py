@@ -1,230 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Form implementation generated from reading ui file 'urlaubsliste/ui/window.ui'
-#
-# Created by: PyQt5 UI code generator 5.15.9
-#
-# WARNING: Any manual changes made to this file will be lost when pyuic5 is
-# run again.  Do not edit this file unless you know what you are doing.
-
-
-from PyQt5 import QtCore, QtGui, QtWidgets
-
-
-class Ui_MainWindow(object):
-    def setupUi(self, MainWindow):
-        MainWindow.setObjectName("MainWindow")
-        MainWindow.resize(1110, 903)
-        MainWindow.setDocumentMode(False)
-        self.centralwidget = QtWidgets.QWidget(MainWindow)
-        self.centralwidget.setObjectName("centralwidget")
-        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
-        self.verticalLayout.setObjectName("verticalLayout")
-        self.title = QtWidgets.QLabel(self.centralwidget)
-        font = QtGui.QFont()
-        font.setFamily("Calibri")
-        font.setPointSize(20)
-        font.setBold(True)
-        font.setWeight(75)
-        self.title.setFont(font)
-        self.title.setAutoFillBackground(True)
-        self.title.setScaledContents(False)
-        self.title.setAlignment(QtCore.Qt.AlignCenter)
-        self.title.setWordWrap(False)
-        self.title.setObjectName("title")
-        self.verticalLayout.addWidget(self.title)
-        self.table = QtWidgets.QTableWidget(self.centralwidget)
-        self.table.setEnabled(True)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.table.sizePolicy().hasHeightForWidth())
-        self.table.setSizePolicy(sizePolicy)
-        font = QtGui.QFont()
-        font.setFamily("Calibri")
-        font.setPointSize(12)
-        self.table.setFont(font)
-        self.table.setAcceptDrops(True)
-        self.table.setAutoFillBackground(True)
-        self.table.setStyleSheet("")
-        self.table.setSizeAdjustPolicy(QtWidgets.QAbstractScrollArea.AdjustToContents)
-        self.table.setDragEnabled(False)
-        self.table.setDragDropOverwriteMode(True)
-        self.table.setDragDropMode(QtWidgets.QAbstractItemView.InternalMove)
-        self.table.setDefaultDropAction(QtCore.Qt.MoveAction)
-        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.table.setShowGrid(True)
-        self.table.setGridStyle(QtCore.Qt.SolidLine)
-        self.table.setObjectName("table")
-        self.table.setColumnCount(0)
-        self.table.setRowCount(0)
-        self.table.horizontalHeader().setCascadingSectionResizes(True)
-        self.table.horizontalHeader().setStretchLastSection(False)
-        self.verticalLayout.addWidget(self.table)
-        MainWindow.setCentralWidget(self.centralwidget)
-        self.menubar = QtWidgets.QMenuBar(MainWindow)
-        self.menubar.setGeometry(QtCore.QRect(0, 0, 1110, 21))
-        self.menubar.setObjectName("menubar")
-        self.menuDatei = QtWidgets.QMenu(self.menubar)
-        self.menuDatei.setObjectName("menuDatei")
-        self.menuAktionen = QtWidgets.QMenu(self.menubar)
-        self.menuAktionen.setObjectName("menuAktionen")
-        self.menuAnsicht = QtWidgets.QMenu(self.menubar)
-        self.menuAnsicht.setObjectName("menuAnsicht")
-        MainWindow.setMenuBar(self.menubar)
-        self.statusbar = QtWidgets.QStatusBar(MainWindow)
-        self.statusbar.setObjectName("statusbar")
-        MainWindow.setStatusBar(self.statusbar)
-        self.toolBar = QtWidgets.QToolBar(MainWindow)
-        self.toolBar.setObjectName("toolBar")
-        MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.toolBar)
-        self.actionNeueUrlaubsliste = QtWidgets.QAction(MainWindow)
-        icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(":/icons/file-plus.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionNeueUrlaubsliste.setIcon(icon)
-        self.actionNeueUrlaubsliste.setObjectName("actionNeueUrlaubsliste")
-        self.actionBasisListenVerwalten = QtWidgets.QAction(MainWindow)
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap(":/icons/settings.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionBasisListenVerwalten.setIcon(icon1)
-        self.actionBasisListenVerwalten.setObjectName("actionBasisListenVerwalten")
-        self.actionOffnen = QtWidgets.QAction(MainWindow)
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap(":/icons/folder.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionOffnen.setIcon(icon2)
-        self.actionOffnen.setObjectName("actionOffnen")
-        self.actionBeenden = QtWidgets.QAction(MainWindow)
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap(":/icons/power.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionBeenden.setIcon(icon3)
-        self.actionBeenden.setObjectName("actionBeenden")
-        self.actionListentitelAndern = QtWidgets.QAction(MainWindow)
-        icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap(":/icons/edit-3.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionListentitelAndern.setIcon(icon4)
-        self.actionListentitelAndern.setObjectName("actionListentitelAndern")
-        self.actionAnsichtNeuLaden = QtWidgets.QAction(MainWindow)
-        icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap(":/icons/refresh-cw.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionAnsichtNeuLaden.setIcon(icon5)
-        self.actionAnsichtNeuLaden.setObjectName("actionAnsichtNeuLaden")
-        self.actionEditorOffnen = QtWidgets.QAction(MainWindow)
-        icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap(":/icons/edit.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionEditorOffnen.setIcon(icon6)
-        self.actionEditorOffnen.setObjectName("actionEditorOffnen")
-        self.actionListeSpeichern = QtWidgets.QAction(MainWindow)
-        icon7 = QtGui.QIcon()
-        icon7.addPixmap(QtGui.QPixmap(":/icons/save.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionListeSpeichern.setIcon(icon7)
-        self.actionListeSpeichern.setObjectName("actionListeSpeichern")
-        self.actionListeSpeichernUnter = QtWidgets.QAction(MainWindow)
-        self.actionListeSpeichernUnter.setIcon(icon7)
-        self.actionListeSpeichernUnter.setObjectName("actionListeSpeichernUnter")
-        self.actionVorschau = QtWidgets.QAction(MainWindow)
-        icon8 = QtGui.QIcon()
-        icon8.addPixmap(QtGui.QPixmap(":/icons/layers.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionVorschau.setIcon(icon8)
-        self.actionVorschau.setObjectName("actionVorschau")
-        self.actionDrucken = QtWidgets.QAction(MainWindow)
-        icon9 = QtGui.QIcon()
-        icon9.addPixmap(QtGui.QPixmap(":/icons/printer.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionDrucken.setIcon(icon9)
-        self.actionDrucken.setObjectName("actionDrucken")
-        self.actionUndo = QtWidgets.QAction(MainWindow)
-        icon10 = QtGui.QIcon()
-        icon10.addPixmap(QtGui.QPixmap(":/icons/undo.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionUndo.setIcon(icon10)
-        self.actionUndo.setObjectName("actionUndo")
-        self.actionRedo = QtWidgets.QAction(MainWindow)
-        icon11 = QtGui.QIcon()
-        icon11.addPixmap(QtGui.QPixmap(":/icons/redo.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.actionRedo.setIcon(icon11)
-        self.actionRedo.setObjectName("actionRedo")
-        self.actionPrintLandscape = QtWidgets.QAction(MainWindow)
-        self.actionPrintLandscape.setIcon(icon9)
-        self.actionPrintLandscape.setObjectName("actionPrintLandscape")
-        self.menuDatei.addAction(self.actionNeueUrlaubsliste)
-        self.menuDatei.addSeparator()
-        self.menuDatei.addAction(self.actionOffnen)
-        self.menuDatei.addSeparator()
-        self.menuDatei.addAction(self.actionListeSpeichern)
-        self.menuDatei.addAction(self.actionListeSpeichernUnter)
-        self.menuDatei.addSeparator()
-        self.menuDatei.addAction(self.actionBeenden)
-        self.menuAktionen.addAction(self.actionListentitelAndern)
-        self.menuAktionen.addSeparator()
-        self.menuAktionen.addAction(self.actionBasisListenVerwalten)
-        self.menuAktionen.addSeparator()
-        self.menuAktionen.addAction(self.actionEditorOffnen)
-        self.menuAktionen.addSeparator()
-        self.menuAktionen.addAction(self.actionUndo)
-        self.menuAktionen.addAction(self.actionRedo)
-        self.menuAnsicht.addAction(self.actionAnsichtNeuLaden)
-        self.menuAnsicht.addSeparator()
-        self.menuAnsicht.addAction(self.actionVorschau)
-        self.menuAnsicht.addAction(self.actionDrucken)
-        self.menuAnsicht.addAction(self.actionPrintLandscape)
-        self.menubar.addAction(self.menuDatei.menuAction())
-        self.menubar.addAction(self.menuAktionen.menuAction())
-        self.menubar.addAction(self.menuAnsicht.menuAction())
-        self.toolBar.addAction(self.actionNeueUrlaubsliste)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionOffnen)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionListeSpeichern)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionBasisListenVerwalten)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionEditorOffnen)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionUndo)
-        self.toolBar.addAction(self.actionRedo)
-        self.toolBar.addSeparator()
-        self.toolBar.addAction(self.actionVorschau)
-        self.toolBar.addAction(self.actionDrucken)
-
-        self.retranslateUi(MainWindow)
-        QtCore.QMetaObject.connectSlotsByName(MainWindow)
-
-    def retranslateUi(self, MainWindow):
-        _translate = QtCore.QCoreApplication.translate
-        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
-        self.title.setText(_translate("MainWindow", "Listentitel"))
-        self.menuDatei.setTitle(_translate("MainWindow", "Datei"))
-        self.menuAktionen.setTitle(_translate("MainWindow", "Bearbeiten"))
-        self.menuAnsicht.setTitle(_translate("MainWindow", "Ansicht"))
-        self.toolBar.setWindowTitle(_translate("MainWindow", "toolBar"))
-        self.actionNeueUrlaubsliste.setText(_translate("MainWindow", "Neu..."))
-        self.actionNeueUrlaubsliste.setToolTip(_translate("MainWindow", "Neue Urlaubsliste"))
-        self.actionNeueUrlaubsliste.setShortcut(_translate("MainWindow", "Ctrl+N"))
-        self.actionBasisListenVerwalten.setText(_translate("MainWindow", "Übergeordnete Liste verwalten..."))
-        self.actionOffnen.setText(_translate("MainWindow", "Öffnen..."))
-        self.actionOffnen.setShortcut(_translate("MainWindow", "Ctrl+O"))
-        self.actionBeenden.setText(_translate("MainWindow", "Beenden"))
-        self.actionListentitelAndern.setText(_translate("MainWindow", "Listentitel ändern..."))
-        self.actionAnsichtNeuLaden.setText(_translate("MainWindow", "Ansicht neu laden"))
-        self.actionAnsichtNeuLaden.setToolTip(_translate("MainWindow", "Lade die Ansicht neu. Nützlich, wenn Änderungen nicht angezeigt werden."))
-        self.actionEditorOffnen.setText(_translate("MainWindow", "Editor öffnen"))
-        self.actionEditorOffnen.setToolTip(_translate("MainWindow", "Öffnet den Editor"))
-        self.actionListeSpeichern.setText(_translate("MainWindow", "Speichern"))
-        self.actionListeSpeichern.setToolTip(_translate("MainWindow", "Speichern"))
-        self.actionListeSpeichern.setShortcut(_translate("MainWindow", "Ctrl+S"))
-        self.actionListeSpeichernUnter.setText(_translate("MainWindow", "Speichern unter..."))
-        self.actionListeSpeichernUnter.setToolTip(_translate("MainWindow", "Speichern unter..."))
-        self.actionListeSpeichernUnter.setShortcut(_translate("MainWindow", "Ctrl+Shift+S"))
-        self.actionVorschau.setText(_translate("MainWindow", "Vorschau"))
-        self.actionVorschau.setToolTip(_translate("MainWindow", "Vorschau anzeigen"))
-        self.actionDrucken.setText(_translate("MainWindow", "Drucken"))
-        self.actionDrucken.setToolTip(_translate("MainWindow", "Drucken"))
-        self.actionDrucken.setShortcut(_translate("MainWindow", "Ctrl+P"))
-        self.actionUndo.setText(_translate("MainWindow", "Rückgängig machen"))
-        self.actionUndo.setToolTip(_translate("MainWindow", "Letzte Aktion umkehren"))
-        self.actionUndo.setShortcut(_translate("MainWindow", "Ctrl+Z"))
-        self.actionRedo.setText(_translate("MainWindow", "Wiederherstellen"))
-        self.actionRedo.setToolTip(_translate("MainWindow", "Letzte Rückgängigmachung wiederherstellen"))
-        self.actionRedo.setShortcut(_translate("MainWindow", "Ctrl+Shift+Z"))
-        self.actionPrintLandscape.setText(_translate("MainWindow", "Querformat Drucken"))
-        self.actionPrintLandscape.setToolTip(_translate("MainWindow", "Liste im Querformat drucken (bei sehr vielen Kategorien)"))
-        self.actionPrintLandscape.setShortcut(_translate("MainWindow", "Ctrl+Shift+P"))
-import icons_rc